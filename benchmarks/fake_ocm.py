@@ -0,0 +1,538 @@
+"""
+In-process stand-in for the OCM clusters_mgmt API and the SSO token endpoint.
+
+Serves thousands of generated clusters with paging, `search`/`order`/`fields` list parameters, cluster
+state transitions over time, optional per-request latency and injected 429 responses, so the wrapper hot paths
+can be measured offline.
+
+Usage:
+    with FakeOCM(clusters=5000, latency=0.005) as fake_ocm:
+        client = OCMPythonClient(token="offline-token", endpoint=fake_ocm.sso_url, api_host=fake_ocm.url).client
+        clusters = list(Clusters(client=client).get())
+        print(fake_ocm.request_counts)
+"""
+
+import base64
+import collections
+import datetime
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+CLUSTERS_MGMT_PATH = "/api/clusters_mgmt/v1"
+SSO_PATH = "/auth/realms/redhat-external/protocol/openid-connect/token"
+ACCESS_TOKEN_LIFETIME = 15 * 60
+# Time spent in each state by a new cluster, in seconds, before it is "ready"
+DEFAULT_STATE_DURATIONS = (("validating", 0.2), ("pending", 0.2), ("installing", 1.0))
+DEFAULT_UNINSTALL_DURATION = 0.5
+DEFAULT_ADDON_ID = "fake-addon"
+SEARCH_TOKEN_RE = re.compile(
+    r"\s*(?:(?P<string>'(?:[^']|'')*')|(?P<symbol>[(),])|(?P<operator><=|>=|!=|=|<|>)|(?P<word>[^\s(),'=<>!]+))"
+)
+
+
+class FakeOCM:
+    """
+    Fake OCM API server running in a background thread.
+
+    Seeded clusters are "ready", clusters created with POST go through `state_durations` before becoming
+    "ready", deleted clusters are "uninstalling" for `uninstall_duration` before they disappear.
+    """
+
+    def __init__(
+        self,
+        clusters=1000,
+        versions=300,
+        latency=0.0,
+        throttle_every=0,
+        retry_after=0,
+        state_durations=DEFAULT_STATE_DURATIONS,
+        uninstall_duration=DEFAULT_UNINSTALL_DURATION,
+    ):
+        """
+        Args:
+            clusters (int, optional): Number of seeded "ready" clusters. Defaults to 1000.
+            versions (int, optional): Number of OpenShift versions. Defaults to 300.
+            latency (float, optional): Seconds added to every API response. Defaults to 0.0.
+            throttle_every (int, optional): Answer every Nth API request with 429, 0 to disable. Defaults to 0.
+            retry_after (int, optional): `Retry-After` header of 429 responses. Defaults to 0.
+            state_durations (tuple, optional): (state, seconds) a new cluster goes through before "ready".
+                Defaults to DEFAULT_STATE_DURATIONS.
+            uninstall_duration (float, optional): Seconds a deleted cluster stays "uninstalling".
+                Defaults to DEFAULT_UNINSTALL_DURATION.
+        """
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.state_durations = tuple(state_durations)
+        self.uninstall_duration = uninstall_duration
+        self.request_counts = collections.Counter()
+        self.clusters = {}
+        self.versions = _versions(count=versions)
+        self.addons = {DEFAULT_ADDON_ID: _addon(addon_id=DEFAULT_ADDON_ID)}
+        self._api_requests = 0
+        self._lock = threading.Lock()
+        for idx in range(clusters):
+            self.add_cluster(name=f"fake-cluster-{idx:05d}", state="ready")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(fake_ocm=self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def url(self):
+        """
+        Returns:
+            str: API URL, to pass as `api_host` of `OCMPythonClient`.
+        """
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    @property
+    def sso_url(self):
+        """
+        Returns:
+            str: SSO token URL, to pass as `endpoint` of `OCMPythonClient`.
+        """
+        return f"{self.url}{SSO_PATH}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-ocm", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_counts(self):
+        with self._lock:
+            self.request_counts.clear()
+
+    def add_cluster(self, name, state=None, **attrs):
+        """
+        Adds a cluster, going through `state_durations` from now unless `state` is set.
+
+        Returns:
+            dict: The cluster body.
+        """
+        cluster_id = uuid.uuid4().hex[:32]
+        cluster = _cluster(cluster_id=cluster_id, name=name, **attrs)
+        cluster["_created"] = 0 if state else time.monotonic()
+        cluster["_fixed_state"] = state
+        with self._lock:
+            self.clusters[cluster_id] = cluster
+        return cluster
+
+    def cluster_state(self, cluster):
+        """
+        Returns:
+            str or None: Current state of the cluster, None once an uninstalled cluster is gone.
+        """
+        now = time.monotonic()
+        if (deleted := cluster.get("_deleted")) is not None:
+            return "uninstalling" if now - deleted < self.uninstall_duration else None
+        if cluster["_fixed_state"]:
+            return cluster["_fixed_state"]
+
+        elapsed = now - cluster["_created"]
+        for state, duration in self.state_durations:
+            if elapsed < duration:
+                return state
+            elapsed -= duration
+        return "ready"
+
+    def _cluster_body(self, cluster):
+        if (state := self.cluster_state(cluster=cluster)) is None:
+            return None
+        body = {key: value for key, value in cluster.items() if not key.startswith("_")}
+        body["state"] = state
+        return body
+
+    def _live_clusters(self):
+        with self._lock:
+            clusters = list(self.clusters.values())
+        return [body for cluster in clusters if (body := self._cluster_body(cluster=cluster)) is not None]
+
+    def handle(self, method, path, query, body):
+        """
+        Routes one API request.
+
+        Returns:
+            tuple: Status code, response body (dict or None) and extra headers.
+        """
+        if path == SSO_PATH:
+            self._count(key=f"{method} {SSO_PATH}")
+            return 200, {"access_token": _access_token(), "expires_in": ACCESS_TOKEN_LIFETIME}, {}
+
+        with self._lock:
+            self._api_requests += 1
+            throttled = self.throttle_every and self._api_requests % self.throttle_every == 0
+        if self.latency:
+            time.sleep(self.latency)
+
+        route, handler, path_params = self._route(method=method, path=path)
+        self._count(key=f"{method} {route}")
+        if throttled:
+            headers = {"Retry-After": str(self.retry_after)}
+            return 429, _error(code="TOO-MANY-REQUESTS", reason="Too many requests"), headers
+        if handler is None:
+            return 404, _error(code="NOT-FOUND", reason=f"{method} {path} not found"), {}
+
+        return handler(query=query, body=body, **path_params)
+
+    def _route(self, method, path):
+        """
+        Returns:
+            tuple: Templated route, handler method (None if not found) and path parameters.
+        """
+        parts = path[len(CLUSTERS_MGMT_PATH) :].strip("/").split("/") if path.startswith(CLUSTERS_MGMT_PATH) else []
+        routes = {
+            ("GET", "clusters"): ("/clusters", self._list_clusters, {}),
+            ("POST", "clusters"): ("/clusters", self._create_cluster, {}),
+            ("GET", "clusters", "{cluster_id}"): ("/clusters/{cluster_id}", self._get_cluster, {"cluster_id"}),
+            ("DELETE", "clusters", "{cluster_id}"): ("/clusters/{cluster_id}", self._delete_cluster, {"cluster_id"}),
+            ("GET", "versions"): ("/versions", self._list_versions, {}),
+            ("GET", "addons", "{addon_id}"): ("/addons/{addon_id}", self._get_addon, {"addon_id"}),
+        }
+        for (route_method, *route_parts), (route, handler, param_names) in routes.items():
+            if route_method != method or len(route_parts) != len(parts):
+                continue
+            path_params = {}
+            for route_part, part in zip(route_parts, parts):
+                if route_part.strip("{}") in param_names:
+                    path_params[route_part.strip("{}")] = part
+                elif route_part != part:
+                    break
+            else:
+                return f"{CLUSTERS_MGMT_PATH}{route}", handler, path_params
+        return path, None, {}
+
+    def _count(self, key):
+        with self._lock:
+            self.request_counts[key] += 1
+
+    def _list_clusters(self, query, body):
+        return 200, _list_page(kind="ClusterList", items=self._live_clusters(), query=query), {}
+
+    def _get_cluster(self, query, body, cluster_id):
+        with self._lock:
+            cluster = self.clusters.get(cluster_id)
+        if cluster is None or (cluster_body := self._cluster_body(cluster=cluster)) is None:
+            return 404, _error(code="CLUSTERS-MGMT-404", reason=f"Cluster '{cluster_id}' not found"), {}
+        return 200, cluster_body, {}
+
+    def _create_cluster(self, query, body):
+        attrs = {
+            key: value
+            for key, value in (body or {}).items()
+            if key in ("product", "region", "cloud_provider", "hypershift")
+        }
+        cluster = self.add_cluster(name=(body or {}).get("name") or f"fake-cluster-{uuid.uuid4().hex[:8]}", **attrs)
+        return 201, self._cluster_body(cluster=cluster), {}
+
+    def _delete_cluster(self, query, body, cluster_id):
+        with self._lock:
+            cluster = self.clusters.get(cluster_id)
+            if cluster is not None and "_deleted" not in cluster:
+                cluster["_deleted"] = time.monotonic()
+        if cluster is None:
+            return 404, _error(code="CLUSTERS-MGMT-404", reason=f"Cluster '{cluster_id}' not found"), {}
+        return 204, None, {}
+
+    def _list_versions(self, query, body):
+        return 200, _list_page(kind="VersionList", items=self.versions, query=query), {}
+
+    def _get_addon(self, query, body, addon_id):
+        if (addon := self.addons.get(addon_id)) is None:
+            return 404, _error(code="CLUSTERS-MGMT-404", reason=f"Addon '{addon_id}' not found"), {}
+        return 200, addon, {}
+
+
+def compile_search(search):
+    """
+    Compiles an OCM search expression into a predicate on an item dict.
+
+    Supports `=`, `!=`, `<`, `<=`, `>`, `>=`, `[not] like`, `[not] ilike`, `[not] in (...)`, `and`, `or`
+    and parentheses, which covers the expressions built by `SearchQuery`.
+
+    Args:
+        search (str): OCM search expression.
+
+    Returns:
+        callable: Predicate taking an item dict.
+    """
+    tokens = [
+        (match.lastgroup, match.group(match.lastgroup)) for match in SEARCH_TOKEN_RE.finditer(search) if match.lastgroup
+    ]
+    predicate, position = _parse_or(tokens=tokens, position=0)
+    if position != len(tokens):
+        raise ValueError(f"Unexpected search token {tokens[position][1]!r} in {search!r}")
+    return predicate
+
+
+def _parse_or(tokens, position):
+    predicates = []
+    while True:
+        predicate, position = _parse_and(tokens=tokens, position=position)
+        predicates.append(predicate)
+        if position < len(tokens) and tokens[position][1].lower() == "or":
+            position += 1
+            continue
+        return (lambda item: any(_predicate(item) for _predicate in predicates)), position
+
+
+def _parse_and(tokens, position):
+    predicates = []
+    while True:
+        predicate, position = _parse_condition(tokens=tokens, position=position)
+        predicates.append(predicate)
+        if position < len(tokens) and tokens[position][1].lower() == "and":
+            position += 1
+            continue
+        return (lambda item: all(_predicate(item) for _predicate in predicates)), position
+
+
+def _parse_condition(tokens, position):
+    if tokens[position][1] == "(":
+        predicate, position = _parse_or(tokens=tokens, position=position + 1)
+        return predicate, position + 1
+
+    keys = tokens[position][1].split(".")
+    position += 1
+    negate = tokens[position][1].lower() == "not"
+    if negate:
+        position += 1
+    operator = tokens[position][1].lower()
+    position += 1
+
+    if operator == "in":
+        values = set()
+        position += 1
+        while tokens[position][1] != ")":
+            if tokens[position][1] != ",":
+                values.add(_literal(token=tokens[position]))
+            position += 1
+        return (lambda item: (_search_value(item=item, keys=keys) in values) != negate), position + 1
+
+    value = _literal(token=tokens[position])
+    position += 1
+    if operator in ("like", "ilike"):
+        flags = re.IGNORECASE if operator == "ilike" else 0
+        pattern = re.compile("^" + ".*".join(re.escape(part) for part in value.split("%")) + "$", flags)
+        return (lambda item: bool(pattern.match(_search_value(item=item, keys=keys) or "")) != negate), position
+
+    compare = {
+        "=": lambda left: left == value,
+        "!=": lambda left: left != value,
+        "<": lambda left: left is not None and left < value,
+        "<=": lambda left: left is not None and left <= value,
+        ">": lambda left: left is not None and left > value,
+        ">=": lambda left: left is not None and left >= value,
+    }[operator]
+    return (lambda item: compare(_search_value(item=item, keys=keys))), position
+
+
+def _literal(token):
+    kind, text = token
+    if kind == "string":
+        return text[1:-1].replace("''", "'")
+    return text
+
+
+def _search_value(item, keys):
+    for key in keys:
+        if not isinstance(item, dict):
+            return None
+        item = item.get(key)
+    if isinstance(item, bool):
+        return "t" if item else "f"
+    return None if item is None else str(item)
+
+
+def _list_page(kind, items, query):
+    if search := query.get("search"):
+        predicate = compile_search(search=search)
+        items = [item for item in items if predicate(item)]
+    if order := query.get("order"):
+        for order_field in reversed(order.split(",")):
+            field, _, direction = order_field.strip().partition(" ")
+            items = sorted(items, key=_order_key(keys=field.split(".")), reverse=direction.lower() == "desc")
+    if fields := query.get("fields"):
+        selected = {field.split(".")[0] for field in fields.split(",")} | {"kind", "id", "href"}
+        items = [{key: value for key, value in item.items() if key in selected} for item in items]
+
+    page = int(query.get("page") or 1)
+    size = int(query.get("size") or 100)
+    page_items = items[(page - 1) * size : page * size]
+    return {"kind": kind, "page": page, "size": len(page_items), "total": len(items), "items": page_items}
+
+
+def _order_key(keys):
+    return lambda item: _search_value(item=item, keys=keys) or ""
+
+
+def _cluster(cluster_id, name, **attrs):
+    now = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    cluster = {
+        "kind": "Cluster",
+        "id": cluster_id,
+        "href": f"{CLUSTERS_MGMT_PATH}/clusters/{cluster_id}",
+        "name": name,
+        "external_id": str(uuid.UUID(cluster_id)),
+        "display_name": name,
+        "creation_timestamp": now.isoformat().replace("+00:00", "Z"),
+        "expiration_timestamp": (now + datetime.timedelta(days=2)).isoformat().replace("+00:00", "Z"),
+        "cloud_provider": {
+            "kind": "CloudProviderLink",
+            "id": "aws",
+            "href": f"{CLUSTERS_MGMT_PATH}/cloud_providers/aws",
+        },
+        "region": {
+            "kind": "CloudRegionLink",
+            "id": "us-east-1",
+            "href": f"{CLUSTERS_MGMT_PATH}/cloud_providers/aws/regions/us-east-1",
+        },
+        "product": {"kind": "ProductLink", "id": "osd", "href": f"{CLUSTERS_MGMT_PATH}/products/osd"},
+        "version": {
+            "kind": "Version",
+            "id": "openshift-v4.15.1",
+            "raw_id": "4.15.1",
+            "channel_group": "stable",
+        },
+        "openshift_version": "4.15.1",
+        "multi_az": False,
+        "managed": True,
+        "ccs": {"enabled": False},
+        "hypershift": {"enabled": False},
+        "api": {"url": f"https://api.{name}.fake.example.com:6443", "listening": "external"},
+        "console": {"url": f"https://console-openshift-console.apps.{name}.fake.example.com"},
+        "dns": {"base_domain": "fake.example.com"},
+        "nodes": {"compute": 3, "compute_machine_type": {"id": "m5.xlarge"}, "master": 3, "infra": 2},
+        "network": {
+            "type": "OVNKubernetes",
+            "machine_cidr": "10.0.0.0/16",
+            "service_cidr": "172.30.0.0/16",
+            "pod_cidr": "10.128.0.0/14",
+            "host_prefix": 23,
+        },
+        "properties": {"fake_ocm": "true"},
+    }
+    cluster.update(attrs)
+    return cluster
+
+
+def _versions(count):
+    versions = []
+    channel_groups = ("stable", "candidate", "fast", "nightly")
+    for idx in range(count):
+        minor, patch = divmod(idx, 50)
+        channel_group = channel_groups[idx % len(channel_groups)]
+        raw_id = f"4.{10 + minor}.{patch}"
+        version_id = f"openshift-v{raw_id}" + ("" if channel_group == "stable" else f"-{channel_group}")
+        versions.append({
+            "kind": "Version",
+            "id": version_id,
+            "href": f"{CLUSTERS_MGMT_PATH}/versions/{version_id}",
+            "raw_id": raw_id,
+            "channel_group": channel_group,
+            "enabled": True,
+            "default": False,
+            "rosa_enabled": True,
+            "hosted_control_plane_enabled": True,
+            "end_of_life_timestamp": "2030-01-01T00:00:00Z",
+        })
+    return versions
+
+
+def _addon(addon_id):
+    return {
+        "kind": "AddOn",
+        "id": addon_id,
+        "href": f"{CLUSTERS_MGMT_PATH}/addons/{addon_id}",
+        "name": addon_id,
+        "enabled": True,
+        "version": {"kind": "AddOnVersion", "id": "1.0.0"},
+        "requirements": [
+            {"id": "aws-only", "resource": "cluster", "data": {"cloud_provider.id": "aws"}, "enabled": True}
+        ],
+        "parameters": {
+            "kind": "AddOnParameterList",
+            "items": [
+                {"id": "notification-email", "value_type": "string", "required": True, "default_value": "a@b.c"},
+                {
+                    "id": "aws-size",
+                    "value_type": "number",
+                    "required": True,
+                    "default_value": "1",
+                    "conditions": [{"resource": "cluster", "data": {"cloud_provider.id": "aws"}}],
+                },
+                {
+                    "id": "gcp-size",
+                    "value_type": "number",
+                    "required": True,
+                    "conditions": [{"resource": "cluster", "data": {"cloud_provider.id": ["gcp"]}}],
+                },
+                {
+                    "id": "multi-az-replicas",
+                    "value_type": "number",
+                    "required": False,
+                    "conditions": [
+                        {"resource": "cluster", "data": {"multi_az": True, "region.id": ["us-east-1", "us-west-2"]}}
+                    ],
+                },
+            ],
+        },
+    }
+
+
+def _access_token():
+    # Unsigned JWT, the client only reads its `exp` claim
+    payload = json.dumps({"exp": int(time.time()) + ACCESS_TOKEN_LIFETIME, "sub": "fake-ocm"})
+    return f"e30.{base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')}.fake"
+
+
+def _error(code, reason):
+    return {"kind": "Error", "id": code.rsplit("-", 1)[-1], "code": code, "reason": reason}
+
+
+def _handler(fake_ocm):
+    class _FakeOCMHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately, without this keep-alive responses wait for delayed ACKs
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def _dispatch(self):
+            url = urlparse(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+            body = None
+            if raw_body and self.headers.get("Content-Type", "").startswith("application/json"):
+                body = json.loads(raw_body)
+
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            status, response_body, headers = fake_ocm.handle(method=self.command, path=url.path, query=query, body=body)
+            data = json.dumps(response_body).encode() if response_body is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
+
+    return _FakeOCMHandler
@@ -0,0 +1,259 @@
+"""
+Benchmarks of the wrapper hot paths against the in-process fake OCM server (see fake_ocm.py).
+
+Each benchmark runs once as warm-up, then `--iterations` times, and reports throughput, p50/p99 latency, OCM
+requests per operation (counted by the fake server) and the peak traced memory of one extra operation.
+
+Usage:
+    python -m benchmarks.hot_paths --clusters 5000 --latency 0.005
+    python -m benchmarks.hot_paths --only clusters_get cluster_instance --json results.json
+"""
+
+import argparse
+import concurrent.futures
+import json
+import math
+import statistics
+import sys
+import time
+import tracemalloc
+
+from benchmarks.fake_ocm import DEFAULT_ADDON_ID, FakeOCM
+from ocm_python_wrapper.addon_conditions import AddOnConditions
+from ocm_python_wrapper.cluster import Cluster, ClusterAddOn, Clusters
+from ocm_python_wrapper.fleet_poller import FleetPoller
+from ocm_python_wrapper.ocm_client import OCMPythonClient
+from ocm_python_wrapper.polling import PollingStrategy
+from ocm_python_wrapper.versions import VersionCatalog, Versions
+
+LIST_PAGE_SIZE = 500
+FLEET_SIZE = 20
+# Fake clusters go through these states in about a second, polled closely enough to see every state
+READY_STATE_DURATIONS = (("validating", 0.1), ("pending", 0.1), ("installing", 0.5))
+READY_POLLING = PollingStrategy(initial_sleep=0.05, max_sleep=0.2)
+READY_WAIT_TIMEOUT = 60
+
+
+def clusters_get(client, fake_ocm):
+    def _run():
+        return len(list(Clusters(client=client).get(page_size=LIST_PAGE_SIZE)))
+
+    return _run
+
+
+def clusters_summaries(client, fake_ocm):
+    def _run():
+        return len(list(Clusters(client=client).summaries(page_size=LIST_PAGE_SIZE)))
+
+    return _run
+
+
+def cluster_instance(client, fake_ocm):
+    cluster = Cluster(client=client, name="fake-cluster-00000")
+
+    def _run():
+        cluster.get_instance(max_age=0)
+        return 1
+
+    return _run
+
+
+def versions_get(client, fake_ocm):
+    def _run():
+        return sum(len(versions) for versions in Versions(client=client).get().values())
+
+    return _run
+
+
+def version_catalog_latest(client, fake_ocm):
+    catalog = VersionCatalog(client=client)
+
+    def _run():
+        catalog.latest(minor_version="4.12")
+        return 1
+
+    return _run
+
+
+def wait_for_cluster_ready(client, fake_ocm):
+    def _run():
+        cluster_name = f"bench-ready-{time.monotonic_ns()}"
+        fake_ocm.add_cluster(name=cluster_name)
+        Cluster(client=client, name=cluster_name).wait_for_cluster_ready(
+            wait_timeout=READY_WAIT_TIMEOUT, wait_for_osd_job=False, polling_strategy=READY_POLLING
+        )
+        return 1
+
+    return _run
+
+
+def wait_for_fleet_ready(client, fake_ocm):
+    def _run():
+        cluster_names = [f"bench-fleet-{time.monotonic_ns()}-{idx}" for idx in range(FLEET_SIZE)]
+        cluster_ids = [fake_ocm.add_cluster(name=cluster_name)["id"] for cluster_name in cluster_names]
+        poller = FleetPoller(client=client, interval=READY_POLLING.max_sleep)
+        with poller, concurrent.futures.ThreadPoolExecutor(max_workers=FLEET_SIZE) as executor:
+            futures = [
+                executor.submit(
+                    Cluster(client=client, name=cluster_name, cluster_id=cluster_id).wait_for_cluster_ready,
+                    wait_timeout=READY_WAIT_TIMEOUT,
+                    wait_for_osd_job=False,
+                    poller=poller,
+                )
+                for cluster_name, cluster_id in zip(cluster_names, cluster_ids)
+            ]
+            for future in futures:
+                future.result()
+        return FLEET_SIZE
+
+    return _run
+
+
+def addon_parameters(client, fake_ocm):
+    cluster_addon = ClusterAddOn(client=client, cluster_name="fake-cluster-00000", addon_name=DEFAULT_ADDON_ID)
+
+    def _run():
+        cluster_addon.validate_and_update_addon_parameters(user_parameters=[{"id": "aws-size", "value": "3"}])
+        return 1
+
+    return _run
+
+
+def addon_conditions_many(client, fake_ocm):
+    conditions = AddOnConditions(addon_info=client.api_clusters_mgmt_v1_addons_addon_id_get(DEFAULT_ADDON_ID).to_dict())
+    cluster_dicts = list(
+        client.api_client.iter_raw_items(list_func_name="api_clusters_mgmt_v1_clusters_get", page_size=LIST_PAGE_SIZE)
+    )
+
+    def _run():
+        return len(conditions.evaluate_many(cluster_dicts=cluster_dicts))
+
+    return _run
+
+
+BENCHMARKS = {
+    "clusters_get": clusters_get,
+    "clusters_summaries": clusters_summaries,
+    "cluster_instance": cluster_instance,
+    "versions_get": versions_get,
+    "version_catalog_latest": version_catalog_latest,
+    "wait_for_cluster_ready": wait_for_cluster_ready,
+    "wait_for_fleet_ready": wait_for_fleet_ready,
+    "addon_parameters": addon_parameters,
+    "addon_conditions_many": addon_conditions_many,
+}
+# Benchmarks waiting for fake cluster state transitions, run fewer times
+SLOW_BENCHMARKS = ("wait_for_cluster_ready", "wait_for_fleet_ready")
+SLOW_BENCHMARK_MAX_ITERATIONS = 3
+
+
+def percentile(values, pct):
+    """
+    Returns:
+        float: Nearest-rank percentile of `values`.
+    """
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def run_benchmark(name, run, fake_ocm, iterations):
+    """
+    Args:
+        name (str): Benchmark name.
+        run (callable): One benchmarked operation, returns the number of items it processed.
+        fake_ocm (FakeOCM): Fake OCM server, counting the requests.
+        iterations (int): Number of timed operations.
+
+    Returns:
+        dict: Benchmark results.
+    """
+    run()
+    fake_ocm.reset_counts()
+    durations = []
+    items = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        items += run()
+        durations.append(time.perf_counter() - start)
+    request_counts = dict(fake_ocm.request_counts)
+
+    tracemalloc.start()
+    try:
+        run()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    total = sum(durations)
+    return {
+        "name": name,
+        "iterations": iterations,
+        "items_per_second": items / total if total else 0.0,
+        "p50_ms": statistics.median(durations) * 1000,
+        "p99_ms": percentile(values=durations, pct=99) * 1000,
+        "requests_per_op": sum(request_counts.values()) / iterations,
+        "requests": request_counts,
+        "peak_memory_mb": peak_memory / 1024 / 1024,
+    }
+
+
+def print_results(results):
+    print(f"{'benchmark':<24}{'iter':>6}{'items/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'req/op':>9}{'peak MB':>9}")
+    for result in results:
+        print(
+            f"{result['name']:<24}{result['iterations']:>6}{result['items_per_second']:>12.1f}"
+            f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['requests_per_op']:>9.1f}"
+            f"{result['peak_memory_mb']:>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clusters", type=int, default=2000, help="Number of clusters served by the fake OCM")
+    parser.add_argument("--versions", type=int, default=300, help="Number of versions served by the fake OCM")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every fake OCM response")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every Nth request with 429")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed operations per benchmark")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = []
+    with FakeOCM(
+        clusters=args.clusters,
+        versions=args.versions,
+        latency=args.latency,
+        throttle_every=args.throttle_every,
+        state_durations=READY_STATE_DURATIONS,
+    ) as fake_ocm:
+        ocm_client = OCMPythonClient(
+            token="offline-token",
+            endpoint=fake_ocm.sso_url,
+            api_host=fake_ocm.url,
+            discard_unknown_keys=True,
+        )
+        try:
+            for name in args.only or BENCHMARKS:
+                iterations = args.iterations
+                if name in SLOW_BENCHMARKS:
+                    iterations = min(iterations, SLOW_BENCHMARK_MAX_ITERATIONS)
+                results.append(
+                    run_benchmark(
+                        name=name,
+                        run=BENCHMARKS[name](client=ocm_client.client, fake_ocm=fake_ocm),
+                        fake_ocm=fake_ocm,
+                        iterations=iterations,
+                    )
+                )
+        finally:
+            ocm_client.close()
+
+    print_results(results=results)
+    if args.json:
+        with open(args.json, "w") as fd:
+            json.dump(results, fd, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Cold start benchmark of `import ocm_python_wrapper.cluster`.
+
+Imports the module in fresh interpreters, prints the median import time and fails if it exceeds
+`--max-seconds` or if a heavy dependency (Kubernetes, AWS, ROSA CLI stacks) is loaded at import time.
+
+Usage:
+    python benchmarks/import_time.py --runs 5 --max-seconds 0.5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MODULE = "ocm_python_wrapper.cluster"
+LAZY_MODULES = (
+    "benedict",
+    "clouds",
+    "kubernetes",
+    "ocp_resources",
+    "ocp_utilities",
+    "rosa",
+)
+IMPORT_SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+import {MODULE}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import():
+    """
+    Returns:
+        dict: Import time in seconds and the modules loaded, from a fresh interpreter.
+    """
+    output = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreter imports")
+    parser.add_argument("--max-seconds", type=float, default=0.5, help="Maximum median import time")
+    args = parser.parse_args()
+
+    results = [measure_import() for _ in range(args.runs)]
+    median = statistics.median(result["elapsed"] for result in results)
+    eager_modules = sorted({
+        module.split(".")[0] for module in results[0]["modules"] if module.split(".")[0] in LAZY_MODULES
+    })
+
+    print(f"import {MODULE}: median {median * 1000:.0f} ms over {args.runs} runs")
+    failed = False
+    if eager_modules:
+        print(f"FAIL: heavy modules loaded at import time: {eager_modules}")
+        failed = True
+    if median > args.max_seconds:
+        print(f"FAIL: median import time above {args.max_seconds * 1000:.0f} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import threading
+
+from ocm_python_wrapper.snapshot import TTLSnapshot
+
+DEFAULT_ADDON_CATALOG_TTL = 5 * 60
+_ADDON_CATALOG_ATTRIBUTE = "_ocm_addon_catalog"
+_ADDON_CATALOGS_LOCK = threading.Lock()
+
+
+class AddOnCatalog:
+    """
+    TTL cache of addon definitions (`cluster_mgmt_v1_addons_addon_id`), keyed by addon id.
+
+    Addon definitions rarely change, so all `ClusterAddOn` objects of an OCM client share one catalog
+    (see `get_addon_catalog`) and fetch each addon at most once per `ttl`.
+    Returned dicts are shared between callers and must not be modified.
+
+    Example:
+        catalog = get_addon_catalog(client=client)
+        addon_version = catalog.get(addon_id="ocm-addon-test-operator")["version"]["id"]
+    """
+
+    def __init__(self, client, ttl=DEFAULT_ADDON_CATALOG_TTL):
+        """
+        Args:
+            client (DefaultApi): OCM client.
+            ttl (int or float, optional): Seconds an addon definition is served before it is fetched again.
+                Defaults to DEFAULT_ADDON_CATALOG_TTL.
+        """
+        self.client = client
+        self.ttl = ttl
+        self._addons = {}
+        self._lock = threading.Lock()
+
+    def get(self, addon_id, max_age=None):
+        """
+        Args:
+            addon_id (str): Addon id.
+            max_age (int or float, optional): Maximum accepted age in seconds, 0 to force a fetch.
+                Defaults to None (use `ttl`).
+
+        Returns:
+            dict: Addon definition.
+        """
+        return self._snapshot(addon_id=addon_id).get(max_age=max_age)
+
+    def invalidate(self, addon_id=None):
+        """
+        Drops an addon definition, or all of them if `addon_id` is not set.
+        """
+        with self._lock:
+            snapshots = [self._addons[addon_id]] if addon_id in self._addons else []
+            if addon_id is None:
+                snapshots = list(self._addons.values())
+
+        for snapshot in snapshots:
+            snapshot.invalidate()
+
+    def _snapshot(self, addon_id):
+        with self._lock:
+            if (snapshot := self._addons.get(addon_id)) is None:
+                snapshot = self._addons[addon_id] = TTLSnapshot(
+                    fetch_func=lambda: self.client.api_clusters_mgmt_v1_addons_addon_id_get(addon_id).to_dict(),
+                    ttl=self.ttl,
+                )
+            return snapshot
+
+
+def get_addon_catalog(client):
+    """
+    Returns the `AddOnCatalog` shared by all users of an OCM API client, creating it on first use.
+
+    The catalog is stored on the API client, so both are released together.
+
+    Args:
+        client (DefaultApi): OCM client.
+
+    Returns:
+        AddOnCatalog: The addon catalog.
+    """
+    with _ADDON_CATALOGS_LOCK:
+        if (catalog := getattr(client.api_client, _ADDON_CATALOG_ATTRIBUTE, None)) is None:
+            catalog = AddOnCatalog(client=client)
+            setattr(client.api_client, _ADDON_CATALOG_ATTRIBUTE, catalog)
+        return catalog
@@ -0,0 +1,145 @@
+def compile_conditions(conditions_dict):
+    """
+    Compiles addon cluster conditions into a predicate on a cluster dict.
+
+    Each condition key is a dotted keypath into the cluster dict (e.g. "cloud_provider.id"), split once here
+    instead of on every evaluation. A condition matches if the cluster value equals the condition value,
+    or is one of its items when the condition value is a list. A missing keypath resolves to None.
+
+    Args:
+        conditions_dict (dict): Condition keypaths and values, from an addon parameter or requirement.
+
+    Returns:
+        callable: Predicate taking a cluster dict, True if all conditions match.
+    """
+    checks = [(tuple(keypath.split(".")), value) for keypath, value in conditions_dict.items()]
+
+    def _matches(cluster_dict):
+        for keys, condition_value in checks:
+            cluster_value = _get_keypath(data=cluster_dict, keys=keys)
+            if not (
+                isinstance(condition_value, list)
+                and cluster_value in condition_value
+                or cluster_value == condition_value
+            ):
+                return False
+        return True
+
+    return _matches
+
+
+class AddOnConditions:
+    """
+    Addon requirements and parameter conditions, compiled once and evaluated against many clusters.
+
+    Example:
+        conditions = AddOnConditions(addon_info=cluster_addon.addon_info())
+        # {cluster_id: {param_id: param_dict, ...} or None if the addon requirements are not met}
+        eligible = conditions.evaluate_many(cluster_dicts=ocm_client.iter_raw_items(
+            list_func_name="api_clusters_mgmt_v1_clusters_get", page_size=500
+        ))
+    """
+
+    def __init__(self, addon_info):
+        """
+        Args:
+            addon_info (dict): Addon definition, see `ClusterAddOn.addon_info`.
+        """
+        self.requirements = [
+            compile_conditions(conditions_dict=requirement.get("data") or {})
+            for requirement in addon_info.get("requirements") or []
+            if requirement.get("resource") == "cluster" and requirement.get("enabled", True)
+        ]
+        self.parameters = compile_parameters(addon_parameters=addon_info.get("parameters") or {})
+
+    @property
+    def needs_cluster(self):
+        """
+        Returns:
+            bool: True if any requirement or parameter depends on the cluster.
+        """
+        return bool(self.requirements) or any(predicate for _, _, predicate in self.parameters)
+
+    def is_eligible(self, cluster_dict):
+        """
+        Returns:
+            bool: True if the cluster meets all the addon cluster requirements.
+        """
+        return all(requirement(cluster_dict) for requirement in self.requirements)
+
+    def evaluate(self, cluster_dict):
+        """
+        Returns:
+            dict: Parameters applying to the cluster, see `ClusterAddOn.get_addon_parameters_dict`.
+        """
+        return evaluate_parameters(parameters=self.parameters, cluster_dict=cluster_dict)
+
+    def evaluate_many(self, cluster_dicts):
+        """
+        Args:
+            cluster_dicts (iterable): Cluster dicts, e.g. raw clusters list items.
+
+        Returns:
+            dict: Applying parameters per cluster id, None for clusters not meeting the addon requirements.
+        """
+        return {
+            cluster_dict["id"]: self.evaluate(cluster_dict=cluster_dict) if self.is_eligible(cluster_dict) else None
+            for cluster_dict in cluster_dicts
+        }
+
+
+def compile_parameters(addon_parameters):
+    """
+    Args:
+        addon_parameters (dict): Addon parameters, the "parameters" of an addon definition.
+
+    Returns:
+        list: (parameter id, parameter dict, conditions predicate or None) per parameter.
+    """
+    compiled_parameters = []
+    for param in addon_parameters.get("items") or []:
+        param_conditions = [
+            condition["data"] for condition in param.get("conditions", []) if condition["resource"] == "cluster"
+        ]
+        compiled_parameters.append((
+            param["id"],
+            addon_parameter_dict(param=param),
+            compile_conditions(conditions_dict=param_conditions[0]) if param_conditions else None,
+        ))
+    return compiled_parameters
+
+
+def evaluate_parameters(parameters, cluster_dict):
+    """
+    Args:
+        parameters (list): Compiled parameters, see `compile_parameters`.
+        cluster_dict (dict): Cluster dict, only read if a parameter has cluster conditions.
+
+    Returns:
+        dict: Parameter dict per id, for the parameters without conditions or whose conditions match.
+    """
+    return {
+        param_id: dict(param_dict)
+        for param_id, param_dict, predicate in parameters
+        if predicate is None or predicate(cluster_dict)
+    }
+
+
+def addon_parameter_dict(param):
+    """
+    Returns:
+        dict: Parameter 'required' flag, 'value_type' and 'default_value'.
+    """
+    return {
+        "required": param.get("required"),
+        "value_type": int if param["value_type"] == "number" else str,
+        "default_value": param.get("default_value"),
+    }
+
+
+def _get_keypath(data, keys):
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
@@ -0,0 +1,192 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+
+from ocm_python_wrapper.polling import DEFAULT_POLLING
+
+DEFAULT_ASYNC_MAX_WORKERS = 32
+_ASYNC_CLIENT_ATTRIBUTE = "_ocm_async_client"
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+
+
+class AsyncOCMPythonClient:
+    """
+    asyncio interface of the OCM API client.
+
+    Every `DefaultApi` function (e.g. `api_clusters_mgmt_v1_clusters_get`) is exposed as a coroutine function.
+    The generated OCM client is synchronous, so the HTTP calls run on a bounded thread pool shared by all
+    coroutines, while waiting between calls is done with `asyncio.sleep` and holds no thread. One event loop can
+    therefore watch hundreds of clusters with `max_workers` threads.
+
+    Example:
+        async_client = AsyncOCMPythonClient(client=OCMPythonClient(...).client)
+        cluster = await async_client.api_clusters_mgmt_v1_clusters_cluster_id_get(cluster_id=cluster_id)
+    """
+
+    def __init__(self, client, max_workers=DEFAULT_ASYNC_MAX_WORKERS):
+        """
+        Args:
+            client (DefaultApi): OCM client.
+            max_workers (int, optional): Maximum number of API calls running at the same time.
+                Defaults to DEFAULT_ASYNC_MAX_WORKERS.
+        """
+        self.client = client
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocm-async")
+
+    def __getattr__(self, name):
+        if name.startswith("api_"):
+            return functools.partial(self.run, getattr(self.client, name))
+        raise AttributeError(f"{type(self).__name__} has no attribute {name}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Runs a blocking function on the client thread pool.
+
+        Args:
+            func (callable): Blocking function, e.g. an OCM API function or a `Cluster` method.
+            *args: Positional arguments passed to `func`.
+            **kwargs: Keyword arguments passed to `func`.
+
+        Returns:
+            object: The function result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    def close(self):
+        """
+        Shuts down the client thread pool.
+        """
+        self.executor.shutdown(wait=False)
+
+
+class AsyncTimeoutSampler:
+    """
+    asyncio counterpart of `timeout_sampler.TimeoutSampler`.
+
+    Awaits `func` and yields its result, until `wait_timeout` expires. Sleeps `sleep` seconds between samples,
+    or follows `polling_strategy` when `sleep` is not set.
+    Exceptions raised by `func` are handled as in `TimeoutSampler`: the ones matching `exceptions_dict` are
+    ignored until the timeout, any other one raises `TimeoutExpiredError` with the exception as `last_exp`.
+
+    Example:
+        async for sample in AsyncTimeoutSampler(wait_timeout=60, func=cluster.async_get_exists):
+            if sample:
+                break
+    """
+
+    def __init__(
+        self,
+        wait_timeout,
+        func,
+        sleep=None,
+        polling_strategy=None,
+        state_func=None,
+        exceptions_dict=None,
+        **func_kwargs,
+    ):
+        """
+        Args:
+            wait_timeout (int): Timeout in seconds.
+            func (callable): Coroutine function to sample.
+            sleep (int, optional): Fixed seconds to sleep between samples. Defaults to None.
+            polling_strategy (PollingStrategy, optional): Backoff configuration, used when `sleep` is not set.
+                Defaults to DEFAULT_POLLING.
+            state_func (callable, optional): Called with each sample, returns the state used for phase-aware
+                backoff. Defaults to None.
+            exceptions_dict (dict, optional): Exception classes to ignore, each mapped to a list of filters
+                (strings found in the exception message, or callables returning True for ignored exceptions),
+                an empty list ignores every instance. Defaults to None ({Exception: []}, ignore all).
+            **func_kwargs: Keyword arguments passed to `func`.
+        """
+        self.wait_timeout = wait_timeout
+        self.func = func
+        self.sleep = sleep
+        self.polling_strategy = polling_strategy or DEFAULT_POLLING
+        self.state_func = state_func
+        self.exceptions_dict = exceptions_dict if exceptions_dict is not None else {Exception: []}
+        self.func_kwargs = func_kwargs
+
+    async def __aiter__(self):
+        time_watcher = TimeoutWatch(timeout=self.wait_timeout)
+        backoff = self.polling_strategy.backoff()
+        last_exp = None
+        while True:
+            state = None
+            try:
+                sample = await self.func(**self.func_kwargs)
+            except Exception as ex:
+                if not self._should_ignore_exception(exp=ex):
+                    raise TimeoutExpiredError(value=self._timeout_message(), last_exp=ex) from ex
+                last_exp = ex
+            else:
+                yield sample
+                if self.state_func:
+                    state = self.state_func(sample)
+
+            remaining_time = time_watcher.remaining_time()
+            if remaining_time <= 0:
+                raise TimeoutExpiredError(value=self._timeout_message(), last_exp=last_exp)
+
+            sleep = backoff.next_sleep(state=state) if self.sleep is None else self.sleep
+            await asyncio.sleep(min(sleep, remaining_time))
+
+    def _timeout_message(self):
+        return f"{self.wait_timeout} seconds waiting for {getattr(self.func, '__name__', self.func)}"
+
+    def _should_ignore_exception(self, exp):
+        for exception_class, exception_filters in self.exceptions_dict.items():
+            if isinstance(exp, exception_class) and (
+                not exception_filters
+                or any(
+                    exception_filter(exp) if callable(exception_filter) else exception_filter in str(exp)
+                    for exception_filter in exception_filters
+                )
+            ):
+                return True
+        return False
+
+
+def get_async_client(client):
+    """
+    Returns the `AsyncOCMPythonClient` of an OCM client, creating it on first use.
+
+    All `Cluster` objects built on the same API client (e.g. every `OCMPythonClient.client`) share its async
+    client and thread pool. The async client is stored on the API client, so both are released together, and
+    `OCMPythonClient.close` shuts its thread pool down.
+
+    Args:
+        client (DefaultApi): OCM client.
+
+    Returns:
+        AsyncOCMPythonClient: The async client.
+    """
+    with _ASYNC_CLIENTS_LOCK:
+        if (async_client := getattr(client.api_client, _ASYNC_CLIENT_ATTRIBUTE, None)) is None:
+            async_client = AsyncOCMPythonClient(client=client)
+            setattr(client.api_client, _ASYNC_CLIENT_ATTRIBUTE, async_client)
+        return async_client
+
+
+def close_async_client(api_client):
+    """
+    Shuts down the thread pool of the `AsyncOCMPythonClient` of an API client, if it has one.
+
+    Args:
+        api_client (ApiClient): API client of the OCM client.
+    """
+    with _ASYNC_CLIENTS_LOCK:
+        async_client = getattr(api_client, _ASYNC_CLIENT_ATTRIBUTE, None)
+        setattr(api_client, _ASYNC_CLIENT_ATTRIBUTE, None)
+
+    if async_client:
+        async_client.close()
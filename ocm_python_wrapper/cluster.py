@@ -1,12 +1,14 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import copy
 import functools
 import inspect
 import os
+import time
 from importlib.util import find_spec
 
-import rosa.cli as rosa_cli
 import yaml
-from benedict import benedict
-from clouds.aws.roles.roles import create_or_update_role_policy
 from ocm_python_client import ApiException
 from ocm_python_client.exceptions import NotFoundException
 from ocm_python_client.model.add_on import AddOn
@@ -15,17 +17,28 @@ from ocm_python_client.model.add_on_installation_parameter import (
     AddOnInstallationParameter,
 )
 from ocm_python_client.model.upgrade_policy import UpgradePolicy
-from ocp_resources.image_content_source_policy import ImageContentSourcePolicy
-from ocp_resources.job import Job
-from ocp_resources.resource import ResourceEditor
-from ocp_resources.rhmi import RHMI
-from ocp_resources.utils.constants import NOT_FOUND_ERROR_EXCEPTION_DICT
-from ocp_utilities.infra import create_update_secret, get_client
-from ocp_utilities.must_gather import collect_must_gather
 from simple_logger.logger import get_logger
-from timeout_sampler import TimeoutExpiredError, TimeoutSampler, TimeoutWatch
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
 
+from ocm_python_wrapper.addon_catalog import get_addon_catalog
+from ocm_python_wrapper.addon_conditions import compile_conditions, compile_parameters, evaluate_parameters
+from ocm_python_wrapper.async_client import AsyncTimeoutSampler, get_async_client
 from ocm_python_wrapper.exceptions import MissingResourceError
+from ocm_python_wrapper.fleet_poller import FleetPoller
+from ocm_python_wrapper.ocp_client_cache import OCP_CLIENT_CACHE
+from ocm_python_wrapper.paging import DEFAULT_MAX_IN_FLIGHT, DEFAULT_PAGE_SIZE, iter_items
+from ocm_python_wrapper.polling import (
+    ADDON_STATE_POLLING,
+    CLUSTER_EXISTS_POLLING,
+    CLUSTER_STATE_POLLING,
+    CLUSTER_VERSION_POLLING,
+    DEFAULT_POLLING,
+    BackoffTimeoutSampler,
+)
+from ocm_python_wrapper.profiler import profiled
+from ocm_python_wrapper.search import SearchQuery
+from ocm_python_wrapper.snapshot import DEFAULT_SNAPSHOT_TTL, TTLSnapshot
+from ocm_python_wrapper.timings import ClusterTimings
 
 LOGGER = get_logger(name=__name__)
 TIMEOUT_5MIN = 5 * 60
@@ -36,40 +49,587 @@ TIMEOUT_60MIN = 60 * 60
 SLEEP_1SEC = 1
 AWS_OSD_STR = "aws"
 GCP_OSD_STR = "gcp"
+CLUSTER_STATUS_STR = "Status of cluster {name} is {current_status}"
+DEFAULT_BULK_MAX_WORKERS = 10
+CLUSTERS_API_PATH = "/api/clusters_mgmt/v1/clusters"
+
+
+def cluster_state(instance):
+    """
+    Returns:
+        str or None: Cluster state, used for phase-aware polling.
+    """
+    return str(instance.state) if instance else None
+
+
+def addon_state(addon_installation):
+    """
+    Returns:
+        str or None: Addon installation state, used for phase-aware polling.
+    """
+    return str(addon_installation.get("state")) if addon_installation else None
+
+
+def _list_kwargs(search=None, query=None):
+    if query:
+        return query.to_kwargs()
+    return {"search": search} if search else {}
+
+
+def _submit_bulk_operation(executor, func, result, action):
+    """
+    Runs `func(result)` on `executor`, recording the exception it raises as the error of the cluster result.
+
+    The worker runs in a copy of the caller context, keeping `ocm_profile` operation names.
+
+    Returns:
+        concurrent.futures.Future: Resolved with None once `func` returned or failed.
+    """
+
+    def _run():
+        try:
+            func(result)  # noqa: FCN001
+        except Exception as ex:  # noqa: BLE001 - reported in the cluster result
+            LOGGER.error(f"Failed to {action} cluster {result.name}: {ex}")
+            result.error = ex
+
+    return executor.submit(contextvars.copy_context().run, _run)
+
+
+class ClusterOperationResult:
+    """
+    Outcome of one cluster in a bulk operation, see `Clusters.provision_many`.
+    """
+
+    def __init__(self, name, cluster=None, error=None, timings=None):
+        """
+        Args:
+            name (str): Cluster name.
+            cluster (Cluster, optional): Cluster object. Defaults to None.
+            error (Exception, optional): Error that stopped the operation on this cluster. Defaults to None.
+            timings (dict, optional): Seconds spent per operation phase. Defaults to None.
+        """
+        self.name = name
+        self.cluster = cluster
+        self.error = error
+        self.timings = timings or {}
+
+    def __repr__(self):
+        outcome = f"failed: {self.error}" if self.error else "succeeded"
+        return f"{type(self).__name__}({self.name} {outcome} in {self.elapsed:.1f}s)"
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+    @property
+    def elapsed(self):
+        return sum(self.timings.values())
+
+
+class ClusterSummary:
+    """
+    Compact, read-only cluster record built from a clusters list item.
+
+    Holds only the commonly used cluster fields, a small fraction of the memory of a full cluster body,
+    for listing thousands of clusters. Use `to_cluster` to get a full `Cluster` when needed.
+    """
+
+    __slots__ = (
+        "cloud_provider",
+        "expiration_timestamp",
+        "hypershift",
+        "id",
+        "name",
+        "region",
+        "rosa",
+        "state",
+        "version",
+    )
+
+    def __init__(
+        self,
+        id,
+        name,
+        state=None,
+        version=None,
+        cloud_provider=None,
+        region=None,
+        hypershift=False,
+        rosa=False,
+        expiration_timestamp=None,
+    ):
+        self.id = id
+        self.name = name
+        self.state = state
+        self.version = version
+        self.cloud_provider = cloud_provider
+        self.region = region
+        self.hypershift = hypershift
+        self.rosa = rosa
+        self.expiration_timestamp = expiration_timestamp
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.id}, name={self.name}, state={self.state}, version={self.version})"
+
+    @classmethod
+    def from_item(cls, item):
+        """
+        Args:
+            item (dict or Cluster): Clusters list item, a raw dict or an OCM model object.
+
+        Returns:
+            ClusterSummary: The cluster summary.
+        """
+        state = item.get("state")
+        expiration_timestamp = item.get("expiration_timestamp")
+        return cls(
+            id=item.get("id"),
+            name=item.get("name"),
+            state=str(state) if state is not None else None,
+            version=(item.get("version") or {}).get("raw_id"),
+            cloud_provider=(item.get("cloud_provider") or {}).get("id"),
+            region=(item.get("region") or {}).get("id"),
+            hypershift=(item.get("hypershift") or {}).get("enabled") is True,
+            rosa=((item.get(AWS_OSD_STR) or {}).get("tags") or {}).get("red-hat-clustertype") == "rosa",
+            # Raw items hold the RFC 3339 string, OCM model objects a datetime
+            expiration_timestamp=getattr(expiration_timestamp, "isoformat", lambda: expiration_timestamp)(),
+        )
+
+    def to_cluster(self, client):
+        """
+        Args:
+            client (DefaultApi): OCM client.
+
+        Returns:
+            Cluster: Cluster object, its body is fetched on first use.
+        """
+        return Cluster(client=client, name=self.name, cluster_id=self.id)
 
 
 class Clusters:
     def __init__(self, client):
         self.client = client
 
-    def get(self):
-        clusters_list = self.client.api_clusters_mgmt_v1_clusters_get()
-        for cluster in clusters_list.items:
-            yield Cluster(client=self.client, name=cluster.name)
+    @staticmethod
+    def query():
+        """
+        Returns:
+            SearchQuery: New clusters query, to pass to `get` or `summaries`.
+
+        Example:
+            query = Clusters.query().where(field="state", value="ready").where(field="region.id", value="us-east-1")
+            ready_clusters = list(Clusters(client=client).summaries(query=query))
+        """
+        return SearchQuery()
+
+    @profiled()
+    def get(self, page_size=DEFAULT_PAGE_SIZE, max_in_flight=DEFAULT_MAX_IN_FLIGHT, search=None, query=None):
+        """
+        Streams all clusters, walking every page of the clusters list.
+
+        Next pages are fetched in the background while the current page is consumed.
+
+        Args:
+            page_size (int, optional): Number of clusters to request per page. Defaults to DEFAULT_PAGE_SIZE.
+            max_in_flight (int, optional): Maximum number of pages fetched ahead. Defaults to DEFAULT_MAX_IN_FLIGHT.
+            search (str, optional): OCM search string to filter clusters. Defaults to None.
+            query (SearchQuery, optional): Search and order criteria, overrides `search`. Field selection is
+                ignored, full cluster bodies are needed. Defaults to None.
+
+        Yields:
+            Cluster: Cluster object for each cluster.
+        """
+        list_kwargs = _list_kwargs(search=search, query=query)
+        for cluster in iter_items(
+            list_func=self.client.api_clusters_mgmt_v1_clusters_get,
+            page_size=page_size,
+            max_in_flight=max_in_flight,
+            **list_kwargs,
+        ):
+            yield Cluster(client=self.client, name=cluster.name, cluster_id=cluster.id, instance=cluster)
+
+    @profiled()
+    def summaries(self, page_size=DEFAULT_PAGE_SIZE, max_in_flight=DEFAULT_MAX_IN_FLIGHT, search=None, query=None):
+        """
+        Streams a compact summary of all clusters, see `ClusterSummary`.
+
+        List pages are decoded as raw JSON, no OCM model object is built.
+
+        Args:
+            page_size (int, optional): Number of clusters to request per page. Defaults to DEFAULT_PAGE_SIZE.
+            max_in_flight (int, optional): Maximum number of pages fetched ahead. Defaults to DEFAULT_MAX_IN_FLIGHT.
+            search (str, optional): OCM search string to filter clusters. Defaults to None.
+            query (SearchQuery, optional): Search, order and field selection, overrides `search`.
+                Fields not selected are None in the summaries. Defaults to None.
+
+        Yields:
+            ClusterSummary: Summary of each cluster.
+        """
+        for cluster in iter_items(
+            list_func=self._clusters_list_func(fields=query.fields if query else None),
+            page_size=page_size,
+            max_in_flight=max_in_flight,
+            raw=True,
+            **_list_kwargs(search=search, query=query),
+        ):
+            yield ClusterSummary.from_item(item=cluster)
+
+    def _clusters_list_func(self, fields=None):
+        """
+        Returns the clusters list function, selecting `fields` on the server if set.
+
+        The generated client has no `fields` argument, so the selection is sent through its API client and
+        the function only supports raw (`_preload_content=False`) responses.
+        """
+        if not fields:
+            return self.client.api_clusters_mgmt_v1_clusters_get
+
+        fields = ",".join(dict.fromkeys(["id", "name", *fields]))
+
+        def _list_clusters(_preload_content=False, **kwargs):
+            return self.client.api_client.call_api(
+                resource_path=CLUSTERS_API_PATH,
+                method="GET",
+                query_params=[*kwargs.items(), ("fields", fields)],
+                header_params={"Accept": "application/json"},
+                auth_settings=["bearer"],
+                _return_http_data_only=True,
+                _preload_content=False,
+            )
+
+        return _list_clusters
+
+    @profiled()
+    def provision_many(
+        self,
+        specs,
+        wait_for_ready=True,
+        wait_timeout=TIMEOUT_60MIN,
+        max_workers=DEFAULT_BULK_MAX_WORKERS,
+        poller=None,
+    ):
+        """
+        Provisions many clusters in parallel and waits for all of them together.
+
+        Up to `max_workers` threads post the cluster definitions and, once a cluster is ready, wait for its
+        osd-cluster-ready job. Waiting for the clusters to exist and to be ready is done by a single `FleetPoller`,
+        with one clusters list query per poll however many clusters are provisioned, and holds no thread.
+        A failing cluster does not stop the others, its error is reported in its result.
+
+        Args:
+            specs (list): `provision_osd` arguments per cluster, each with a "name" key. `wait_for_ready`,
+                `wait_timeout`, `poller` and `timings` are set by this call.
+                Example: [{"name": "cluster-1", "region": "us-east-1", "ocp_version": "4.15.1", "platform": "aws", ...}]
+            wait_for_ready (bool, optional): Wait for the clusters to be ready, else only to exist. Defaults to True.
+            wait_timeout (int, optional): Timeout in seconds for all clusters, from the start of the call.
+                Defaults to TIMEOUT_60MIN.
+            max_workers (int, optional): Maximum number of threads, posting clusters or waiting for their
+                osd-cluster-ready job. Defaults to DEFAULT_BULK_MAX_WORKERS.
+            poller (FleetPoller, optional): Shared poller, a poller is started for this call if not set.
+                Defaults to None.
+
+        Returns:
+            dict: `ClusterOperationResult` per cluster name. Its timings are the phase durations of the cluster
+                `ClusterTimings` ("post", "exists", then "ready" and "osd_cluster_ready_job" if `wait_for_ready`).
+        """
+        time_watcher = TimeoutWatch(timeout=wait_timeout)
+        own_poller = poller is None
+        poller = poller or FleetPoller(client=self.client)
+        specs = {spec["name"]: spec for spec in specs}
+        results = [ClusterOperationResult(name=name) for name in specs]
+
+        def _provision(result):
+            result.cluster = Cluster(client=self.client, name=result.name)
+            result.cluster.provision_osd(
+                **{key: value for key, value in specs[result.name].items() if key != "name"},
+                wait_timeout=time_watcher.remaining_time(),
+                poller=poller,
+            )
+            if wait_for_ready:
+                timings = result.cluster.timings
+                phase = timings.start_phase(name="ready")
+                ready_watches[result.cluster.watch_ready(poller=poller, timings=timings)] = (result, phase)
+
+        ready_watches = {}
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="ocm-provision"
+            ) as executor:
+                for future in [
+                    _submit_bulk_operation(executor=executor, func=_provision, result=result, action="provision")
+                    for result in results
+                ]:
+                    future.result()
+
+                self._wait_for_ready(
+                    ready_watches=ready_watches, wait_timeout=time_watcher.remaining_time(), executor=executor
+                )
+        finally:
+            if own_poller:
+                poller.stop()
+
+        for result in results:
+            if result.cluster and result.cluster.timings:
+                result.timings = result.cluster.timings.phase_durations()
+
+        LOGGER.info(
+            f"Provisioned {sum(result.succeeded for result in results)}/{len(results)} clusters "
+            f"in {wait_timeout - time_watcher.remaining_time():.0f} seconds."
+        )
+        return {result.name: result for result in results}
+
+    def _wait_for_ready(self, ready_watches, wait_timeout, executor):
+        """
+        Waits for the clusters to be ready, then for their osd-cluster-ready job on `executor`.
+
+        Args:
+            ready_watches (dict): `Cluster.watch_ready` future of each cluster, mapped to its
+                `ClusterOperationResult` and "ready" phase.
+        """
+        time_watcher = TimeoutWatch(timeout=wait_timeout)
+        ready_futures = dict(ready_watches)
+
+        def _wait_for_osd_job(result):
+            with result.cluster.timings.phase(name="osd_cluster_ready_job"):
+                result.cluster.wait_for_osd_cluster_ready_job(wait_timeout=time_watcher.remaining_time())
+
+        job_futures = []
+        try:
+            for future in concurrent.futures.as_completed(ready_futures, timeout=wait_timeout):
+                result, phase = ready_futures.pop(future)
+                try:
+                    future.result()
+                except Exception as ex:  # noqa: BLE001 - reported in the cluster result
+                    LOGGER.error(f"Failed waiting for cluster {result.name} to be ready: {ex}")
+                    result.error = ex
+                    result.cluster.timings.end_phase(phase=phase, error=ex)
+                    continue
+
+                result.cluster.timings.end_phase(phase=phase)
+                if not result.cluster.hypershift:
+                    job_futures.append(
+                        _submit_bulk_operation(
+                            executor=executor, func=_wait_for_osd_job, result=result, action="wait for"
+                        )
+                    )
+        except concurrent.futures.TimeoutError:
+            for future, (result, phase) in ready_futures.items():
+                future.cancel()
+                LOGGER.error(f"Timeout waiting for cluster {result.name} to be ready")
+                result.error = TimeoutExpiredError(f"{wait_timeout} seconds waiting for cluster {result.name}")
+                result.cluster.timings.end_phase(phase=phase, error=result.error)
+
+        for future in job_futures:
+            future.result()
+
+    @profiled()
+    def delete_many(
+        self,
+        names_or_ids,
+        deprovision=True,
+        wait=True,
+        wait_timeout=TIMEOUT_60MIN,
+        max_workers=DEFAULT_BULK_MAX_WORKERS,
+        poller=None,
+    ):
+        """
+        Deletes many clusters in parallel and tracks their deletion together.
+
+        Clusters are looked up with one clusters list query, up to `max_workers` DELETE requests are sent at the
+        same time, then all deletions are tracked by a single `FleetPoller`. The call takes about as long as the
+        slowest deprovision. A failing cluster does not stop the others, its error is reported in its result.
+
+        Args:
+            names_or_ids (list): Cluster names or ids.
+            deprovision (bool, optional): Deprovision the cluster infrastructure. Defaults to True.
+            wait (bool, optional): Wait for the clusters to be deleted. Defaults to True.
+            wait_timeout (int, optional): Timeout in seconds for all clusters, from the start of the call.
+                Defaults to TIMEOUT_60MIN.
+            max_workers (int, optional): Maximum number of DELETE requests sent at the same time.
+                Defaults to DEFAULT_BULK_MAX_WORKERS.
+            poller (FleetPoller, optional): Shared poller, a poller is started for this call if not set.
+                Defaults to None.
+
+        Returns:
+            dict: `ClusterOperationResult` per name or id, with "delete" and "deletion" timings.
+        """
+        time_watcher = TimeoutWatch(timeout=wait_timeout)
+        results = {name_or_id: ClusterOperationResult(name=name_or_id) for name_or_id in names_or_ids}
+        clusters = self._get_by_names_or_ids(names_or_ids=names_or_ids)
+        for name_or_id, result in results.items():
+            result.cluster = clusters.get(name_or_id)
+            if result.cluster is None:
+                result.error = MissingResourceError(name=name_or_id, kind="cluster")
+
+        def _delete(result):
+            start = time.monotonic()
+            try:
+                result.cluster.delete(wait=False, deprovision=deprovision)
+            finally:
+                result.timings["delete"] = time.monotonic() - start
+
+        to_delete = [result for result in results.values() if result.succeeded]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ocm-delete"
+        ) as executor:
+            for future in [
+                _submit_bulk_operation(executor=executor, func=_delete, result=result, action="delete")
+                for result in to_delete
+            ]:
+                future.result()
+
+        if wait:
+            self._wait_for_deletions(
+                results=[result for result in to_delete if result.succeeded],
+                wait_timeout=time_watcher.remaining_time(),
+                poller=poller,
+            )
+
+        LOGGER.info(
+            f"Deleted {sum(result.succeeded for result in results.values())}/{len(results)} clusters "
+            f"in {wait_timeout - time_watcher.remaining_time():.0f} seconds."
+        )
+        return results
+
+    def _get_by_names_or_ids(self, names_or_ids):
+        """
+        Returns:
+            dict: `Cluster` per name or id, for the clusters that exist.
+        """
+        clusters = {}
+        for idx in range(0, len(names_or_ids), DEFAULT_PAGE_SIZE):
+            batch = names_or_ids[idx : idx + DEFAULT_PAGE_SIZE]
+            query = SearchQuery().any_of(
+                SearchQuery().in_(field="name", values=batch), SearchQuery().in_(field="id", values=batch)
+            )
+            for cluster in self.get(query=query):
+                clusters[cluster.name] = clusters[cluster.cluster_id] = cluster
+        return clusters
+
+    def _wait_for_deletions(self, results, wait_timeout, poller):
+        own_poller = poller is None
+        poller = poller or FleetPoller(client=self.client)
+        start = time.monotonic()
+
+        def _set_deletion_time(result):
+            def _callback(future):
+                # Cancelled (timeout) and failed waits did not see the deletion complete
+                if not future.cancelled() and future.exception() is None:
+                    result.timings["deletion"] = time.monotonic() - start
+
+            return _callback
+
+        futures = {}
+        try:
+            for result in results:
+                future = poller.wait_for_deletion(cluster_id=result.cluster.cluster_id)
+                future.add_done_callback(_set_deletion_time(result=result))
+                futures[future] = result
+
+            done, not_done = concurrent.futures.wait(futures, timeout=wait_timeout)
+        finally:
+            if own_poller:
+                poller.stop()
+
+        for future in done:
+            result = futures[future]
+            if future.cancelled():
+                error = concurrent.futures.CancelledError(f"Waiting for cluster {result.name} deletion was cancelled")
+            else:
+                error = future.exception()
+            if error is not None:
+                LOGGER.error(f"Failed waiting for cluster {result.name} to be deleted: {error}")
+                result.error = error
+
+        for future in not_done:
+            future.cancel()
+            result = futures[future]
+            LOGGER.error(f"Timeout waiting for cluster {result.name} to be deleted")
+            result.error = TimeoutExpiredError(f"{wait_timeout} seconds waiting for cluster {result.name} deletion")
 
 
 class Cluster:
-    def __init__(self, client, name):
+    def __init__(
+        self,
+        client,
+        name,
+        cluster_id=None,
+        instance=None,
+        snapshot_ttl=DEFAULT_SNAPSHOT_TTL,
+        ocp_client_cache=None,
+    ):
+        """
+        Args:
+            client (DefaultApi): OCM client.
+            name (str): Cluster name.
+            cluster_id (str, optional): Cluster id, when already known (e.g. from a clusters list response).
+                Skips the cluster id lookup by name. Defaults to None.
+            instance (Cluster, optional): Cluster body, when already known (e.g. from a clusters list response).
+                Pre-fills the cluster snapshot. Defaults to None.
+            snapshot_ttl (int or float, optional): Seconds the cluster body is served from the snapshot
+                before it is fetched again. Defaults to DEFAULT_SNAPSHOT_TTL.
+            ocp_client_cache (OCPClientCache, optional): Cache of the cluster kubeconfig and OpenShift client.
+                Defaults to OCP_CLIENT_CACHE, shared by all clusters.
+        """
         self.client = client
         self.name = name
-        try:
-            self.cluster_id = self._cluster_id()
-        except MissingResourceError:
-            self.cluster_id = None
+        # Phase and state timeline of the last `provision_osd` or `wait_for_cluster_ready` call
+        self.timings = None
+        self.ocp_client_cache = ocp_client_cache or OCP_CLIENT_CACHE
+        self.snapshot = TTLSnapshot(fetch_func=self._fetch_instance, ttl=snapshot_ttl)
+        if instance is not None:
+            self.snapshot.set(value=instance)
+
+        if cluster_id:
+            self.cluster_id = cluster_id
+        else:
+            try:
+                self.cluster_id = self._cluster_id()
+            except MissingResourceError:
+                self.cluster_id = None
 
     def _cluster_id(self):
-        cluster_list = self.client.api_clusters_mgmt_v1_clusters_get(search=f"name like '{self.name}'").items
+        cluster_list = self.client.api_clusters_mgmt_v1_clusters_get(
+            search=SearchQuery().like(field="name", pattern=self.name).search
+        ).items
         if cluster_list:
             return cluster_list[0].id
         raise MissingResourceError(name=self.name, kind="cluster")
 
-    @property
-    def instance(self):
+    def _fetch_instance(self):
         if not self.cluster_id:
             self.cluster_id = self._cluster_id()
 
         return self.client.api_clusters_mgmt_v1_clusters_cluster_id_get(cluster_id=self.cluster_id)
 
+    @property
+    def instance(self):
+        return self.get_instance()
+
+    @profiled()
+    def get_instance(self, max_age=None):
+        """
+        Returns the cluster body from the cluster snapshot.
+
+        Args:
+            max_age (int or float, optional): Maximum accepted snapshot age in seconds, overrides the snapshot TTL.
+                Use 0 to always fetch. Defaults to None (use the snapshot TTL).
+
+        Returns:
+            Cluster: OCM cluster body.
+        """
+        return self.snapshot.get(max_age=max_age)
+
+    def refresh(self):
+        """
+        Fetches the cluster body and updates the cluster snapshot.
+
+        Returns:
+            Cluster: OCM cluster body.
+        """
+        return self.snapshot.refresh()
+
     # Cluster credentials
     @property
     def credentials(self):
@@ -85,15 +645,19 @@ class Cluster:
 
     @property
     def ocp_client(self):
-        return get_client(config_dict=self.kubeconfig)
+        """
+        Returns:
+            DynamicClient: OpenShift client of the cluster, built once and served from `ocp_client_cache`.
+        """
+        return self.ocp_client_cache.get(cluster=self)
 
     # Cluster version
-    def wait_for_ocm_cluster_version(self, ocp_target_version):
+    def wait_for_ocm_cluster_version(self, ocp_target_version, polling_strategy=CLUSTER_VERSION_POLLING):
         LOGGER.info(f"Wait for cluster {self.name} version to be {ocp_target_version} in OCM.")
-        samples = TimeoutSampler(
+        samples = BackoffTimeoutSampler(
             wait_timeout=TIMEOUT_10MIN,
-            sleep=10,
-            func=lambda: self.instance.version.raw_id == ocp_target_version,
+            polling_strategy=polling_strategy,
+            func=lambda: self.get_instance(max_age=0).version.raw_id == ocp_target_version,
         )
         try:
             for sample in samples:
@@ -146,11 +710,13 @@ class Cluster:
         assert upgrade_policy, f"Could not find a policy of {upgrade_type} type"
         return upgrade_policy[0]
 
-    def wait_for_updated_upgrade_policy(self, ocp_target_version, wait_timeout=TIMEOUT_10MIN):
+    def wait_for_updated_upgrade_policy(
+        self, ocp_target_version, wait_timeout=TIMEOUT_10MIN, polling_strategy=DEFAULT_POLLING
+    ):
         LOGGER.info(f"Wait for cluster {self.name} upgrade policy to be updated with {ocp_target_version} version.")
-        samples = TimeoutSampler(
+        samples = BackoffTimeoutSampler(
             wait_timeout=wait_timeout,
-            sleep=1,
+            polling_strategy=polling_strategy,
             func=lambda: self.upgrade_policies,
         )
         try:
@@ -162,26 +728,39 @@ class Cluster:
             LOGGER.error("Upgrade policy was not updated")
             raise
 
-    @functools.cached_property
+    @property
     def hypershift(self):
         return self.instance.hypershift.enabled is True
 
-    def delete(self, wait=True, timeout=1800, deprovision=True):
+    @profiled()
+    def delete(self, wait=True, timeout=1800, deprovision=True, poller=None):
         if not self.cluster_id:
             raise MissingResourceError(kind="Cluster", name=self.name)
 
         LOGGER.info(f"Delete cluster {self.name}.")
         self.client.api_clusters_mgmt_v1_clusters_cluster_id_delete(cluster_id=self.cluster_id, deprovision=deprovision)
+        self.snapshot.invalidate()
+        self.ocp_client_cache.invalidate(cluster_id=self.cluster_id)
         if wait:
-            self.wait_for_cluster_deletion(wait_timeout=timeout)
+            self.wait_for_cluster_deletion(wait_timeout=timeout, poller=poller)
 
-    def wait_for_cluster_deletion(self, wait_timeout=TIMEOUT_30MIN):
+    @profiled()
+    def wait_for_cluster_deletion(
+        self, wait_timeout=TIMEOUT_30MIN, poller=None, polling_strategy=CLUSTER_STATE_POLLING
+    ):
         LOGGER.info(f"Wait for cluster {self.name} to be deleted.")
         try:
-            for sample in TimeoutSampler(
+            if poller and self.cluster_id:
+                self._wait_with_poller(
+                    poller=poller, predicate=lambda instance: instance is None, wait_timeout=wait_timeout
+                )
+                return
+
+            for sample in BackoffTimeoutSampler(
                 wait_timeout=wait_timeout,
-                sleep=SLEEP_1SEC,
-                func=lambda: self.exists,
+                polling_strategy=polling_strategy,
+                state_func=cluster_state,
+                func=lambda: self.get_exists(max_age=0),
             ):
                 if not sample:
                     return
@@ -189,75 +768,230 @@ class Cluster:
             LOGGER.error(f"Timeout waiting for cluster {self.name} to be deleted")
             raise
 
-    def wait_for_cluster_ready(self, wait_timeout=TIMEOUT_30MIN, stop_status=None, wait_for_osd_job=True):
+    @profiled()
+    def wait_for_cluster_ready(
+        self,
+        wait_timeout=TIMEOUT_30MIN,
+        stop_status=None,
+        wait_for_osd_job=True,
+        poller=None,
+        polling_strategy=CLUSTER_STATE_POLLING,
+        timings=None,
+    ):
+        """
+        Wait for the cluster to be ready.
+
+        The "exists", "ready" and "osd_cluster_ready_job" phases and the OCM states seen while waiting are recorded
+        in `self.timings`, see `ClusterTimings`.
+
+        Args:
+            wait_timeout (int, optional): Timeout in seconds. Defaults to TIMEOUT_30MIN.
+            stop_status (str, optional): Cluster state at which to stop waiting. Defaults to "error".
+            wait_for_osd_job (bool, optional): Also wait for the osd-cluster-ready job. Defaults to True.
+            poller (FleetPoller, optional): Shared poller watching this cluster together with others,
+                instead of polling this cluster on its own. Defaults to None.
+            polling_strategy (PollingStrategy, optional): Backoff between cluster state samples, when not using
+                a poller. Defaults to CLUSTER_STATE_POLLING (fast after a state change, slow while installing).
+            timings (ClusterTimings, optional): Timings to add the phases to, e.g. those of `provision_osd`.
+                Defaults to None (new timings).
+
+        Returns:
+            Cluster: The cluster object.
+        """
         stop_status = stop_status or "error"
         time_watcher = TimeoutWatch(timeout=wait_timeout)
+        self.timings = timings = timings or ClusterTimings(cluster_name=self.name)
 
         try:
             LOGGER.info(f"Wait for cluster {self.name} to be exists.")
-            self.wait_exists(wait_timeout=wait_timeout)
+            with timings.phase(name="exists"):
+                self.wait_exists(wait_timeout=wait_timeout, poller=poller)
         except TimeoutExpiredError:
             LOGGER.error(f"Timeout waiting for cluster {self.name} to be exists")
             raise
 
-        cluster_status_str = "Status of cluster {name} is {current_status}"
         try:
             LOGGER.info(f"Wait for cluster {self.name} to be ready.")
-            cluster_status = None
-            for sample in TimeoutSampler(
-                wait_timeout=time_watcher.remaining_time(),
-                sleep=SLEEP_1SEC,
-                func=lambda: self.instance,
-            ):
-                if sample:
-                    current_status = str(sample.state)
-                    if current_status == "ready":
-                        break
-                    elif current_status != cluster_status:
-                        cluster_status = current_status
-                        LOGGER.info(cluster_status_str.format(name=self.name, current_status=current_status))
-                    elif current_status == stop_status:
-                        raise TimeoutExpiredError(
-                            cluster_status_str.format(name=self.name, current_status=current_status)
-                        )
+            with timings.phase(name="ready"):
+                if poller:
+                    self._wait_with_poller(
+                        poller=poller,
+                        predicate=self._cluster_ready_predicate(stop_status=stop_status, timings=timings),
+                        wait_timeout=time_watcher.remaining_time(),
+                    )
+                else:
+                    self._wait_for_cluster_ready_state(
+                        wait_timeout=time_watcher.remaining_time(),
+                        stop_status=stop_status,
+                        polling_strategy=polling_strategy,
+                        timings=timings,
+                    )
 
         except TimeoutExpiredError:
             LOGGER.error(f"Timeout waiting for cluster {self.name} to be ready")
             raise
 
         if wait_for_osd_job and not self.hypershift:
-            self.wait_for_osd_cluster_ready_job(wait_timeout=time_watcher.remaining_time())
+            with timings.phase(name="osd_cluster_ready_job"):
+                self.wait_for_osd_cluster_ready_job(wait_timeout=time_watcher.remaining_time())
 
         return self
 
+    def _wait_for_cluster_ready_state(self, wait_timeout, stop_status, polling_strategy, timings=None):
+        cluster_status = None
+        for sample in BackoffTimeoutSampler(
+            wait_timeout=wait_timeout,
+            polling_strategy=polling_strategy,
+            state_func=cluster_state,
+            func=lambda: self.get_instance(max_age=0),
+        ):
+            if sample:
+                cluster_status = self._check_cluster_state(
+                    instance=sample, cluster_status=cluster_status, stop_status=stop_status, timings=timings
+                )
+                if cluster_status == "ready":
+                    return
+
+    def _check_cluster_state(self, instance, cluster_status, stop_status, timings=None):
+        """
+        Logs cluster state changes, records them in `timings` and fails on `stop_status`.
+
+        Returns:
+            str: The current cluster state.
+
+        Raises:
+            TimeoutExpiredError: If the cluster state is `stop_status`.
+        """
+        current_status = str(instance.state)
+        if timings:
+            timings.observe_state(state=current_status)
+        if current_status == "ready":
+            return current_status
+        elif current_status != cluster_status:
+            LOGGER.info(CLUSTER_STATUS_STR.format(name=self.name, current_status=current_status))
+        elif current_status == stop_status:
+            raise TimeoutExpiredError(CLUSTER_STATUS_STR.format(name=self.name, current_status=current_status))
+        return current_status
+
     @property
     def exists(self):
         """
         Returns cluster instance if cluster exists else returns None
         """
+        return self.get_exists()
+
+    def get_exists(self, max_age=None):
+        """
+        Returns cluster instance if cluster exists else returns None
+
+        Args:
+            max_age (int or float, optional): Maximum accepted snapshot age in seconds. Defaults to None.
+        """
         try:
-            return self.instance
+            return self.get_instance(max_age=max_age)
         except (NotFoundException, MissingResourceError):
+            self.snapshot.invalidate()
             return None
 
-    def wait_exists(self, wait_timeout):
-        for sample in TimeoutSampler(
+    @profiled()
+    def wait_exists(self, wait_timeout, poller=None, polling_strategy=CLUSTER_EXISTS_POLLING):
+        if poller and self.cluster_id:
+            return self._wait_with_poller(
+                poller=poller, predicate=lambda instance: instance is not None, wait_timeout=wait_timeout
+            )
+
+        for sample in BackoffTimeoutSampler(
             wait_timeout=wait_timeout,
-            sleep=1,
-            func=lambda: self.exists,
+            polling_strategy=polling_strategy,
+            func=lambda: self.get_exists(max_age=0),
         ):
             if sample:
                 return sample
 
+    def _wait_with_poller(self, poller, predicate, wait_timeout):
+        """
+        Waits for `predicate` to be True on the cluster body, as reported by a shared `FleetPoller`.
+
+        Raises:
+            TimeoutExpiredError: If `predicate` is not met within `wait_timeout`.
+        """
+        future = poller.wait_for(cluster_id=self.cluster_id, predicate=self._poller_predicate(predicate=predicate))
+        try:
+            return future.result(timeout=wait_timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutExpiredError(f"{wait_timeout} seconds waiting for cluster {self.name}")
+
+    async def _async_wait_with_poller(self, poller, predicate, wait_timeout):
+        future = poller.wait_for(cluster_id=self.cluster_id, predicate=self._poller_predicate(predicate=predicate))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=wait_timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutExpiredError(f"{wait_timeout} seconds waiting for cluster {self.name}")
+
+    def watch_ready(self, poller, stop_status=None, timings=None):
+        """
+        Watches the cluster with a shared poller until it is ready, without holding a thread.
+
+        Args:
+            poller (FleetPoller): Shared poller.
+            stop_status (str, optional): Cluster state failing the wait. Defaults to "error".
+            timings (ClusterTimings, optional): Timings to record the OCM states in. Defaults to None.
+
+        Returns:
+            concurrent.futures.Future: Resolved with the cluster body once ready, failed with
+                `TimeoutExpiredError` on `stop_status`. Cancel it to stop watching.
+        """
+        return poller.wait_for(
+            cluster_id=self.cluster_id,
+            predicate=self._poller_predicate(
+                predicate=self._cluster_ready_predicate(stop_status=stop_status or "error", timings=timings)
+            ),
+        )
+
+    def _poller_predicate(self, predicate):
+        # Keep the cluster snapshot up to date with what the poller sees
+        def _predicate(instance):
+            if instance is None:
+                self.snapshot.invalidate()
+            else:
+                self.snapshot.set(value=instance)
+            return predicate(instance)
+
+        return _predicate
+
+    def _cluster_ready_predicate(self, stop_status, timings=None):
+        cluster_status = None
+
+        def _is_ready(instance):
+            nonlocal cluster_status
+            if instance is None:
+                return False
+
+            current_status = str(instance.state)
+            if timings:
+                timings.observe_state(state=current_status)
+            if current_status == "ready":
+                return True
+            elif current_status != cluster_status:
+                cluster_status = current_status
+                LOGGER.info(CLUSTER_STATUS_STR.format(name=self.name, current_status=current_status))
+            if current_status == stop_status:
+                raise TimeoutExpiredError(CLUSTER_STATUS_STR.format(name=self.name, current_status=current_status))
+            return False
+
+        return _is_ready
+
     @property
     def cloud_provider(self):
-        return self.instance.cloud_provider.id if self.exists else None
+        instance = self.exists
+        return instance.cloud_provider.id if instance else None
 
-    @functools.cached_property
+    @property
     def rosa(self):
         return self.instance.get(AWS_OSD_STR, {}).get("tags", {}).get("red-hat-clustertype") == "rosa"
 
-    @functools.cached_property
+    @property
     def region(self):
         return self.instance.get("region", {}).get("id")
 
@@ -337,6 +1071,7 @@ class Cluster:
 
         return _cluster_dict
 
+    @profiled()
     def provision_osd(
         self,
         region=None,
@@ -354,10 +1089,15 @@ class Cluster:
         wait_timeout=TIMEOUT_30MIN,
         platform=None,
         gcp_service_account=None,
+        poller=None,
+        timings=None,
     ):
         """
         Provisions an OSD AWS cluster.
 
+        The "post" phase, then the "exists" phase or, if `wait_for_ready`, the `wait_for_cluster_ready` phases
+        and states (starting with "exists") are recorded in `self.timings`, see `ClusterTimings`.
+
         Args:
             region (str, optional): The region where the cluster will be deployed. Defaults to None.
             ocp_version (str, optional): The OpenShift version for the cluster. Defaults to None.
@@ -376,6 +1116,10 @@ class Cluster:
                 Defaults to TIMEOUT_30MIN.
             platform (str): Target cluster platform. Supported: "aws" and "gpc"
             gcp_service_account (dict, optional): GCP service account dict. Defaults to None.
+            poller (FleetPoller, optional): Shared poller watching this cluster together with others.
+                Defaults to None.
+            timings (ClusterTimings, optional): Timings to record the phases in, e.g. with a tracing span hook.
+                Defaults to None (new timings).
 
         Returns:
             object: The cluster object.
@@ -383,27 +1127,10 @@ class Cluster:
         Raises:
             ValueError: If any required attributes are missing.
         """
-        if cluster_dict:
-            _cluster_dict = cluster_dict
-        else:
-            frame = inspect.currentframe()
-            frame_values = inspect.getargvalues(frame)[3]
-            required_attributes = ["region", "ocp_version"]
-            if platform == AWS_OSD_STR:
-                required_attributes.extend([
-                    "aws_access_key_id",
-                    "aws_account_id",
-                    "aws_secret_access_key",
-                ])
-
-            elif platform == GCP_OSD_STR:
-                required_attributes.append("gcp_service_account")
-            missing_attributes = [attr_name for attr_name in required_attributes if not frame_values.get(attr_name)]
-
-            if missing_attributes:
-                raise ValueError(f"Missing attributes: {missing_attributes}")
-
-            _cluster_dict = self.osd_dict(
+        time_watcher = TimeoutWatch(timeout=wait_timeout)
+        self.timings = timings = timings or ClusterTimings(cluster_name=self.name)
+        with timings.phase(name="post"):
+            self.post(
                 region=region,
                 ocp_version=ocp_version,
                 aws_access_key_id=aws_access_key_id,
@@ -414,31 +1141,340 @@ class Cluster:
                 multi_az=multi_az,
                 channel_group=channel_group,
                 expiration_time=expiration_time,
+                cluster_dict=cluster_dict,
                 platform=platform,
                 gcp_service_account=gcp_service_account,
             )
-
-        self.client.api_clusters_mgmt_v1_clusters_post(cluster=_cluster_dict)
-        time_watcher = TimeoutWatch(timeout=wait_timeout)
-        self.wait_exists(wait_timeout=wait_timeout)
-
+        # `wait_for_cluster_ready` starts with the "exists" phase
         if wait_for_ready:
-            self.wait_for_cluster_ready(wait_timeout=time_watcher.remaining_time())
+            self.wait_for_cluster_ready(wait_timeout=time_watcher.remaining_time(), poller=poller, timings=timings)
+        else:
+            with timings.phase(name="exists"):
+                self.wait_exists(wait_timeout=time_watcher.remaining_time(), poller=poller)
 
         return self
 
-    def wait_for_osd_cluster_ready_job(self, wait_timeout=TIMEOUT_60MIN):
-        job = Job(
+    @profiled()
+    def post(
+        self,
+        region=None,
+        ocp_version=None,
+        aws_access_key_id=None,
+        aws_account_id=None,
+        aws_secret_access_key=None,
+        replicas=2,
+        compute_machine_type="m5.4xlarge",
+        multi_az=False,
+        channel_group="stable",
+        expiration_time=None,
+        cluster_dict=None,
+        platform=None,
+        gcp_service_account=None,
+    ):
+        """
+        Posts the cluster definition without waiting, see `provision_osd` for arguments.
+
+        The cluster id and snapshot are set from the response.
+
+        Returns:
+            Cluster: OCM cluster body.
+
+        Raises:
+            ValueError: If any required attributes are missing.
+        """
+        _cluster_dict = self._provision_cluster_dict(
+            region=region,
+            ocp_version=ocp_version,
+            aws_access_key_id=aws_access_key_id,
+            aws_account_id=aws_account_id,
+            aws_secret_access_key=aws_secret_access_key,
+            replicas=replicas,
+            compute_machine_type=compute_machine_type,
+            multi_az=multi_az,
+            channel_group=channel_group,
+            expiration_time=expiration_time,
+            cluster_dict=cluster_dict,
+            platform=platform,
+            gcp_service_account=gcp_service_account,
+        )
+        instance = self.client.api_clusters_mgmt_v1_clusters_post(cluster=_cluster_dict)
+        self.cluster_id = instance.id
+        self.snapshot.set(value=instance)
+        return instance
+
+    def _provision_cluster_dict(
+        self,
+        region,
+        ocp_version,
+        aws_access_key_id,
+        aws_account_id,
+        aws_secret_access_key,
+        replicas,
+        compute_machine_type,
+        multi_az,
+        channel_group,
+        expiration_time,
+        cluster_dict,
+        platform,
+        gcp_service_account,
+    ):
+        if cluster_dict:
+            return cluster_dict
+
+        frame = inspect.currentframe()
+        frame_values = inspect.getargvalues(frame)[3]
+        required_attributes = ["region", "ocp_version"]
+        if platform == AWS_OSD_STR:
+            required_attributes.extend([
+                "aws_access_key_id",
+                "aws_account_id",
+                "aws_secret_access_key",
+            ])
+
+        elif platform == GCP_OSD_STR:
+            required_attributes.append("gcp_service_account")
+        missing_attributes = [attr_name for attr_name in required_attributes if not frame_values.get(attr_name)]
+
+        if missing_attributes:
+            raise ValueError(f"Missing attributes: {missing_attributes}")
+
+        return self.osd_dict(
+            region=region,
+            ocp_version=ocp_version,
+            aws_access_key_id=aws_access_key_id,
+            aws_account_id=aws_account_id,
+            aws_secret_access_key=aws_secret_access_key,
+            replicas=replicas,
+            compute_machine_type=compute_machine_type,
+            multi_az=multi_az,
+            channel_group=channel_group,
+            expiration_time=expiration_time,
+            platform=platform,
+            gcp_service_account=gcp_service_account,
+        )
+
+    @property
+    def osd_cluster_ready_job(self):
+        from ocp_resources.job import Job
+
+        return Job(
             client=self.ocp_client,
             name="osd-cluster-ready",
             namespace="openshift-monitoring",
         )
+
+    @staticmethod
+    def is_job_completed(job):
+        if not job.exists:
+            return False
+
+        for condition in job.instance.to_dict().get("status", {}).get("conditions") or []:
+            if condition["type"] == job.Condition.COMPLETE and condition["status"] == job.Condition.Status.TRUE:
+                return True
+        return False
+
+    @profiled()
+    def wait_for_osd_cluster_ready_job(self, wait_timeout=TIMEOUT_60MIN):
+        job = self.osd_cluster_ready_job
         job.wait_for_condition(
             condition=job.Condition.COMPLETE,
             status=job.Condition.Status.TRUE,
             timeout=wait_timeout,
         )
 
+    # asyncio
+    @property
+    def async_client(self):
+        return get_async_client(client=self.client)
+
+    async def async_get_instance(self, max_age=None):
+        return await self.async_client.run(self.get_instance, max_age=max_age)
+
+    async def async_get_exists(self, max_age=None):
+        return await self.async_client.run(self.get_exists, max_age=max_age)
+
+    async def async_wait_exists(self, wait_timeout, poller=None, polling_strategy=CLUSTER_EXISTS_POLLING):
+        if poller and self.cluster_id:
+            return await self._async_wait_with_poller(
+                poller=poller, predicate=lambda instance: instance is not None, wait_timeout=wait_timeout
+            )
+
+        async for sample in AsyncTimeoutSampler(
+            wait_timeout=wait_timeout,
+            polling_strategy=polling_strategy,
+            func=self.async_get_exists,
+            max_age=0,
+        ):
+            if sample:
+                return sample
+
+    async def async_wait_for_cluster_ready(
+        self,
+        wait_timeout=TIMEOUT_30MIN,
+        stop_status=None,
+        wait_for_osd_job=True,
+        poller=None,
+        polling_strategy=CLUSTER_STATE_POLLING,
+        timings=None,
+    ):
+        """
+        asyncio counterpart of `wait_for_cluster_ready`, no thread is held while waiting.
+        """
+        stop_status = stop_status or "error"
+        time_watcher = TimeoutWatch(timeout=wait_timeout)
+        self.timings = timings = timings or ClusterTimings(cluster_name=self.name)
+
+        try:
+            LOGGER.info(f"Wait for cluster {self.name} to be exists.")
+            with timings.phase(name="exists"):
+                await self.async_wait_exists(wait_timeout=wait_timeout, poller=poller)
+        except TimeoutExpiredError:
+            LOGGER.error(f"Timeout waiting for cluster {self.name} to be exists")
+            raise
+
+        try:
+            LOGGER.info(f"Wait for cluster {self.name} to be ready.")
+            with timings.phase(name="ready"):
+                if poller:
+                    await self._async_wait_with_poller(
+                        poller=poller,
+                        predicate=self._cluster_ready_predicate(stop_status=stop_status, timings=timings),
+                        wait_timeout=time_watcher.remaining_time(),
+                    )
+                else:
+                    cluster_status = None
+                    async for sample in AsyncTimeoutSampler(
+                        wait_timeout=time_watcher.remaining_time(),
+                        polling_strategy=polling_strategy,
+                        state_func=cluster_state,
+                        func=self.async_get_instance,
+                        max_age=0,
+                    ):
+                        if sample:
+                            cluster_status = self._check_cluster_state(
+                                instance=sample, cluster_status=cluster_status, stop_status=stop_status, timings=timings
+                            )
+                            if cluster_status == "ready":
+                                break
+
+        except TimeoutExpiredError:
+            LOGGER.error(f"Timeout waiting for cluster {self.name} to be ready")
+            raise
+
+        if wait_for_osd_job and not await self.async_client.run(lambda: self.hypershift):
+            with timings.phase(name="osd_cluster_ready_job"):
+                await self.async_wait_for_osd_cluster_ready_job(wait_timeout=time_watcher.remaining_time())
+
+        return self
+
+    async def async_wait_for_osd_cluster_ready_job(self, wait_timeout=TIMEOUT_60MIN):
+        job = await self.async_client.run(lambda: self.osd_cluster_ready_job)
+        async for sample in AsyncTimeoutSampler(
+            wait_timeout=wait_timeout,
+            func=functools.partial(self.async_client.run, self.is_job_completed, job=job),
+        ):
+            if sample:
+                return
+
+    async def async_wait_for_cluster_deletion(
+        self, wait_timeout=TIMEOUT_30MIN, poller=None, polling_strategy=CLUSTER_STATE_POLLING
+    ):
+        LOGGER.info(f"Wait for cluster {self.name} to be deleted.")
+        try:
+            if poller and self.cluster_id:
+                await self._async_wait_with_poller(
+                    poller=poller, predicate=lambda instance: instance is None, wait_timeout=wait_timeout
+                )
+                return
+
+            async for sample in AsyncTimeoutSampler(
+                wait_timeout=wait_timeout,
+                polling_strategy=polling_strategy,
+                state_func=cluster_state,
+                func=self.async_get_exists,
+                max_age=0,
+            ):
+                if not sample:
+                    return
+        except TimeoutExpiredError:
+            LOGGER.error(f"Timeout waiting for cluster {self.name} to be deleted")
+            raise
+
+    async def async_delete(self, wait=True, timeout=TIMEOUT_30MIN, deprovision=True, poller=None):
+        await self.async_client.run(self.delete, wait=False, deprovision=deprovision)
+        if wait:
+            await self.async_wait_for_cluster_deletion(wait_timeout=timeout, poller=poller)
+
+    async def async_wait_for_updated_upgrade_policy(
+        self, ocp_target_version, wait_timeout=TIMEOUT_10MIN, polling_strategy=DEFAULT_POLLING
+    ):
+        LOGGER.info(f"Wait for cluster {self.name} upgrade policy to be updated with {ocp_target_version} version.")
+        try:
+            async for sample in AsyncTimeoutSampler(
+                wait_timeout=wait_timeout,
+                polling_strategy=polling_strategy,
+                func=functools.partial(self.async_client.run, lambda: self.upgrade_policies),
+            ):
+                if sample and sample[0].version == ocp_target_version:
+                    LOGGER.info(f"Upgrade policy updated: {sample}")
+                    return
+        except TimeoutExpiredError:
+            LOGGER.error("Upgrade policy was not updated")
+            raise
+
+    async def async_provision_osd(
+        self,
+        region=None,
+        ocp_version=None,
+        aws_access_key_id=None,
+        aws_account_id=None,
+        aws_secret_access_key=None,
+        replicas=2,
+        compute_machine_type="m5.4xlarge",
+        multi_az=False,
+        channel_group="stable",
+        expiration_time=None,
+        cluster_dict=None,
+        wait_for_ready=False,
+        wait_timeout=TIMEOUT_30MIN,
+        platform=None,
+        gcp_service_account=None,
+        poller=None,
+        timings=None,
+    ):
+        """
+        asyncio counterpart of `provision_osd`, see `provision_osd` for arguments.
+        """
+        time_watcher = TimeoutWatch(timeout=wait_timeout)
+        self.timings = timings = timings or ClusterTimings(cluster_name=self.name)
+        with timings.phase(name="post"):
+            await self.async_client.run(
+                self.post,
+                region=region,
+                ocp_version=ocp_version,
+                aws_access_key_id=aws_access_key_id,
+                aws_account_id=aws_account_id,
+                aws_secret_access_key=aws_secret_access_key,
+                replicas=replicas,
+                compute_machine_type=compute_machine_type,
+                multi_az=multi_az,
+                channel_group=channel_group,
+                expiration_time=expiration_time,
+                cluster_dict=cluster_dict,
+                platform=platform,
+                gcp_service_account=gcp_service_account,
+            )
+        # `async_wait_for_cluster_ready` starts with the "exists" phase
+        if wait_for_ready:
+            await self.async_wait_for_cluster_ready(
+                wait_timeout=time_watcher.remaining_time(), poller=poller, timings=timings
+            )
+        else:
+            with timings.phase(name="exists"):
+                await self.async_wait_exists(wait_timeout=time_watcher.remaining_time(), poller=poller)
+
+        return self
+
 
 class ClusterAddOn(Cluster):
     """
@@ -470,11 +1506,24 @@ class ClusterAddOn(Cluster):
     def __init__(self, client, cluster_name, addon_name):
         super().__init__(client=client, name=cluster_name)
         self.addon_name = addon_name
-        self.addon_version = self.addon_info()["version"]["id"]
+        self.addon_catalog = get_addon_catalog(client=client)
+        self.addon_version = self.addon_catalog.get(addon_id=self.addon_name)["version"]["id"]
 
-    def addon_info(self):
-        return self.client.api_clusters_mgmt_v1_addons_addon_id_get(self.addon_name).to_dict()
+    @profiled()
+    def addon_info(self, max_age=None):
+        """
+        Returns the addon definition, served from the addon catalog shared by all `ClusterAddOn` objects.
+
+        Args:
+            max_age (int or float, optional): Maximum accepted age in seconds, 0 to force a fetch.
+                Defaults to None (catalog TTL).
 
+        Returns:
+            dict: Addon definition.
+        """
+        return copy.deepcopy(self.addon_catalog.get(addon_id=self.addon_name, max_age=max_age))
+
+    @profiled()
     def get_addon_parameters_dict(self, addon_parameters):
         """Filter related addon parameters. Filter only related parameters if cluster condition(s) are set
 
@@ -491,23 +1540,12 @@ class ClusterAddOn(Cluster):
                     'addon_parameter': {'default_value': '', 'required': False, 'value_type': bool},
                 }
         """
-        _addon_parameters_dict = {}
-
-        for param in addon_parameters.get("items"):
-            if param_conditions := [
-                condition["data"] for condition in param.get("conditions", []) if condition["resource"] == "cluster"
-            ]:
-                if self.check_param_conditions(
-                    cluster_dict=self.instance.to_dict(),
-                    conditions_dict=param_conditions[0],
-                ):
-                    _addon_parameters_dict[param["id"]] = self._set_param_dict(_param=param)
-
-            else:
-                _addon_parameters_dict[param["id"]] = self._set_param_dict(_param=param)
-
-        return _addon_parameters_dict
+        parameters = compile_parameters(addon_parameters=addon_parameters)
+        # All parameter conditions are checked against the same cluster snapshot, fetched once if needed
+        cluster_dict = self.instance.to_dict() if any(predicate for _, _, predicate in parameters) else None
+        return evaluate_parameters(parameters=parameters, cluster_dict=cluster_dict)
 
+    @profiled()
     def validate_and_update_addon_parameters(self, user_parameters=None, use_api_defaults=True):
         """
         Validate and update user input parameters against API's conditions and requirements.
@@ -530,7 +1568,7 @@ class ClusterAddOn(Cluster):
         """
 
         _user_parameters = user_parameters or []
-        addon_parameters = self.addon_info().get("parameters", {})
+        addon_parameters = self.addon_catalog.get(addon_id=self.addon_name).get("parameters", {})
         user_addon_parameters = [param["id"] for param in _user_parameters]
 
         if not addon_parameters and _user_parameters:
@@ -582,6 +1620,7 @@ class ClusterAddOn(Cluster):
 
         return _user_parameters
 
+    @profiled()
     def install_addon(
         self,
         parameters=None,
@@ -611,6 +1650,8 @@ class ClusterAddOn(Cluster):
         """
 
         def _wait_for_rhoam_installation(_command):
+            import rosa.cli as rosa_cli
+
             for rosa_sampler in self.addon_installation_instance_sampler(
                 func=rosa_cli.execute,
                 wait_timeout=TIMEOUT_5MIN,
@@ -647,6 +1688,8 @@ class ClusterAddOn(Cluster):
                     # TODO: remove _wait_for_rhoam_installation after https://github.com/openshift/rosa/issues/970 resolved
                     res = _wait_for_rhoam_installation(_command=command)
                 else:
+                    import rosa.cli as rosa_cli
+
                     res = rosa_cli.execute(command=command, ocm_client=self.client, aws_region=self.region)
             else:
                 if parameters:
@@ -671,6 +1714,9 @@ class ClusterAddOn(Cluster):
                     "r",
                 ) as fd:
                     policy_document = fd.read()
+
+                from clouds.aws.roles.roles import create_or_update_role_policy
+
                 create_or_update_role_policy(
                     role_name="ManagedOpenShift-Support-Role",
                     policy_name="rhoam-sre-support-policy",
@@ -681,6 +1727,8 @@ class ClusterAddOn(Cluster):
         except Exception as ex:
             LOGGER.error(f"{self.addon_name} Install Failed. \n{ex}")
             if must_gather_output_dir:
+                from ocp_utilities.must_gather import collect_must_gather
+
                 collect_must_gather(
                     must_gather_output_dir=must_gather_output_dir,
                     kubeconfig_path=kubeconfig_path,
@@ -704,11 +1752,33 @@ class ClusterAddOn(Cluster):
             LOGGER.info(f"{self.addon_name} not found")
             return
 
-    def wait_for_install_state(self, state, wait_timeout=TIMEOUT_30MIN):
+    @profiled()
+    def wait_for_install_state(self, state, wait_timeout=TIMEOUT_30MIN, polling_strategy=ADDON_STATE_POLLING):
         _state = None
         try:
             for _addon_installation_instance in self.addon_installation_instance_sampler(
-                func=self.addon_installation_instance, wait_timeout=wait_timeout
+                func=self.addon_installation_instance,
+                wait_timeout=wait_timeout,
+                polling_strategy=polling_strategy,
+                state_func=addon_state,
+            ):
+                _state = str(_addon_installation_instance.get("state"))
+                if _state == state:
+                    return True
+        except TimeoutExpiredError:
+            LOGGER.error(f"Timeout waiting for {self.addon_name} state to be {state}, last state was {_state}")
+            raise
+
+    async def async_wait_for_install_state(
+        self, state, wait_timeout=TIMEOUT_30MIN, polling_strategy=ADDON_STATE_POLLING
+    ):
+        _state = None
+        try:
+            async for _addon_installation_instance in AsyncTimeoutSampler(
+                wait_timeout=wait_timeout,
+                polling_strategy=polling_strategy,
+                state_func=addon_state,
+                func=functools.partial(self.async_client.run, self.addon_installation_instance),
             ):
                 _state = str(_addon_installation_instance.get("state"))
                 if _state == state:
@@ -717,6 +1787,32 @@ class ClusterAddOn(Cluster):
             LOGGER.error(f"Timeout waiting for {self.addon_name} state to be {state}, last state was {_state}")
             raise
 
+    async def async_install_addon(self, wait=True, wait_timeout=TIMEOUT_30MIN, **kwargs):
+        """
+        asyncio counterpart of `install_addon`, see `install_addon` for arguments.
+        """
+        res = await self.async_client.run(self.install_addon, wait=False, **kwargs)
+        if wait:
+            await self.async_wait_for_install_state(state=self.State.READY, wait_timeout=wait_timeout)
+        return res
+
+    async def async_uninstall_addon(self, wait=True, wait_timeout=TIMEOUT_30MIN, rosa=False):
+        """
+        asyncio counterpart of `uninstall_addon`, see `uninstall_addon` for arguments.
+        """
+        res = await self.async_client.run(self.uninstall_addon, wait=False, rosa=rosa)
+        if wait:
+            async for _addon_installation_instance in AsyncTimeoutSampler(
+                wait_timeout=wait_timeout,
+                polling_strategy=ADDON_STATE_POLLING,
+                state_func=addon_state,
+                func=functools.partial(self.async_client.run, self.addon_installation_instance),
+            ):
+                if not _addon_installation_instance:
+                    return True
+        return res
+
+    @profiled()
     def uninstall_addon(self, wait=True, wait_timeout=TIMEOUT_30MIN, rosa=False):
         """
         Uninstall addon on the cluster
@@ -731,6 +1827,8 @@ class ClusterAddOn(Cluster):
         """
         LOGGER.info(f"Removing addon {self.addon_name} v{self.addon_version}")
         if rosa:
+            import rosa.cli as rosa_cli
+
             res = rosa_cli.execute(
                 command=f"uninstall addon {self.addon_name} --cluster {self.name}",
                 ocm_client=self.client,
@@ -743,7 +1841,10 @@ class ClusterAddOn(Cluster):
             )
         if wait:
             for _addon_installation_instance in self.addon_installation_instance_sampler(
-                func=self.addon_installation_instance, wait_timeout=wait_timeout
+                func=self.addon_installation_instance,
+                wait_timeout=wait_timeout,
+                polling_strategy=ADDON_STATE_POLLING,
+                state_func=addon_state,
             ):
                 if not _addon_installation_instance:
                     return True
@@ -751,10 +1852,14 @@ class ClusterAddOn(Cluster):
         return res
 
     def update_rhoam_cluster_storage_config(self):
+        from ocp_resources.resource import ResourceEditor
+        from ocp_resources.rhmi import RHMI
+        from ocp_resources.utils.constants import NOT_FOUND_ERROR_EXCEPTION_DICT
+
         def _wait_for_rhmi_resource():
-            for rhmi_sample in TimeoutSampler(
+            for rhmi_sample in BackoffTimeoutSampler(
                 wait_timeout=TIMEOUT_30MIN,
-                sleep=SLEEP_1SEC,
+                polling_strategy=DEFAULT_POLLING,
                 func=lambda: RHMI(
                     client=self.ocp_client,
                     name="rhoam",
@@ -773,6 +1878,9 @@ class ClusterAddOn(Cluster):
         rhmi.wait_for_stage_status_complete(timeout=TIMEOUT_45MIN)
 
     def create_rhods_brew_config(self, brew_token):
+        from ocp_resources.image_content_source_policy import ImageContentSourcePolicy
+        from ocp_utilities.infra import create_update_secret
+
         icsp_name = "ocp-mgmt-wrapper-brew-registry"
         icsp = ImageContentSourcePolicy(
             client=self.ocp_client,
@@ -809,26 +1917,16 @@ class ClusterAddOn(Cluster):
             Bool: True if cluster instance match with conditions, else False
 
         """
-        match_all = []
-        for condition, condition_value in conditions_dict.items():
-            cluster_condition_value = benedict(cluster_dict, keypath_separator=".").get(condition)
-
-            match_all.append(
-                isinstance(condition_value, list)
-                and cluster_condition_value in condition_value
-                or cluster_condition_value == condition_value
-            )
-
-        return all(match_all)
-
-    @staticmethod
-    def addon_installation_instance_sampler(func, wait_timeout=TIMEOUT_30MIN, **kwargs):
-        return TimeoutSampler(wait_timeout=wait_timeout, sleep=SLEEP_1SEC, func=func, **kwargs)
+        return compile_conditions(conditions_dict=conditions_dict)(cluster_dict)
 
     @staticmethod
-    def _set_param_dict(_param):
-        return {
-            "required": _param.get("required"),
-            "value_type": int if _param["value_type"] == "number" else str,
-            "default_value": _param.get("default_value"),
-        }
+    def addon_installation_instance_sampler(
+        func, wait_timeout=TIMEOUT_30MIN, polling_strategy=DEFAULT_POLLING, state_func=None, **kwargs
+    ):
+        return BackoffTimeoutSampler(
+            wait_timeout=wait_timeout,
+            polling_strategy=polling_strategy,
+            state_func=state_func,
+            func=func,
+            **kwargs,
+        )
@@ -0,0 +1,220 @@
+import threading
+from concurrent.futures import Future
+
+from simple_logger.logger import get_logger
+
+from ocm_python_wrapper.paging import DEFAULT_PAGE_SIZE
+from ocm_python_wrapper.search import SearchQuery
+
+LOGGER = get_logger(name=__name__)
+FLEET_POLL_INTERVAL = 5
+_UNSEEN = object()
+
+
+class FleetPoller:
+    """
+    Polls many clusters with one clusters list query per tick and notifies the registered waiters.
+
+    Watched cluster ids are batched into `search="id in (...)"` list calls (one call per `batch_size` clusters),
+    so the request rate stays flat however many clusters are watched. Waiters are called on their first tick
+    and then whenever the cluster state changes; a cluster missing from the list response is reported as None.
+
+    Example:
+        with FleetPoller(client=client) as poller:
+            futures = [poller.wait_for_state(cluster_id=_id, states=["ready"]) for _id in cluster_ids]
+            ready_clusters = [future.result(timeout=TIMEOUT_60MIN) for future in futures]
+    """
+
+    def __init__(self, client, interval=FLEET_POLL_INTERVAL, batch_size=DEFAULT_PAGE_SIZE):
+        """
+        Args:
+            client (DefaultApi): OCM client.
+            interval (int, optional): Seconds between two polls. Defaults to FLEET_POLL_INTERVAL.
+            batch_size (int, optional): Maximum number of cluster ids per list query. Defaults to DEFAULT_PAGE_SIZE.
+        """
+        self.client = client
+        self.interval = interval
+        self.batch_size = batch_size
+        self._waiters = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Starts the polling thread, if not running.
+        """
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="ocm-fleet-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the polling thread and cancels pending `wait_for` futures.
+        """
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+        with self._lock:
+            waiters, self._waiters = self._waiters, {}
+
+        for cluster_waiters in waiters.values():
+            for waiter in cluster_waiters:
+                if future := getattr(waiter, "future", None):
+                    future.cancel()
+
+    def watch(self, cluster_id, callback):
+        """
+        Registers a waiter for a cluster, starting the poller if needed.
+
+        Args:
+            cluster_id (str): Cluster id.
+            callback (callable): Called as `callback(cluster_id=..., instance=...)` with the cluster body
+                (None if the cluster does not exist) on the first tick and on every state change.
+                Returning a truthy value unregisters the callback.
+
+        Returns:
+            callable: The registered callback, to pass to `unwatch`.
+        """
+        with self._lock:
+            self._waiters.setdefault(cluster_id, {})[callback] = _UNSEEN
+        self.start()
+        return callback
+
+    def unwatch(self, cluster_id, callback):
+        """
+        Unregisters a waiter.
+
+        Args:
+            cluster_id (str): Cluster id.
+            callback (callable): Callback returned by `watch`.
+        """
+        with self._lock:
+            cluster_waiters = self._waiters.get(cluster_id, {})
+            cluster_waiters.pop(callback, None)
+            if not cluster_waiters:
+                self._waiters.pop(cluster_id, None)
+
+    def wait_for(self, cluster_id, predicate):
+        """
+        Args:
+            cluster_id (str): Cluster id.
+            predicate (callable): Called with the cluster body (None if the cluster does not exist).
+                An exception raised by `predicate` is set on the returned future.
+
+        Returns:
+            concurrent.futures.Future: Resolved with the cluster body once `predicate` returns True.
+                Cancel it to stop waiting.
+        """
+        future = Future()
+
+        def _callback(cluster_id, instance):
+            if future.done():
+                return True
+            try:
+                if predicate(instance):
+                    future.set_result(instance)
+                    return True
+            except Exception as ex:  # noqa: BLE001 - raised to the waiter through the future
+                future.set_exception(ex)
+                return True
+
+        _callback.future = future
+        self.watch(cluster_id=cluster_id, callback=_callback)
+        return future
+
+    def wait_for_state(self, cluster_id, states):
+        """
+        Args:
+            cluster_id (str): Cluster id.
+            states (list): Cluster states to wait for, e.g. ["ready", "error"].
+
+        Returns:
+            concurrent.futures.Future: Resolved with the cluster body once its state is one of `states`.
+        """
+        return self.wait_for(
+            cluster_id=cluster_id,
+            predicate=lambda instance: instance is not None and str(instance.state) in states,
+        )
+
+    def wait_for_deletion(self, cluster_id):
+        """
+        Args:
+            cluster_id (str): Cluster id.
+
+        Returns:
+            concurrent.futures.Future: Resolved with None once the cluster no longer exists.
+        """
+        return self.wait_for(cluster_id=cluster_id, predicate=lambda instance: instance is None)
+
+    def poll(self):
+        """
+        Runs a single poll: one list query per `batch_size` watched clusters, then notifies the waiters.
+        """
+        with self._lock:
+            for cluster_id, cluster_waiters in list(self._waiters.items()):
+                for callback in [_callback for _callback in cluster_waiters if _is_cancelled(callback=_callback)]:
+                    del cluster_waiters[callback]
+                if not cluster_waiters:
+                    del self._waiters[cluster_id]
+            cluster_ids = list(self._waiters)
+
+        for idx in range(0, len(cluster_ids), self.batch_size):
+            batch = cluster_ids[idx : idx + self.batch_size]
+            try:
+                clusters = self.client.api_clusters_mgmt_v1_clusters_get(
+                    search=SearchQuery().in_(field="id", values=batch).search,
+                    size=len(batch),
+                ).items
+            except Exception as ex:  # noqa: BLE001 - API or connection errors, retried on the next tick
+                LOGGER.warning(f"Failed to poll {len(batch)} clusters: {ex}")
+                continue
+
+            clusters_by_id = {cluster.id: cluster for cluster in clusters}
+            for cluster_id in batch:
+                self._notify(cluster_id=cluster_id, instance=clusters_by_id.get(cluster_id))
+
+    def _notify(self, cluster_id, instance):
+        state = None if instance is None else str(instance.state)
+        with self._lock:
+            waiters = [
+                callback for callback, seen_state in self._waiters.get(cluster_id, {}).items() if seen_state != state
+            ]
+            for callback in waiters:
+                self._waiters[cluster_id][callback] = state
+
+        for callback in waiters:
+            try:
+                done = callback(cluster_id=cluster_id, instance=instance)
+            except Exception as ex:  # noqa: BLE001 - a failing waiter must not stop the poller
+                LOGGER.error(f"Cluster {cluster_id} waiter {callback} failed: {ex}")
+                done = True
+
+            if done:
+                self.unwatch(cluster_id=cluster_id, callback=callback)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as ex:  # noqa: BLE001 - the poller thread must outlive a failed tick
+                LOGGER.error(f"Fleet poll failed: {ex}")
+            self._stop_event.wait(timeout=self.interval)
+
+
+def _is_cancelled(callback):
+    future = getattr(callback, "future", None)
+    return future is not None and future.done()
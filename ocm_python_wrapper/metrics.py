@@ -0,0 +1,184 @@
+import bisect
+import collections
+import threading
+
+DEFAULT_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+METRICS_PREFIX = "ocm_client"
+
+
+class _EndpointMetrics:
+    def __init__(self, buckets):
+        self.statuses = collections.Counter()
+        self.retries = collections.Counter()
+        self.token_refreshes = 0
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.duration_sum = 0.0
+        self.duration_max = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+
+class ClientMetrics:
+    """
+    Per-endpoint request metrics of an OCM client.
+
+    Endpoints are labeled by HTTP method and templated path (e.g. "GET /api/clusters_mgmt/v1/clusters/{cluster_id}"),
+    so all clusters share one series. Records latency histograms, status codes, retries, token refreshes and
+    request/response body sizes.
+
+    Example:
+        ocm_client = OCMPythonClient(...)
+        ...
+        ocm_client.metrics.snapshot()  # plain dict
+        ocm_client.metrics.to_prometheus()  # Prometheus text exposition format
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        """
+        Args:
+            buckets (tuple, optional): Latency histogram upper bounds in seconds. Defaults to DEFAULT_LATENCY_BUCKETS.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def observe_request(self, method, endpoint, status, duration, bytes_in=0, bytes_out=0):
+        """
+        Records one HTTP request.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Templated endpoint path.
+            status (int): Response status code, 0 if no response was received.
+            duration (float): Request duration in seconds.
+            bytes_in (int, optional): Response body size. Defaults to 0.
+            bytes_out (int, optional): Request body size. Defaults to 0.
+        """
+        with self._lock:
+            metrics = self._endpoint(method=method, endpoint=endpoint)
+            metrics.statuses[status] += 1
+            metrics.count += 1
+            metrics.duration_sum += duration
+            metrics.duration_max = max(metrics.duration_max, duration)
+            metrics.bytes_in += bytes_in
+            metrics.bytes_out += bytes_out
+            bucket = bisect.bisect_left(self.buckets, duration)
+            if bucket < len(self.buckets):
+                metrics.bucket_counts[bucket] += 1
+
+    def observe_retry(self, method, endpoint, status):
+        """
+        Records a request retried after a `status` response.
+        """
+        with self._lock:
+            self._endpoint(method=method, endpoint=endpoint).retries[status] += 1
+
+    def observe_token_refresh(self, method, endpoint):
+        """
+        Records an access token fetched from SSO, on the SSO token endpoint.
+        """
+        with self._lock:
+            self._endpoint(method=method, endpoint=endpoint).token_refreshes += 1
+
+    def reset(self):
+        """
+        Drops all recorded metrics.
+        """
+        with self._lock:
+            self._endpoints = {}
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: Metrics per "METHOD endpoint", with requests, statuses, retries, token_refreshes, bytes_in,
+                bytes_out and latency (count, sum, average, max and cumulative bucket counts).
+        """
+        with self._lock:
+            return {
+                f"{method} {endpoint}": {
+                    "requests": metrics.count,
+                    "statuses": dict(metrics.statuses),
+                    "retries": dict(metrics.retries),
+                    "token_refreshes": metrics.token_refreshes,
+                    "bytes_in": metrics.bytes_in,
+                    "bytes_out": metrics.bytes_out,
+                    "latency": {
+                        "count": metrics.count,
+                        "sum": metrics.duration_sum,
+                        "average": metrics.duration_sum / metrics.count if metrics.count else 0.0,
+                        "max": metrics.duration_max,
+                        "buckets": dict(zip(self.buckets, _cumulative(counts=metrics.bucket_counts))),
+                    },
+                }
+                for (method, endpoint), metrics in sorted(self._endpoints.items())
+            }
+
+    def to_prometheus(self):
+        """
+        Returns:
+            str: Metrics in the Prometheus text exposition format.
+        """
+        requests = []
+        retries = []
+        token_refreshes = []
+        bytes_total = []
+        durations = []
+        with self._lock:
+            for (method, endpoint), metrics in sorted(self._endpoints.items()):
+                labels = f'method="{_escape(method)}",endpoint="{_escape(endpoint)}"'
+                requests.extend(
+                    f'{METRICS_PREFIX}_requests_total{{{labels},status="{status}"}} {count}'
+                    for status, count in sorted(metrics.statuses.items())
+                )
+                retries.extend(
+                    f'{METRICS_PREFIX}_retries_total{{{labels},status="{status}"}} {count}'
+                    for status, count in sorted(metrics.retries.items())
+                )
+                token_refreshes.append(f"{METRICS_PREFIX}_token_refreshes_total{{{labels}}} {metrics.token_refreshes}")
+                bytes_total.extend([
+                    f'{METRICS_PREFIX}_bytes_total{{{labels},direction="in"}} {metrics.bytes_in}',
+                    f'{METRICS_PREFIX}_bytes_total{{{labels},direction="out"}} {metrics.bytes_out}',
+                ])
+                for bucket, count in zip(self.buckets, _cumulative(counts=metrics.bucket_counts)):
+                    durations.append(
+                        f'{METRICS_PREFIX}_request_duration_seconds_bucket{{{labels},le="{bucket}"}} {count}'
+                    )
+                durations.extend([
+                    f'{METRICS_PREFIX}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {metrics.count}',
+                    f"{METRICS_PREFIX}_request_duration_seconds_sum{{{labels}}} {metrics.duration_sum}",
+                    f"{METRICS_PREFIX}_request_duration_seconds_count{{{labels}}} {metrics.count}",
+                ])
+
+        lines = []
+        for name, metric_type, description, samples in (
+            ("requests_total", "counter", "OCM API requests by status code.", requests),
+            ("retries_total", "counter", "OCM API requests retried, by response status code.", retries),
+            ("token_refreshes_total", "counter", "Access tokens fetched from SSO.", token_refreshes),
+            ("bytes_total", "counter", "OCM API request (out) and response (in) body bytes.", bytes_total),
+            ("request_duration_seconds", "histogram", "OCM API request latency.", durations),
+        ):
+            lines.extend([
+                f"# HELP {METRICS_PREFIX}_{name} {description}",
+                f"# TYPE {METRICS_PREFIX}_{name} {metric_type}",
+                *samples,
+            ])
+        return "\n".join(lines) + "\n"
+
+    def _endpoint(self, method, endpoint):
+        if (metrics := self._endpoints.get((method, endpoint))) is None:
+            metrics = self._endpoints[(method, endpoint)] = _EndpointMetrics(buckets=self.buckets)
+        return metrics
+
+
+def _cumulative(counts):
+    total = 0
+    cumulative_counts = []
+    for count in counts:
+        total += count
+        cumulative_counts.append(total)
+    return cumulative_counts
+
+
+def _escape(label_value):
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -1,13 +1,39 @@
+import inspect
+import json
+import random
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+
 import requests
+from ocm_python_client import ApiException, rest
 from ocm_python_client.api.default_api import DefaultApi
 from ocm_python_client.api_client import ApiClient
 from ocm_python_client.configuration import Configuration
 from ocm_python_client.exceptions import UnauthorizedException
+from requests.adapters import HTTPAdapter
 from simple_logger.logger import get_logger
+from urllib3.connection import HTTPConnection
 
+from ocm_python_wrapper.async_client import close_async_client
 from ocm_python_wrapper.exceptions import AuthenticationError, EndpointAccessError
+from ocm_python_wrapper.metrics import ClientMetrics
+from ocm_python_wrapper.paging import DEFAULT_MAX_IN_FLIGHT, DEFAULT_PAGE_SIZE, iter_items
+from ocm_python_wrapper.profiler import is_profiling, record_request
+from ocm_python_wrapper.rate_limiter import RateLimiter, get_retry_after
+from ocm_python_wrapper.single_flight import SingleFlight
+from ocm_python_wrapper.token_cache import TokenCache
+from ocm_python_wrapper.token_manager import TOKEN_REFRESH_MARGIN, TokenManager
 
 LOGGER = get_logger(name=__name__)
+DEFAULT_POOLS_SIZE = 4
+DEFAULT_MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 1
+TOO_MANY_REQUESTS = 429
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+IDEMPOTENT_RETRY_STATUSES = (TOO_MANY_REQUESTS, 500, 502, 503, 504)
+CALL_API_SIGNATURE = inspect.signature(ApiClient.call_api)
 
 
 class OCMPythonClient(ApiClient):
@@ -21,6 +47,18 @@ class OCMPythonClient(ApiClient):
         endpoint,
         api_host="production",
         discard_unknown_keys=False,
+        token_refresh_margin=TOKEN_REFRESH_MARGIN,
+        background_token_refresh=True,
+        token_cache_dir=None,
+        pools_size=DEFAULT_POOLS_SIZE,
+        connection_pool_maxsize=None,
+        tcp_keepalive=True,
+        retries=None,
+        rate_limit=None,
+        rate_limit_burst=None,
+        max_retries=DEFAULT_MAX_RETRIES,
+        coalesce_gets=False,
+        metrics=True,
     ):
         """
         Initializes the OCM client.
@@ -28,18 +66,74 @@ class OCMPythonClient(ApiClient):
         Args:
             token (str): The authentication token.
             endpoint (str): The endpoint to connect to.
-            api_host (str, optional): The API host to use. Defaults to "production".
+            api_host (str, optional): The API host to use, "production", "stage" or an API URL.
+                Defaults to "production".
             discard_unknown_keys (bool, optional): Whether to discard unknown keys in the response. Defaults to False.
+            token_refresh_margin (int, optional): Seconds before the access token expiry at which it is refreshed.
+                Defaults to TOKEN_REFRESH_MARGIN.
+            background_token_refresh (bool, optional): Refresh the access token in a background thread before it
+                expires. Defaults to True.
+            token_cache_dir (str, optional): Directory of an on-disk access token cache shared between processes,
+                e.g. pytest-xdist workers. A still-valid cached token is reused instead of a new SSO exchange.
+                Defaults to None (no cache).
+            pools_size (int, optional): Number of per-host connection pools kept by the OCM API client.
+                Defaults to DEFAULT_POOLS_SIZE.
+            connection_pool_maxsize (int, optional): Maximum connections kept open per host, for both OCM and SSO.
+                Set it to at least the number of threads sharing the client to avoid
+                "connection pool is full, discarding connection" warnings.
+                Defaults to None (Configuration default, cpu_count * 5).
+            tcp_keepalive (bool, optional): Enable TCP keep-alive on pooled connections. Defaults to True.
+            retries (int or urllib3.util.Retry, optional): Connection level retries for OCM and SSO requests.
+                Defaults to None (urllib3 default).
+            rate_limit (int or float, optional): Maximum OCM API requests per second, shared by all threads using
+                this client. Defaults to None (no limit).
+            rate_limit_burst (int, optional): Maximum OCM API requests sent at once. Defaults to `rate_limit`.
+            max_retries (int, optional): Retries of a request answered with 429 (any method) or 5xx (idempotent
+                methods only), honoring `Retry-After`. Defaults to DEFAULT_MAX_RETRIES.
+            coalesce_gets (bool or list, optional): Share one in-flight request between concurrent identical GETs
+                (same path and parameters). True for all endpoints, or a list of endpoint paths,
+                e.g. ["/api/clusters_mgmt/v1/clusters/{cluster_id}"]. The callers get the same returned object,
+                which must then be treated as read-only. Defaults to False.
+            metrics (bool, optional): Record per-endpoint request metrics in `self.metrics`, see `ClientMetrics`.
+                Defaults to True.
         """
         self.endpoint = endpoint
         self.token = token
+        self.max_retries = max_retries
+        self.rate_limiter = RateLimiter(rate=rate_limit, burst=rate_limit_burst) if rate_limit else None
+        self.coalesce_gets = coalesce_gets if isinstance(coalesce_gets, bool) else frozenset(coalesce_gets)
+        self.single_flight = SingleFlight()
+        self.metrics = ClientMetrics() if metrics else None
+        self._request_context = threading.local()
+        self.sso_session = self.get_sso_session(
+            connection_pool_maxsize=connection_pool_maxsize,
+            retries=retries,
+        )
+        token_cache = TokenCache(cache_dir=token_cache_dir) if token_cache_dir else None
+        self.token_manager = TokenManager(
+            fetch_func=self.__confirm_auth,
+            refresh_margin=token_refresh_margin,
+            background_refresh=background_token_refresh,
+            token_cache=token_cache,
+            cache_key=TokenCache.key(endpoint=endpoint, refresh_token=token) if token_cache else None,
+        )
         self.client_config = Configuration(
             host=self.get_base_api_uri(api_host),
-            access_token=self.__confirm_auth(),
+            access_token=self.token_manager.access_token,
             discard_unknown_keys=discard_unknown_keys,
         )
+        if connection_pool_maxsize:
+            self.client_config.connection_pool_maxsize = connection_pool_maxsize
+        if retries is not None:
+            self.client_config.retries = retries
+        if tcp_keepalive:
+            self.client_config.socket_options = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
 
         super().__init__(configuration=self.client_config)
+        if pools_size != DEFAULT_POOLS_SIZE:
+            self.rest_client = rest.RESTClientObject(configuration=self.client_config, pools_size=pools_size)
 
     def __confirm_auth(self):
         """
@@ -50,9 +144,9 @@ class OCMPythonClient(ApiClient):
 
         Raises:
             AuthenticationError: If the token is expired.
-            EndpointAccessError: If the endpoint cannot be accessed.
+            EndpointAccessError: If the endpoint cannot be accessed or does not return an access token.
         """
-        response = requests.post(
+        response = self.sso_session.post(
             self.endpoint,
             data={
                 "grant_type": "refresh_token",
@@ -63,20 +157,34 @@ class OCMPythonClient(ApiClient):
 
         # TODO: Check which exceptions are needed
         if response.status_code != 200:
-            if response.status_code == 400:
-                if response.json().get("error_description") == "Offline user session not found":
-                    raise AuthenticationError(f"""OFFLINE Token Expired!
+            if (
+                response.status_code == 400
+                and response.json().get("error_description") == "Offline user session not found"
+            ):
+                raise AuthenticationError(f"""OFFLINE Token Expired!
                         Please update your config with a new token from: https://cloud.redhat.com/openshift/token\n"
                         Error Code: {response.status_code}""")
-            else:
-                raise EndpointAccessError(err=response.status_code, endpoint=self.endpoint)
+            raise EndpointAccessError(err=response.status_code, endpoint=self.endpoint)
+
+        try:
+            access_token = response.json()["access_token"]
+        except (KeyError, ValueError):
+            raise EndpointAccessError(err=response.status_code, endpoint=self.endpoint)
 
-        return response.json()["access_token"]
+        # Counts every token exchange, scheduled and 401 triggered refreshes alike
+        if self.metrics:
+            self.metrics.observe_token_refresh(method="POST", endpoint=urlparse(self.endpoint).path)
+        return access_token
 
     def call_api(self, *args, **kwargs):
         """
         Calls the API with the given arguments and keyword arguments.
 
+        Concurrent identical GETs share one request if `coalesce_gets` is set. Requests wait for the client rate
+        limiter, if set. Requests answered with 429, and idempotent requests answered with 5xx, are retried up to
+        `max_retries` times after the `Retry-After` delay, or with exponential backoff if the server does not
+        send one.
+
         Args:
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
@@ -86,14 +194,159 @@ class OCMPythonClient(ApiClient):
 
         Raises:
             UnauthorizedException: If the client is unauthorized.
+            ApiException: If the request fails and is not retried, or is still failing after `max_retries`.
+        """
+        call_key = self._coalescing_key(*args, **kwargs)
+        if call_key:
+            return self.single_flight.do(key=call_key, func=lambda: self._call_api_with_retries(*args, **kwargs))
+        return self._call_api_with_retries(*args, **kwargs)
+
+    def _coalescing_key(self, *args, **kwargs):
         """
+        Returns:
+            str or None: Identity of a GET that can share an in-flight request, None if it cannot be coalesced.
+        """
+        if not self.coalesce_gets:
+            return None
+
+        call_args = CALL_API_SIGNATURE.bind(self, *args, **kwargs).arguments
+        if (
+            call_args.get("method") != "GET"
+            or call_args.get("async_req")
+            or not call_args.get("_preload_content", True)
+            or (self.coalesce_gets is not True and call_args.get("resource_path") not in self.coalesce_gets)
+        ):
+            return None
+
+        return repr(sorted((name, value) for name, value in call_args.items() if name != "self"))
+
+    def _call_api_with_retries(self, *args, **kwargs):
+        method = args[1] if len(args) > 1 else kwargs.get("method")
+        resource_path = args[0] if args else kwargs.get("resource_path")
+        # Templated endpoint path, used as metrics label by `request`
+        previous_endpoint = getattr(self._request_context, "endpoint", None)
+        self._request_context.endpoint = resource_path
+        retry_statuses = IDEMPOTENT_RETRY_STATUSES if method in IDEMPOTENT_METHODS else (TOO_MANY_REQUESTS,)
+        attempt = 0
+        try:
+            while True:
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+
+                try:
+                    return self._call_api_with_token(*args, **kwargs)
+                except ApiException as ex:
+                    if ex.status not in retry_statuses or attempt >= self.max_retries:
+                        raise
+
+                    delay = get_retry_after(headers=ex.headers)
+                    if delay is None:
+                        delay = RETRY_BACKOFF_FACTOR * 2**attempt * random.uniform(0.5, 1.5)
+                    if ex.status == TOO_MANY_REQUESTS and self.rate_limiter:
+                        self.rate_limiter.pause(seconds=delay)
+
+                    attempt += 1
+                    if self.metrics:
+                        self.metrics.observe_retry(method=method, endpoint=resource_path, status=ex.status)
+                    LOGGER.warning(
+                        f"{method} {resource_path} returned {ex.status}, "
+                        f"retry {attempt}/{self.max_retries} in {delay:.1f} seconds."
+                    )
+                    time.sleep(delay)
+        finally:
+            self._request_context.endpoint = previous_endpoint
+
+    def _call_api_with_token(self, *args, **kwargs):
+        access_token = self.token_manager.access_token
+        self.client_config.access_token = access_token
         try:
             return super().call_api(*args, **kwargs)
         except UnauthorizedException:
             LOGGER.warning("Refreshing client token.")
-            self.client_config.access_token = self.__confirm_auth()
+            self.client_config.access_token = self.token_manager.refresh(stale_token=access_token)
             return super().call_api(*args, **kwargs)
 
+    def request(self, method, url, *args, **kwargs):
+        """
+        Sends the HTTP request, recording its metrics and adding it to the active `ocm_profile` blocks.
+        """
+        profiling = is_profiling()
+        if not self.metrics and not profiling:
+            return super().request(method, url, *args, **kwargs)
+
+        start = time.monotonic()
+        status = 0
+        bytes_in = 0
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            status = response.status
+            if isinstance(response, rest.RESTResponse):
+                bytes_in = len(response.data or b"")
+            else:
+                # Not preloaded (raw) response, not read yet
+                bytes_in = int(response.headers.get("Content-Length") or 0)
+            return response
+        except ApiException as ex:
+            status = ex.status
+            bytes_in = len(ex.body or b"")
+            raise
+        finally:
+            duration = time.monotonic() - start
+            endpoint = getattr(self._request_context, "endpoint", None) or urlparse(url).path
+            if self.metrics:
+                body = kwargs.get("body")
+                self.metrics.observe_request(
+                    method=method,
+                    endpoint=endpoint,
+                    status=status,
+                    duration=duration,
+                    bytes_in=bytes_in,
+                    bytes_out=len(json.dumps(body)) if body is not None else 0,
+                )
+            if profiling:
+                record_request(
+                    api_client=self,
+                    method=method,
+                    endpoint=endpoint,
+                    url=url,
+                    query_params=kwargs.get("query_params") or (args[0] if args else None),
+                    status=status,
+                    duration=duration,
+                )
+
+    def close(self):
+        """
+        Stops the background token refresh, closes the SSO session and the API client and async client
+        thread pools.
+        """
+        self.token_manager.close()
+        close_async_client(api_client=self)
+        self.sso_session.close()
+        super().close()
+
+    @staticmethod
+    def get_sso_session(connection_pool_maxsize=None, retries=None):
+        """
+        Creates a persistent HTTP session for SSO token exchanges, reusing connections between refreshes.
+
+        Args:
+            connection_pool_maxsize (int, optional): Maximum connections kept open per host. Defaults to None.
+            retries (int or urllib3.util.Retry, optional): Connection level retries. Defaults to None.
+
+        Returns:
+            requests.Session: The SSO session.
+        """
+        adapter_kwargs = {}
+        if connection_pool_maxsize:
+            adapter_kwargs["pool_maxsize"] = connection_pool_maxsize
+        if retries is not None:
+            adapter_kwargs["max_retries"] = retries
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(**adapter_kwargs))
+        session.mount("http://", HTTPAdapter(**adapter_kwargs))
+        return session
+
     @property
     def client(self):
         """
@@ -104,13 +357,43 @@ class OCMPythonClient(ApiClient):
         """
         return DefaultApi(api_client=self)
 
+    def iter_raw_items(
+        self, list_func_name, page_size=DEFAULT_PAGE_SIZE, max_in_flight=DEFAULT_MAX_IN_FLIGHT, **kwargs
+    ):
+        """
+        Streams the items of an OCM list endpoint as plain dicts, page by page.
+
+        Skips the OCM model deserialization, for bulk reads of large lists.
+
+        Example:
+            for version in ocm_client.iter_raw_items(list_func_name="api_clusters_mgmt_v1_versions_get", page_size=1000):
+                print(version["raw_id"])
+
+        Args:
+            list_func_name (str): `DefaultApi` list function name, e.g. "api_clusters_mgmt_v1_clusters_get".
+            page_size (int, optional): Number of items to request per page. Defaults to DEFAULT_PAGE_SIZE.
+            max_in_flight (int, optional): Maximum number of pages fetched ahead of the consumer.
+                Defaults to DEFAULT_MAX_IN_FLIGHT.
+            **kwargs: Extra arguments passed to the list function (search, order, etc.).
+
+        Yields:
+            dict: Each item of each page.
+        """
+        yield from iter_items(
+            list_func=getattr(self.client, list_func_name),
+            page_size=page_size,
+            max_in_flight=max_in_flight,
+            raw=True,
+            **kwargs,
+        )
+
     @staticmethod
     def get_base_api_uri(api_host):
         """
         Gets the base API URI for the given API host.
 
         Args:
-            api_host (str): The API host.
+            api_host (str): The API host, "production", "stage" or an API URL (e.g. a local OCM stand-in).
 
         Returns:
             str: The base API URI.
@@ -118,6 +401,9 @@ class OCMPythonClient(ApiClient):
         Raises:
             ValueError: If the API host is not found in the configuration.
         """
+        if api_host.startswith(("http://", "https://")):
+            return api_host.rstrip("/")
+
         api_hosts_config = Configuration().get_host_settings()
         host_config = [host["url"] for host in api_hosts_config if host["description"].lower() == api_host]
         if host_config:
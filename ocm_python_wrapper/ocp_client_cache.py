@@ -0,0 +1,156 @@
+import collections
+import hashlib
+import os
+import threading
+
+import yaml
+from simple_logger.logger import get_logger
+
+from ocm_python_wrapper.exceptions import MissingResourceError
+
+LOGGER = get_logger(name=__name__)
+DEFAULT_OCP_CLIENT_CACHE_SIZE = 32
+
+
+class OCPClientCache:
+    """
+    LRU cache of cluster kubeconfigs and OpenShift `DynamicClient` objects, keyed by cluster id.
+
+    Each entry holds the kubeconfig of a cluster, its credentials fingerprint and the client built from it.
+    Every lookup fetches the cluster credentials and compares their fingerprint with the entry, so API discovery
+    and TLS setup are done once per cluster credentials instead of on every `Cluster.ocp_client` access, and
+    rotated credentials get a new client. `refresh` rebuilds the client even if the credentials did not change.
+
+    Example:
+        cache = OCPClientCache(kubeconfig_dir="/tmp/kubeconfigs")
+        ocp_client = cache.get(cluster=cluster)
+        kubeconfig_path = cache.kubeconfig_path(cluster=cluster)
+    """
+
+    def __init__(self, maxsize=DEFAULT_OCP_CLIENT_CACHE_SIZE, kubeconfig_dir=None):
+        """
+        Args:
+            maxsize (int, optional): Maximum number of cached clusters, the least recently used is dropped first.
+                Defaults to DEFAULT_OCP_CLIENT_CACHE_SIZE.
+            kubeconfig_dir (str, optional): Directory where `kubeconfig_path` writes kubeconfig files.
+                Defaults to None (no kubeconfig files).
+        """
+        self.maxsize = maxsize
+        self.kubeconfig_dir = kubeconfig_dir
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._cluster_locks = collections.defaultdict(threading.Lock)
+
+    def get(self, cluster):
+        """
+        Args:
+            cluster (Cluster): Cluster object.
+
+        Returns:
+            DynamicClient: Cached OpenShift client of the cluster.
+
+        Raises:
+            MissingResourceError: If the cluster has no cluster id.
+        """
+        return self._entry(cluster=cluster)["client"]
+
+    def kubeconfig(self, cluster):
+        """
+        Returns:
+            dict: Cached kubeconfig of the cluster.
+        """
+        return self._entry(cluster=cluster)["kubeconfig"]
+
+    def kubeconfig_path(self, cluster):
+        """
+        Writes the cluster kubeconfig to `kubeconfig_dir`, once per credentials fingerprint.
+
+        Returns:
+            str: Path of the kubeconfig file, readable by the current user only.
+
+        Raises:
+            ValueError: If the cache has no `kubeconfig_dir`.
+        """
+        if not self.kubeconfig_dir:
+            raise ValueError("kubeconfig_dir is not set")
+
+        entry = self._entry(cluster=cluster)
+        path = os.path.join(self.kubeconfig_dir, f"{cluster.cluster_id}-{entry['fingerprint'][:12]}.kubeconfig")
+        if not os.path.exists(path):
+            os.makedirs(self.kubeconfig_dir, mode=0o700, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as fd:
+                yaml.safe_dump(entry["kubeconfig"], fd)
+            os.replace(tmp_path, path)
+        return path
+
+    def refresh(self, cluster):
+        """
+        Rebuilds the cluster OpenShift client, even if its credentials did not change.
+
+        Returns:
+            DynamicClient: OpenShift client of the cluster.
+        """
+        self.invalidate(cluster_id=self._cluster_id(cluster=cluster))
+        return self.get(cluster=cluster)
+
+    def invalidate(self, cluster_id=None):
+        """
+        Drops a cluster entry, or all entries if `cluster_id` is not set.
+        """
+        with self._lock:
+            if cluster_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(cluster_id, None)
+
+    @staticmethod
+    def _cluster_id(cluster):
+        if cluster.cluster_id is None:
+            raise MissingResourceError(name=cluster.name, kind="Cluster")
+        return cluster.cluster_id
+
+    def _cached_entry(self, cluster_id, fingerprint):
+        # Called with `self._lock` held
+        entry = self._entries.get(cluster_id)
+        if entry and entry["fingerprint"] == fingerprint:
+            self._entries.move_to_end(cluster_id)
+            return entry
+        return None
+
+    def _entry(self, cluster):
+        cluster_id = self._cluster_id(cluster=cluster)
+        # The credentials are fetched on every lookup, an entry is only served for the credentials it was built from
+        kubeconfig = cluster.kubeconfig
+        fingerprint = hashlib.sha256(yaml.safe_dump(kubeconfig, sort_keys=True).encode()).hexdigest()
+        with self._lock:
+            if entry := self._cached_entry(cluster_id=cluster_id, fingerprint=fingerprint):
+                return entry
+            cluster_lock = self._cluster_locks[cluster_id]
+
+        # One build per cluster at a time, concurrent callers wait and reuse it
+        with cluster_lock:
+            with self._lock:
+                if entry := self._cached_entry(cluster_id=cluster_id, fingerprint=fingerprint):
+                    return entry
+
+            # Loads the Kubernetes client stack, only when a cluster client is first needed
+            from ocp_utilities.infra import get_client
+
+            LOGGER.info(f"Create OpenShift client for cluster {cluster.name}.")
+            entry = {
+                "kubeconfig": kubeconfig,
+                "fingerprint": fingerprint,
+                "client": get_client(config_dict=kubeconfig),
+            }
+
+            with self._lock:
+                self._entries[cluster_id] = entry
+                self._entries.move_to_end(cluster_id)
+                while len(self._entries) > self.maxsize:
+                    evicted_cluster_id, _ = self._entries.popitem(last=False)
+                    self._cluster_locks.pop(evicted_cluster_id, None)
+            return entry
+
+
+OCP_CLIENT_CACHE = OCPClientCache()
@@ -0,0 +1,143 @@
+import contextvars
+import functools
+import json
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_IN_FLIGHT = 2
+
+
+def iter_pages(list_func, page_size=DEFAULT_PAGE_SIZE, max_in_flight=DEFAULT_MAX_IN_FLIGHT, raw=False, **kwargs):
+    """
+    Walks every page of an OCM list endpoint, prefetching the next pages in the background.
+
+    While the caller consumes one page, up to `max_in_flight` following pages are already being fetched
+    by worker threads, so at most `max_in_flight + 1` pages are held in memory at any time.
+
+    Args:
+        list_func (callable): OCM list API function, e.g. `client.api_clusters_mgmt_v1_clusters_get`.
+        page_size (int, optional): Number of items to request per page. Defaults to DEFAULT_PAGE_SIZE.
+        max_in_flight (int, optional): Maximum number of pages fetched ahead of the consumer.
+            Set to 0 to fetch pages serially. Defaults to DEFAULT_MAX_IN_FLIGHT.
+        raw (bool, optional): Decode pages into plain dicts instead of OCM model objects, see `raw_list_func`.
+            Defaults to False.
+        **kwargs: Extra arguments passed to `list_func` on every call (search, order, etc.).
+
+    Yields:
+        object: Each page response as returned by `list_func`, a dict if `raw`.
+    """
+    if page_size < 1:
+        raise ValueError(f"page_size must be a positive integer, got {page_size}")
+
+    if raw:
+        list_func = raw_list_func(list_func=list_func)
+
+    if max_in_flight < 1:
+        yield from _iter_pages_serially(list_func=list_func, page_size=page_size, **kwargs)
+        return
+
+    last_page = None
+    next_page = 1
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="ocm-pages")
+
+    def _submit():
+        nonlocal next_page
+        while len(pending) < max_in_flight and (last_page is None or next_page <= last_page):
+            pending.append((
+                next_page,
+                executor.submit(contextvars.copy_context().run, list_func, page=next_page, size=page_size, **kwargs),
+            ))
+            next_page += 1
+
+    try:
+        # The first page tells how many pages there are, prefetch starts once it is known.
+        pending.append((
+            next_page,
+            executor.submit(contextvars.copy_context().run, list_func, page=next_page, size=page_size, **kwargs),
+        ))
+        next_page += 1
+        while pending:
+            page, future = pending.popleft()
+            response = future.result()
+            if last_page is None and (total := response.get("total")) is not None:
+                last_page = max(math.ceil(total / page_size), 1)
+
+            is_last_page = _is_last_page(response=response, page=page, page_size=page_size)
+            if not is_last_page:
+                _submit()
+
+            yield response
+
+            if is_last_page:
+                return
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_items(list_func, page_size=DEFAULT_PAGE_SIZE, max_in_flight=DEFAULT_MAX_IN_FLIGHT, raw=False, **kwargs):
+    """
+    Streams the items of every page of an OCM list endpoint.
+
+    Args:
+        list_func (callable): OCM list API function.
+        page_size (int, optional): Number of items to request per page. Defaults to DEFAULT_PAGE_SIZE.
+        max_in_flight (int, optional): Maximum number of pages fetched ahead of the consumer.
+            Defaults to DEFAULT_MAX_IN_FLIGHT.
+        raw (bool, optional): Yield plain dicts instead of OCM model objects. Defaults to False.
+        **kwargs: Extra arguments passed to `list_func`.
+
+    Yields:
+        object: Each item of each page, a dict if `raw`.
+    """
+    for response in iter_pages(
+        list_func=list_func, page_size=page_size, max_in_flight=max_in_flight, raw=raw, **kwargs
+    ):
+        yield from response.get("items") or []
+
+
+def raw_list_func(list_func):
+    """
+    Wraps an OCM list API function to return the page as decoded JSON.
+
+    The response body is loaded with `json` directly, skipping the OCM model deserialization and its type
+    checks, which dominate CPU time and memory on large lists (e.g. thousands of versions or clusters).
+    Items are plain dicts, with the JSON field names of the OCM API.
+
+    Args:
+        list_func (callable): OCM list API function, e.g. `client.api_clusters_mgmt_v1_versions_get`.
+
+    Returns:
+        callable: Function taking the same arguments as `list_func` and returning a dict.
+    """
+
+    @functools.wraps(list_func)
+    def _raw_list_func(**kwargs):
+        response = list_func(_preload_content=False, **kwargs)
+        try:
+            return json.loads(response.data)
+        finally:
+            response.release_conn()
+
+    return _raw_list_func
+
+
+def _iter_pages_serially(list_func, page_size, **kwargs):
+    page = 1
+    while True:
+        response = list_func(page=page, size=page_size, **kwargs)
+        yield response
+        if _is_last_page(response=response, page=page, page_size=page_size):
+            return
+        page += 1
+
+
+def _is_last_page(response, page, page_size):
+    total = response.get("total")
+    if total is not None:
+        return page * page_size >= total
+    return len(response.get("items") or []) < page_size
@@ -0,0 +1,125 @@
+import random
+
+from timeout_sampler import TimeoutSampler
+
+
+class PollingStrategy:
+    """
+    Exponential backoff with jitter for polling loops.
+
+    The sleep starts at `initial_sleep`, is multiplied by `factor` after every sample and is capped at `max_sleep`.
+    When the sampled state changes, the sleep goes back to `initial_sleep`, so a new phase is followed closely at
+    first. `phase_max_sleep` sets a different cap for specific states, e.g. poll slowly while a cluster is
+    "installing" for 30 minutes.
+
+    A strategy only holds configuration and can be shared; the per-loop state lives in `backoff()`.
+
+    Example:
+        strategy = PollingStrategy(initial_sleep=1, max_sleep=10, phase_max_sleep={"installing": 60})
+        for sample in BackoffTimeoutSampler(
+            wait_timeout=600, func=get_cluster, polling_strategy=strategy, state_func=lambda _cluster: _cluster.state
+        ):
+            ...
+    """
+
+    def __init__(self, initial_sleep=1, max_sleep=10, factor=1.5, jitter=0.1, phase_max_sleep=None):
+        """
+        Args:
+            initial_sleep (int or float, optional): First sleep, and sleep after a state change. Defaults to 1.
+            max_sleep (int or float, optional): Maximum sleep. Defaults to 10.
+            factor (int or float, optional): Sleep multiplier applied after every sample. Defaults to 1.5.
+            jitter (float, optional): Random +/- fraction applied to every sleep, so many pollers started
+                together do not hit the API at the same moment. Defaults to 0.1.
+            phase_max_sleep (dict, optional): Maximum sleep per sampled state, overrides `max_sleep`.
+                Defaults to None.
+        """
+        self.initial_sleep = initial_sleep
+        self.max_sleep = max_sleep
+        self.factor = factor
+        self.jitter = jitter
+        self.phase_max_sleep = phase_max_sleep or {}
+
+    def backoff(self):
+        """
+        Returns:
+            Backoff: New backoff state for one polling loop.
+        """
+        return Backoff(strategy=self)
+
+    def max_sleep_for(self, state):
+        return self.phase_max_sleep.get(state, self.max_sleep)
+
+
+class Backoff:
+    """
+    Backoff state of one polling loop, see `PollingStrategy`.
+    """
+
+    _UNSET = object()
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self._sleep = strategy.initial_sleep
+        self._state = self._UNSET
+
+    def next_sleep(self, state=None):
+        """
+        Args:
+            state (object, optional): Sampled state, a change resets the sleep to `initial_sleep`. Defaults to None.
+
+        Returns:
+            float: Seconds to sleep before the next sample.
+        """
+        max_sleep = self.strategy.max_sleep_for(state=state)
+        if state != self._state:
+            self._state = state
+            self._sleep = min(self.strategy.initial_sleep, max_sleep)
+        else:
+            self._sleep = min(self._sleep * self.strategy.factor, max_sleep)
+
+        jitter = self.strategy.jitter
+        return self._sleep * random.uniform(1 - jitter, 1 + jitter)
+
+
+DEFAULT_POLLING = PollingStrategy(initial_sleep=1, max_sleep=10)
+CLUSTER_EXISTS_POLLING = PollingStrategy(initial_sleep=1, max_sleep=5)
+CLUSTER_STATE_POLLING = PollingStrategy(
+    initial_sleep=1,
+    max_sleep=10,
+    phase_max_sleep={"installing": 60, "uninstalling": 60},
+)
+CLUSTER_VERSION_POLLING = PollingStrategy(initial_sleep=10, max_sleep=30)
+ADDON_STATE_POLLING = PollingStrategy(
+    initial_sleep=1,
+    max_sleep=10,
+    phase_max_sleep={"installing": 30, "deleting": 30},
+)
+
+
+class BackoffTimeoutSampler(TimeoutSampler):
+    """
+    `TimeoutSampler` sleeping according to a `PollingStrategy` instead of a fixed `sleep`.
+
+    Accepts all `TimeoutSampler` arguments except `sleep`.
+    """
+
+    def __init__(self, wait_timeout, func, polling_strategy=None, state_func=None, **kwargs):
+        """
+        Args:
+            wait_timeout (int): Timeout in seconds.
+            func (callable): Function to sample.
+            polling_strategy (PollingStrategy, optional): Backoff configuration. Defaults to DEFAULT_POLLING.
+            state_func (callable, optional): Called with each sample, returns the state used for phase-aware
+                backoff. Defaults to None (plain exponential backoff).
+            **kwargs: `TimeoutSampler` arguments.
+        """
+        self.polling_strategy = polling_strategy or DEFAULT_POLLING
+        self.state_func = state_func
+        super().__init__(wait_timeout=wait_timeout, sleep=self.polling_strategy.initial_sleep, func=func, **kwargs)
+
+    def __iter__(self):
+        backoff = self.polling_strategy.backoff()
+        for sample in super().__iter__():
+            # `TimeoutSampler` reads `self.sleep` after the sample is consumed, before sleeping
+            self.sleep = backoff.next_sleep(state=self.state_func(sample) if self.state_func else None)
+            yield sample
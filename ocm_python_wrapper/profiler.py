@@ -0,0 +1,305 @@
+import collections
+import contextlib
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from urllib.parse import urlencode, urlparse
+
+_ACTIVE_PROFILES = []
+_ACTIVE_PROFILES_LOCK = threading.Lock()
+# Names of the profiled operations running in the current thread or task, outermost first
+_OPERATION_PATH = contextvars.ContextVar("ocm_operation_path", default=())
+
+
+class ProfiledRequest:
+    """
+    One OCM API request recorded by `ocm_profile`.
+    """
+
+    __slots__ = ("duration", "endpoint", "method", "operation_path", "status", "url")
+
+    def __init__(self, method, endpoint, url, status, duration, operation_path):
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.status = status
+        self.duration = duration
+        self.operation_path = operation_path
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.method} {self.url} {self.status} {self.duration:.3f}s)"
+
+
+class OCMProfile:
+    """
+    OCM API requests and profiled operations recorded inside an `ocm_profile` block.
+
+    Requests are attributed to the innermost profiled operation (see `profiled`) running when they were sent,
+    including from the worker threads of bulk operations and list prefetching.
+    """
+
+    def __init__(self, name, client=None):
+        """
+        Args:
+            name (str): Profile name, root of the call tree.
+            client (OCMPythonClient or DefaultApi, optional): Only record requests of this client.
+                Defaults to None (all clients).
+        """
+        self.name = name
+        self.api_client = getattr(client, "api_client", client)
+        self.requests = []
+        self.operations = []
+        self.wall_time = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def request_count(self):
+        """
+        Returns:
+            int: Number of recorded requests.
+        """
+        return len(self.requests)
+
+    def count(self, method=None, endpoint=None, operation=None):
+        """
+        Args:
+            method (str, optional): Only count requests with this HTTP method. Defaults to None.
+            endpoint (str, optional): Only count requests to this templated endpoint path,
+                e.g. "/api/clusters_mgmt/v1/clusters/{cluster_id}". Defaults to None.
+            operation (str, optional): Only count requests sent inside this profiled operation,
+                e.g. "ClusterAddOn.install_addon". Defaults to None.
+
+        Returns:
+            int: Number of matching requests.
+        """
+        return sum(
+            1
+            for request in self.requests
+            if (method is None or request.method == method)
+            and (endpoint is None or request.endpoint == endpoint)
+            and (operation is None or operation in request.operation_path)
+        )
+
+    def duplicates(self):
+        """
+        Returns:
+            dict: Number of requests per "GET url" sent more than once (same path and query parameters).
+        """
+        counts = collections.Counter(f"GET {request.url}" for request in self.requests if request.method == "GET")
+        return {request: count for request, count in counts.most_common() if count > 1}
+
+    def call_tree(self):
+        """
+        Returns:
+            dict: Root node of the call tree. Each node has "name", "calls", "wall_time", "requests" (including
+                its children), "endpoints" (requests per "METHOD endpoint" sent directly by the operation)
+                and "children" nodes.
+        """
+        root = _new_node(name=self.name)
+        root["calls"] = 1
+        root["wall_time"] = self.wall_time
+        for operation_path, duration in self.operations:
+            node = _tree_node(root=root, operation_path=operation_path)
+            node["calls"] += 1
+            node["wall_time"] += duration
+
+        for request in self.requests:
+            node = root
+            root["requests"] += 1
+            for name in request.operation_path:
+                node = node["children"].setdefault(name, _new_node(name=name))
+                node["requests"] += 1
+            node["endpoints"][f"{request.method} {request.endpoint}"] += 1
+
+        return _freeze_node(node=root)
+
+    def report(self):
+        """
+        Returns:
+            str: Human readable call tree with request counts and wall times, followed by duplicate GETs.
+        """
+        lines = []
+        _report_node(node=self.call_tree(), lines=lines, depth=0)
+        if duplicates := self.duplicates():
+            lines.append("Duplicate GETs:")
+            lines.extend(f"  {count}x {request}" for request, count in duplicates.items())
+        return "\n".join(lines)
+
+    def _record_request(self, request):
+        with self._lock:
+            self.requests.append(request)
+
+    def _record_operation(self, operation_path, duration):
+        with self._lock:
+            self.operations.append((operation_path, duration))
+
+
+@contextlib.contextmanager
+def ocm_profile(name="ocm_profile", client=None):
+    """
+    Records every OCM API request sent inside the block, see `OCMProfile`.
+
+    Args:
+        name (str, optional): Profile name. Defaults to "ocm_profile".
+        client (OCMPythonClient or DefaultApi, optional): Only record requests of this client.
+            Defaults to None (all clients).
+
+    Yields:
+        OCMProfile: The profile, complete once the block exits.
+
+    Example:
+        with ocm_profile(name="install") as profile:
+            cluster_addon.install_addon(parameters=parameters, wait=False)
+        print(profile.report())
+        assert profile.count(method="GET", endpoint="/api/clusters_mgmt/v1/addons/{addon_id}") <= 1
+        assert not profile.duplicates()
+    """
+    profile = OCMProfile(name=name, client=client)
+    with _ACTIVE_PROFILES_LOCK:
+        _ACTIVE_PROFILES.append(profile)
+
+    start = time.monotonic()
+    try:
+        yield profile
+    finally:
+        profile.wall_time = time.monotonic() - start
+        with _ACTIVE_PROFILES_LOCK:
+            _ACTIVE_PROFILES.remove(profile)
+
+
+def profiled(name=None):
+    """
+    Decorator naming a high-level operation in the `ocm_profile` call tree.
+
+    Costs one list check per call when no profile is active. Generator functions are profiled until exhausted.
+
+    Args:
+        name (str, optional): Operation name. Defaults to the function qualified name.
+    """
+
+    def _decorator(func):
+        operation_name = name or func.__qualname__
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def _generator_wrapper(*args, **kwargs):
+                if not _ACTIVE_PROFILES:
+                    yield from func(*args, **kwargs)
+                    return
+
+                operation_path = _OPERATION_PATH.get() + (operation_name,)
+                start = time.monotonic()
+                generator = func(*args, **kwargs)
+                try:
+                    while True:
+                        # Only the generator steps run inside the operation, not the consumer code between them
+                        token = _OPERATION_PATH.set(operation_path)
+                        try:
+                            item = next(generator)
+                        except StopIteration:
+                            return
+                        finally:
+                            _OPERATION_PATH.reset(token)
+                        yield item
+                finally:
+                    generator.close()
+                    _record_operation(operation_path=operation_path, duration=time.monotonic() - start)
+
+            return _generator_wrapper
+
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            if not _ACTIVE_PROFILES:
+                return func(*args, **kwargs)
+
+            operation_path = _OPERATION_PATH.get() + (operation_name,)
+            token = _OPERATION_PATH.set(operation_path)
+            start = time.monotonic()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _OPERATION_PATH.reset(token)
+                _record_operation(operation_path=operation_path, duration=time.monotonic() - start)
+
+        return _wrapper
+
+    return _decorator
+
+
+def is_profiling():
+    """
+    Returns:
+        bool: True if an `ocm_profile` block is active.
+    """
+    return bool(_ACTIVE_PROFILES)
+
+
+def record_request(api_client, method, endpoint, url, query_params, status, duration):
+    """
+    Records an OCM API request in the active profiles, called by `OCMPythonClient.request`.
+
+    Args:
+        api_client (OCMPythonClient): Client that sent the request.
+        method (str): HTTP method.
+        endpoint (str): Templated endpoint path.
+        url (str): Request URL, without query string.
+        query_params (list): Request query parameters.
+        status (int): Response status code, 0 if no response was received.
+        duration (float): Request duration in seconds.
+    """
+    path = urlparse(url).path
+    request = ProfiledRequest(
+        method=method,
+        endpoint=endpoint,
+        url=f"{path}?{urlencode(query_params)}" if query_params else path,
+        status=status,
+        duration=duration,
+        operation_path=_OPERATION_PATH.get(),
+    )
+    for profile in _ACTIVE_PROFILES:
+        if profile.api_client is None or profile.api_client is api_client:
+            profile._record_request(request=request)
+
+
+def _record_operation(operation_path, duration):
+    for profile in _ACTIVE_PROFILES:
+        profile._record_operation(operation_path=operation_path, duration=duration)
+
+
+def _new_node(name):
+    return {
+        "name": name,
+        "calls": 0,
+        "wall_time": 0.0,
+        "requests": 0,
+        "endpoints": collections.Counter(),
+        "children": {},
+    }
+
+
+def _tree_node(root, operation_path):
+    node = root
+    for name in operation_path:
+        node = node["children"].setdefault(name, _new_node(name=name))
+    return node
+
+
+def _freeze_node(node):
+    return {
+        **node,
+        "endpoints": dict(node["endpoints"].most_common()),
+        "children": [_freeze_node(node=child) for child in node["children"].values()],
+    }
+
+
+def _report_node(node, lines, depth):
+    indent = "  " * depth
+    lines.append(
+        f"{indent}{node['name']}: {node['calls']} call(s), {node['requests']} request(s), {node['wall_time']:.3f}s"
+    )
+    lines.extend(f"{indent}    {endpoint}: {count}" for endpoint, count in node["endpoints"].items())
+    for child in node["children"]:
+        _report_node(node=child, lines=lines, depth=depth + 1)
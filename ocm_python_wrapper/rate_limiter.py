@@ -0,0 +1,114 @@
+import email.utils
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter shared by all threads using an OCM client.
+
+    Up to `burst` requests can be sent at once, then requests are released at `rate` per second.
+    When the server answers 429, `pause` holds every caller back for the `Retry-After` delay.
+
+    Example:
+        rate_limiter = RateLimiter(rate=10, burst=20)
+        rate_limiter.acquire()  # blocks until a request may be sent
+        rate_limiter.stats  # {"requests": 1, "throttled": 0, "total_wait": 0.0, ...}
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate (int or float): Sustained requests per second.
+            burst (int, optional): Maximum number of requests sent at once. Defaults to `rate` (at least 1).
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+
+        self.rate = rate
+        self.burst = burst or max(int(rate), 1)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._paused_until = 0
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    waited = now - start
+                    self._requests += 1
+                    self._total_wait += waited
+                    self._max_wait = max(self._max_wait, waited)
+                    return waited
+
+                delay = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """
+        Holds all callers back, e.g. for the `Retry-After` delay of a 429 response.
+
+        Args:
+            seconds (int or float): Seconds to pause for.
+        """
+        with self._lock:
+            self._throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    @property
+    def stats(self):
+        """
+        Returns:
+            dict: Number of requests and of throttled (429) responses, total, average and max queue time in seconds.
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "throttled": self._throttled,
+                "total_wait": self._total_wait,
+                "average_wait": self._total_wait / self._requests if self._requests else 0.0,
+                "max_wait": self._max_wait,
+            }
+
+
+def get_retry_after(headers):
+    """
+    Parses the `Retry-After` header, in seconds or as an HTTP date.
+
+    Args:
+        headers (dict): Response headers.
+
+    Returns:
+        float or None: Seconds to wait, None if the header is missing or invalid.
+    """
+    retry_after = (headers or {}).get("Retry-After")
+    if not retry_after:
+        return None
+
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0)
@@ -0,0 +1,173 @@
+import datetime
+import re
+
+SEARCH_OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "like", "ilike", "not like", "not ilike")
+SEARCH_FIELD_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+
+
+class SearchQuery:
+    """
+    Composable builder for the OCM `search` and `order` list parameters.
+
+    Conditions are joined with "and", values are quoted and escaped, so filtering and sorting happen on the
+    server and only matching items are returned.
+
+    Example:
+        query = (
+            SearchQuery()
+            .where(field="state", value="ready")
+            .where(field="product.id", value="rosa")
+            .where(field="region.id", value="us-east-1")
+            .where(field="expiration_timestamp", value=datetime.now(timezone.utc) + timedelta(days=2), operator="<")
+            .order_by(field="expiration_timestamp")
+            .select("id", "name", "expiration_timestamp")
+        )
+        Clusters(client=client).summaries(query=query)
+    """
+
+    def __init__(self):
+        self.conditions = []
+        self.order_fields = []
+        self.fields = []
+
+    def __str__(self):
+        return self.search or ""
+
+    def where(self, field, value, operator="="):
+        """
+        Adds a `field operator value` condition.
+
+        Args:
+            field (str): Attribute name, e.g. "name" or "region.id".
+            value (str, bool, int, float or datetime): Value to compare with.
+            operator (str, optional): One of SEARCH_OPERATORS. Defaults to "=".
+
+        Returns:
+            SearchQuery: This query.
+
+        Raises:
+            ValueError: If `field` or `operator` is invalid.
+        """
+        if operator not in SEARCH_OPERATORS:
+            raise ValueError(f"operator must be one of {SEARCH_OPERATORS}, got {operator}")
+
+        self.conditions.append(f"{_field(field=field)} {operator} {format_search_value(value=value)}")
+        return self
+
+    def like(self, field, pattern):
+        """
+        Adds a `field like pattern` condition, "%" matches any characters.
+
+        Returns:
+            SearchQuery: This query.
+        """
+        return self.where(field=field, value=pattern, operator="like")
+
+    def in_(self, field, values):
+        """
+        Adds a `field in (values)` condition.
+
+        Args:
+            field (str): Attribute name.
+            values (list): Values to match.
+
+        Returns:
+            SearchQuery: This query.
+
+        Raises:
+            ValueError: If `field` is invalid or `values` is empty.
+        """
+        if not values:
+            raise ValueError(f"values of {field} must not be empty")
+
+        self.conditions.append(
+            f"{_field(field=field)} in ({', '.join(format_search_value(value=value) for value in values)})"
+        )
+        return self
+
+    def any_of(self, *queries):
+        """
+        Adds a condition matching any of the given queries, e.g. `((name = 'a') or (id = 'a'))`.
+
+        Args:
+            *queries (SearchQuery): Queries with at least one condition.
+
+        Returns:
+            SearchQuery: This query.
+
+        Raises:
+            ValueError: If no query has a condition.
+        """
+        searches = [query.search for query in queries if query.search]
+        if not searches:
+            raise ValueError("any_of needs at least one query with a condition")
+
+        # Parenthesized as a whole, "and" binds tighter than "or" when joined with other conditions
+        self.conditions.append(f"({' or '.join(f'({search})' for search in searches)})")
+        return self
+
+    def order_by(self, field, desc=False):
+        """
+        Adds a sort field, the first added field sorts first.
+
+        Returns:
+            SearchQuery: This query.
+        """
+        self.order_fields.append(f"{_field(field=field)} {'desc' if desc else 'asc'}")
+        return self
+
+    def select(self, *fields):
+        """
+        Limits the returned attributes, for endpoints called with field selection (see `Clusters.summaries`).
+
+        Returns:
+            SearchQuery: This query.
+        """
+        self.fields.extend(_field(field=field) for field in fields)
+        return self
+
+    @property
+    def search(self):
+        """
+        Returns:
+            str or None: OCM `search` parameter.
+        """
+        return " and ".join(self.conditions) or None
+
+    @property
+    def order(self):
+        """
+        Returns:
+            str or None: OCM `order` parameter.
+        """
+        return ", ".join(self.order_fields) or None
+
+    def to_kwargs(self):
+        """
+        Returns:
+            dict: `search` and `order` arguments for an OCM list API function, without empty ones.
+        """
+        return {key: value for key, value in (("search", self.search), ("order", self.order)) if value}
+
+
+def format_search_value(value):
+    """
+    Args:
+        value (str, bool, int, float or datetime): Value used in a search condition.
+
+    Returns:
+        str: The value as an OCM search literal, strings are quoted with single quotes doubled.
+    """
+    if isinstance(value, bool):
+        return "'t'" if value else "'f'"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat()
+    return "'{}'".format(str(value).replace("'", "''"))
+
+
+def _field(field):
+    if not SEARCH_FIELD_RE.match(field):
+        raise ValueError(f"Invalid search field {field}")
+    return field
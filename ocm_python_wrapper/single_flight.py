@@ -0,0 +1,63 @@
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    The first caller for a key runs the function, callers arriving with the same key while it is running wait
+    for it and get the same result (or exception). Nothing is cached once the call returns.
+
+    Example:
+        single_flight = SingleFlight()
+        instance = single_flight.do(key=("GET", cluster_path), func=fetch_cluster)
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key, func):
+        """
+        Args:
+            key (hashable): Call identity, e.g. method, path and parameters.
+            func (callable): Function to run if no identical call is in flight.
+
+        Returns:
+            object: The result of `func`, possibly from another caller's call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = Future()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            return call.result()
+
+        try:
+            result = func()
+        except BaseException as ex:
+            call.set_exception(ex)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    @property
+    def stats(self):
+        """
+        Returns:
+            dict: Number of calls run and of calls served by another in-flight call.
+        """
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced}
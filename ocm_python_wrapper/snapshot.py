@@ -0,0 +1,95 @@
+import threading
+import time
+
+DEFAULT_SNAPSHOT_TTL = 5
+
+
+class TTLSnapshot:
+    """
+    TTL cache for a single value, e.g. a cluster instance, an addon or the versions list.
+
+    The value is fetched with `fetch_func` on first use and re-fetched once it is older than `ttl` seconds.
+    Concurrent readers of an expired snapshot share a single fetch.
+
+    Example:
+        snapshot = TTLSnapshot(fetch_func=lambda: client.api_clusters_mgmt_v1_clusters_cluster_id_get(cluster_id))
+        snapshot.get()  # fetches
+        snapshot.get()  # served from cache
+        snapshot.get(max_age=0)  # always fetches
+    """
+
+    def __init__(self, fetch_func, ttl=DEFAULT_SNAPSHOT_TTL):
+        """
+        Args:
+            fetch_func (callable): Function returning a fresh value.
+            ttl (int or float, optional): Seconds a fetched value is served before it is re-fetched.
+                Defaults to DEFAULT_SNAPSHOT_TTL.
+        """
+        self.fetch_func = fetch_func
+        self.ttl = ttl
+        self._value = None
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def age(self):
+        """
+        Returns:
+            float or None: Seconds since the value was fetched, None if nothing is cached.
+        """
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    def get(self, max_age=None):
+        """
+        Returns the cached value, fetching it if it is missing or older than `max_age`.
+
+        Args:
+            max_age (int or float, optional): Maximum accepted age in seconds for this call, overrides `ttl`.
+                Use 0 to force a fetch. Defaults to None (use `ttl`).
+
+        Returns:
+            object: The cached or freshly fetched value.
+        """
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            age = self.age
+            if age is not None and age <= max_age and max_age > 0:
+                return self._value
+            return self._fetch()
+
+    def refresh(self):
+        """
+        Fetches a fresh value regardless of its age.
+
+        Returns:
+            object: The freshly fetched value.
+        """
+        with self._lock:
+            return self._fetch()
+
+    def set(self, value):
+        """
+        Stores a value that is already known, e.g. from a list response.
+
+        Args:
+            value (object): The value to cache.
+        """
+        with self._lock:
+            self._value = value
+            self._fetched_at = time.monotonic()
+
+    def invalidate(self):
+        """
+        Drops the cached value, the next `get` fetches a fresh one.
+        """
+        with self._lock:
+            self._value = None
+            self._fetched_at = None
+
+    def _fetch(self):
+        value = self.fetch_func()
+        self._value = value
+        self._fetched_at = time.monotonic()
+        return value
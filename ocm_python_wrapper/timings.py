@@ -0,0 +1,224 @@
+import contextlib
+import datetime
+import threading
+import time
+
+_SPAN_HOOK = None
+
+
+def set_span_hook(hook):
+    """
+    Sets the default tracing span hook of `ClusterTimings`.
+
+    Args:
+        hook (callable or None): Called with a span name and an attributes dict when a phase starts or the cluster
+            enters a state, returns a context manager exited when the phase or state ends.
+            A state can start and end in different threads (shared `FleetPoller`), so the hook should not
+            change the current span of the thread. None disables tracing.
+
+    Example:
+        tracer = opentelemetry.trace.get_tracer(__name__)
+
+        @contextlib.contextmanager
+        def _span_hook(name, attributes):
+            span = tracer.start_span(name=name, attributes=attributes)
+            try:
+                yield span
+            finally:
+                span.end()
+
+        set_span_hook(hook=_span_hook)
+    """
+    global _SPAN_HOOK
+    _SPAN_HOOK = hook
+
+
+class TimingSpan:
+    """
+    Entry and exit time of one phase or cluster state.
+    """
+
+    __slots__ = ("_end", "_span", "_start", "ended_at", "error", "name", "started_at")
+
+    def __init__(self, name, span=None):
+        self.name = name
+        self.started_at = time.time()
+        self.ended_at = None
+        self.error = None
+        self._start = time.monotonic()
+        self._end = None
+        self._span = span
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name}, {self.duration:.1f}s)"
+
+    @property
+    def duration(self):
+        """
+        Returns:
+            float: Seconds between entry and exit, or until now if not exited yet.
+        """
+        return (self._end or time.monotonic()) - self._start
+
+    def end(self, error=None):
+        if self._end is not None:
+            return
+
+        self._end = time.monotonic()
+        self.ended_at = time.time()
+        self.error = error
+        if self._span is not None:
+            exc_info = (type(error), error, error.__traceback__) if error else (None, None, None)
+            self._span.__exit__(*exc_info)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "started_at": _isoformat(timestamp=self.started_at),
+            "ended_at": _isoformat(timestamp=self.ended_at) if self.ended_at else None,
+            "duration": self.duration,
+            "error": repr(self.error) if self.error else None,
+        }
+
+
+class ClusterTimings:
+    """
+    Phase and OCM state timeline of a cluster provisioning or readiness wait.
+
+    Phases are the steps run by `Cluster.provision_osd` and `Cluster.wait_for_cluster_ready` ("post", "exists",
+    "ready", "osd_cluster_ready_job"); states are the OCM cluster states seen while waiting for "ready"
+    (e.g. "validating", "pending", "installing"), each with entry and exit timestamps.
+
+    Example:
+        cluster.provision_osd(..., wait_for_ready=True)
+        cluster.timings.phase_durations()  # {"post": 1.2, "exists": 0.4, "ready": 2315.0, ...}
+        cluster.timings.state_durations()  # {"pending": 120.5, "installing": 2190.1, "ready": 0.0}
+        json.dumps(cluster.timings.to_dict())
+    """
+
+    def __init__(self, cluster_name, span_hook=None):
+        """
+        Args:
+            cluster_name (str): Cluster name.
+            span_hook (callable, optional): Tracing span hook, see `set_span_hook`.
+                Defaults to None (the hook set with `set_span_hook`).
+        """
+        self.cluster_name = cluster_name
+        self.span_hook = span_hook or _SPAN_HOOK
+        self.phases = []
+        self.states = []
+        self._lock = threading.Lock()
+
+    @property
+    def duration(self):
+        """
+        Returns:
+            float: Seconds from the start of the first phase to the end of the last one.
+        """
+        if not self.phases:
+            return 0.0
+        return self.phases[-1]._start + self.phases[-1].duration - self.phases[0]._start
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Records the phase run inside the block, ending with the error raised in it if any.
+        The current OCM state ends with the phase.
+        """
+        phase = self.start_phase(name=name)
+        try:
+            yield phase
+        except BaseException as ex:
+            self.end_phase(phase=phase, error=ex)
+            raise
+        finally:
+            self.end_phase(phase=phase)
+
+    def start_phase(self, name):
+        """
+        Starts a phase that does not run inside one block, e.g. a wait on a `FleetPoller` future.
+
+        Returns:
+            TimingSpan: The phase, to pass to `end_phase`.
+        """
+        phase = TimingSpan(name=name, span=self._start_span(name=f"ocm.cluster.{name}", kind="phase", value=name))
+        self.phases.append(phase)
+        return phase
+
+    def end_phase(self, phase, error=None):
+        """
+        Ends a phase started with `start_phase`, with the error that stopped it if any.
+        The current OCM state ends with the phase.
+        """
+        self.end_state()
+        phase.end(error=error)
+
+    def observe_state(self, state):
+        """
+        Records the current OCM state, a new state ends the previous one.
+        """
+        with self._lock:
+            if self.states and self.states[-1].ended_at is None:
+                if self.states[-1].name == state:
+                    return
+                self.states[-1].end()
+
+            self.states.append(
+                TimingSpan(
+                    name=state, span=self._start_span(name=f"ocm.cluster.state.{state}", kind="state", value=state)
+                )
+            )
+
+    def end_state(self):
+        """
+        Ends the current OCM state.
+        """
+        with self._lock:
+            if self.states:
+                self.states[-1].end()
+
+    def phase_durations(self):
+        """
+        Returns:
+            dict: Seconds per phase name, summed if a phase ran more than once.
+        """
+        return _durations(spans=self.phases)
+
+    def state_durations(self):
+        """
+        Returns:
+            dict: Seconds per OCM state, summed if a state was entered more than once.
+        """
+        return _durations(spans=self.states)
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: Cluster name, total duration, phases and states with their entry and exit timestamps.
+        """
+        return {
+            "cluster": self.cluster_name,
+            "duration": self.duration,
+            "phases": [phase.to_dict() for phase in self.phases],
+            "states": [state.to_dict() for state in self.states],
+        }
+
+    def _start_span(self, name, kind, value):
+        if self.span_hook is None:
+            return None
+
+        attributes = {"ocm.cluster.name": self.cluster_name, f"ocm.cluster.{kind}": value}
+        span = self.span_hook(name, attributes)  # noqa: FCN001
+        span.__enter__()  # noqa: PLC2801 - exited by `TimingSpan.end`
+        return span
+
+
+def _durations(spans):
+    durations = {}
+    for span in spans:
+        durations[span.name] = durations.get(span.name, 0.0) + span.duration
+    return durations
+
+
+def _isoformat(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).isoformat()
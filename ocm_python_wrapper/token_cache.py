@@ -0,0 +1,109 @@
+import contextlib
+import hashlib
+import json
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+
+class TokenCache:
+    """
+    On-disk access token cache shared between processes.
+
+    Each token is stored in its own file, keyed by the SSO endpoint and a hash of the offline (refresh) token,
+    so the offline token itself is never written to disk. Reads and writes are guarded by an exclusive file lock:
+    when several processes start at once, the first one exchanges the token and the others wait and reuse it.
+
+    Example:
+        cache = TokenCache(cache_dir="/tmp/ocm-tokens")
+        key = cache.key(endpoint=endpoint, refresh_token=token)
+        with cache.lock(key=key):
+            access_token = cache.get(key=key, min_ttl=60) or exchange_token()
+    """
+
+    def __init__(self, cache_dir):
+        """
+        Args:
+            cache_dir (str): Directory holding the cached tokens, created with 0700 permissions if missing.
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+
+    @staticmethod
+    def key(endpoint, refresh_token):
+        """
+        Args:
+            endpoint (str): SSO token endpoint.
+            refresh_token (str): Offline token exchanged for access tokens.
+
+        Returns:
+            str: Cache key for the endpoint and token pair.
+        """
+        refresh_token_hash = hashlib.sha256(refresh_token.encode()).hexdigest()
+        return hashlib.sha256(f"{endpoint}\n{refresh_token_hash}".encode()).hexdigest()
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """
+        Holds an exclusive lock on a cache entry, across processes.
+
+        Args:
+            key (str): Cache key.
+        """
+        with open(self._path(key=key, suffix=".lock"), "a") as fd:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def get(self, key, min_ttl=0):
+        """
+        Args:
+            key (str): Cache key.
+            min_ttl (int, optional): Minimum number of seconds the token must still be valid for. Defaults to 0.
+
+        Returns:
+            str or None: The cached access token, None if missing, unreadable or expiring within `min_ttl`.
+        """
+        try:
+            with open(self._path(key=key)) as fd:
+                entry = json.load(fd)
+        except (OSError, ValueError):
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is None or expires_at - time.time() <= min_ttl:
+            return None
+        return entry.get("access_token")
+
+    def set(self, key, access_token, expires_at):
+        """
+        Stores an access token, readable by the current user only.
+
+        Args:
+            key (str): Cache key.
+            access_token (str): Access token.
+            expires_at (int): Token expiry as a UNIX timestamp.
+        """
+        path = self._path(key=key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as fd:
+                json.dump({"access_token": access_token, "expires_at": expires_at}, fd)
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            LOGGER.warning(f"Failed to write access token cache {path}: {ex}")
+
+    def _path(self, key, suffix=".json"):
+        return os.path.join(self.cache_dir, f"{key}{suffix}")
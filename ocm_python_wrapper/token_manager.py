@@ -0,0 +1,204 @@
+import base64
+import json
+import threading
+import time
+import weakref
+
+import requests
+from simple_logger.logger import get_logger
+
+from ocm_python_wrapper.exceptions import AuthenticationError, EndpointAccessError
+
+LOGGER = get_logger(name=__name__)
+TOKEN_REFRESH_MARGIN = 60
+
+
+class TokenManager:
+    """
+    Keeps an OCM access token valid.
+
+    The token expiry is read from the JWT `exp` claim. The token is refreshed in a background thread
+    `refresh_margin` seconds before it expires, and synchronously if it is requested after that point.
+    The background thread only holds a weak reference to the manager and is cancelled once the manager is
+    garbage collected, so a client dropped without `close()` stops refreshing its token.
+    Only one refresh runs at a time; callers that ask for a refresh while another one is running wait for it
+    and reuse its token.
+
+    With a `token_cache`, tokens are also shared between processes: a still-valid cached token is used instead
+    of calling `fetch_func`, and fetched tokens are written to the cache.
+    """
+
+    def __init__(
+        self,
+        fetch_func,
+        refresh_margin=TOKEN_REFRESH_MARGIN,
+        background_refresh=True,
+        token_cache=None,
+        cache_key=None,
+    ):
+        """
+        Args:
+            fetch_func (callable): Function exchanging the offline token for a new access token (str).
+            refresh_margin (int, optional): Seconds before expiry at which the token is refreshed.
+                Defaults to TOKEN_REFRESH_MARGIN.
+            background_refresh (bool, optional): Refresh the token in a background thread before it expires.
+                Defaults to True.
+            token_cache (TokenCache, optional): On-disk token cache shared between processes. Defaults to None.
+            cache_key (str, optional): Key of the token in `token_cache`. Required with `token_cache`.
+        """
+        if token_cache and not cache_key:
+            raise ValueError("cache_key is required when token_cache is set")
+
+        self.fetch_func = fetch_func
+        self.refresh_margin = refresh_margin
+        self.background_refresh = background_refresh
+        self.token_cache = token_cache
+        self.cache_key = cache_key
+        self.refresh_count = 0
+        self._access_token = None
+        self._expires_at = None
+        self._lock = threading.Lock()
+        self._timer = None
+        self._timer_finalizer = None
+
+    @property
+    def access_token(self):
+        """
+        Returns a valid access token, refreshing it first if it is missing or about to expire.
+
+        Returns:
+            str: The access token.
+        """
+        token = self._access_token
+        if self._is_valid(access_token=token):
+            return token
+
+        with self._lock:
+            if self._is_valid(access_token=self._access_token):
+                return self._access_token
+            return self._fetch()
+
+    @property
+    def expires_in(self):
+        """
+        Returns:
+            float or None: Seconds until the access token expires, None if the expiry is unknown.
+        """
+        if self._expires_at is None:
+            return None
+        return self._expires_at - time.time()
+
+    def refresh(self, stale_token=None):
+        """
+        Fetches a new access token.
+
+        Args:
+            stale_token (str, optional): The token the caller found to be invalid. If the current token is
+                already a different one, it was refreshed by another caller and is returned as is.
+                Defaults to None (always fetch).
+
+        Returns:
+            str: The access token.
+        """
+        with self._lock:
+            if stale_token is not None and self._access_token not in (None, stale_token):
+                return self._access_token
+            return self._fetch(stale_token=stale_token)
+
+    def set_token(self, access_token):
+        """
+        Stores an access token and schedules its background refresh.
+
+        Args:
+            access_token (str): The access token.
+        """
+        self._access_token = access_token
+        self._expires_at = get_token_expiry(access_token=access_token)
+        self._schedule_refresh()
+
+    def close(self):
+        """
+        Cancels the scheduled background refresh.
+        """
+        if self._timer:
+            self._timer.cancel()
+            self._timer_finalizer.detach()
+            self._timer = self._timer_finalizer = None
+
+    def _is_valid(self, access_token):
+        if access_token is None:
+            return False
+        expires_in = self.expires_in
+        return expires_in is None or expires_in > self.refresh_margin
+
+    def _fetch(self, stale_token=None):
+        if self.token_cache:
+            token = self._fetch_from_cache(stale_token=stale_token)
+        else:
+            token = self.fetch_func()
+            self.refresh_count += 1
+
+        self.set_token(access_token=token)
+        return token
+
+    def _fetch_from_cache(self, stale_token=None):
+        with self.token_cache.lock(key=self.cache_key):
+            token = self.token_cache.get(key=self.cache_key, min_ttl=self.refresh_margin)
+            if token and token != stale_token:
+                LOGGER.debug("Using access token from the token cache.")
+                return token
+
+            token = self.fetch_func()
+            self.refresh_count += 1
+            if expires_at := get_token_expiry(access_token=token):
+                self.token_cache.set(key=self.cache_key, access_token=token, expires_at=expires_at)
+            return token
+
+    def _schedule_refresh(self):
+        self.close()
+        if not self.background_refresh or self._expires_at is None:
+            return
+
+        refresh_in = self.expires_in - self.refresh_margin
+        if refresh_in <= 0:
+            return
+
+        # The timer must not keep the manager, and so its client, alive
+        self._timer = threading.Timer(
+            interval=refresh_in,
+            function=_background_refresh,
+            kwargs={"manager_ref": weakref.ref(self), "stale_token": self._access_token},
+        )
+        self._timer.name = "ocm-token-refresh"
+        self._timer.daemon = True
+        self._timer_finalizer = weakref.finalize(self, self._timer.cancel)
+        self._timer.start()
+
+
+def _background_refresh(manager_ref, stale_token):
+    if (manager := manager_ref()) is None:
+        return
+
+    LOGGER.info("Refreshing client token before it expires.")
+    try:
+        manager.refresh(stale_token=stale_token)
+    except (AuthenticationError, EndpointAccessError, requests.RequestException, OSError, ValueError) as ex:
+        LOGGER.warning(f"Background token refresh failed, will refresh on next use: {ex}")
+
+
+def get_token_expiry(access_token):
+    """
+    Reads the `exp` claim of a JWT access token, without verifying the token.
+
+    Args:
+        access_token (str): JWT access token.
+
+    Returns:
+        int or None: Expiry as a UNIX timestamp, None if the token is not a JWT or has no `exp` claim.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (AttributeError, IndexError, ValueError):
+        return None
@@ -1,10 +1,27 @@
+import json
+import os
+import re
+import time
 from collections import defaultdict
 
+from simple_logger.logger import get_logger
+
+from ocm_python_wrapper.paging import iter_items
+from ocm_python_wrapper.profiler import profiled
+from ocm_python_wrapper.search import SearchQuery
+from ocm_python_wrapper.snapshot import TTLSnapshot
+
+LOGGER = get_logger(name=__name__)
+DEFAULT_VERSION_CATALOG_TTL = 10 * 60
+DEFAULT_VERSIONS_PAGE_SIZE = 1000
+SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z.-]+))?")
+
 
 class Versions:
     def __init__(self, client):
         self.client = client
 
+    @profiled()
     def get(self, version_prefix=None, channel_group=None, size=10000):
         """
         Retrieves a dictionary of available versions grouped by channel group.
@@ -17,17 +34,205 @@ class Versions:
         Returns:
             defaultdict: A dictionary with channel group as keys and list of versions as values.
         """
-        version_kwargs = {"order": "id desc", "size": size}
-        version_search_str = "enabled = 't'"
+        query = SearchQuery().where(field="enabled", value=True).order_by(field="id", desc=True)
         if channel_group:
-            version_search_str += f"and channel_group = '{channel_group}'"
+            query.where(field="channel_group", value=channel_group)
         if version_prefix:
-            version_search_str += f"and raw_id like '{version_prefix}%'"
-        version_kwargs["search"] = version_search_str
-        versions_list = self.client.api_clusters_mgmt_v1_versions_get(**version_kwargs)
+            query.like(field="raw_id", pattern=f"{version_prefix}%")
+        versions_list = self.client.api_clusters_mgmt_v1_versions_get(size=size, **query.to_kwargs())
 
         base_available_versions_dict = defaultdict(list)
         for version in versions_list.items:
             base_available_versions_dict.setdefault(version.channel_group, []).append(version.raw_id)
 
         return base_available_versions_dict
+
+
+class VersionCatalog:
+    """
+    In-memory, TTL cached catalog of all OCM versions, indexed by channel group and semantic version.
+
+    All versions are downloaded once per `ttl` (optionally shared between processes through `cache_file`),
+    then lookups are answered from memory. Versions are sorted newest first by semantic version.
+
+    Example:
+        catalog = VersionCatalog(client=client, cache_file="/tmp/ocm-versions.json")
+        catalog.get(version_prefix="4.15", channel_group="stable")  # {"stable": ["4.15.3", "4.15.2", ...]}
+        catalog.latest(minor_version="4.15", channel_group="stable")  # "4.15.3"
+        catalog.versions(channel_group="candidate")  # all enabled candidate versions
+    """
+
+    def __init__(self, client, ttl=DEFAULT_VERSION_CATALOG_TTL, cache_file=None, page_size=DEFAULT_VERSIONS_PAGE_SIZE):
+        """
+        Args:
+            client (DefaultApi): OCM client.
+            ttl (int or float, optional): Seconds the catalog is served before it is downloaded again.
+                Defaults to DEFAULT_VERSION_CATALOG_TTL.
+            cache_file (str, optional): JSON file storing the catalog between processes. Defaults to None.
+            page_size (int, optional): Number of versions to request per page. Defaults to DEFAULT_VERSIONS_PAGE_SIZE.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.cache_file = cache_file
+        self.page_size = page_size
+        self.snapshot = TTLSnapshot(fetch_func=self._load_index, ttl=ttl)
+
+    @profiled()
+    def get(self, version_prefix=None, channel_group=None, enabled=True):
+        """
+        Same versions as `Versions.get`, served from the catalog.
+
+        Versions are sorted newest first by semantic version, while `Versions.get` keeps the OCM order
+        (`id desc`, which sorts "4.9.0" before "4.15.0").
+
+        Args:
+            version_prefix (str, optional): Prefix of the versions. Defaults to None.
+            channel_group (str, optional): Channel group. Defaults to None (all channel groups).
+            enabled (bool, optional): Only enabled versions, None for all. Defaults to True.
+
+        Returns:
+            defaultdict: A dictionary with channel group as keys and list of versions as values.
+        """
+        index = self.snapshot.get()
+        channel_groups = [channel_group] if channel_group else list(index.by_channel_group)
+        versions_dict = defaultdict(list)
+        for _channel_group in channel_groups:
+            if versions := index.versions(channel_group=_channel_group, version_prefix=version_prefix, enabled=enabled):
+                versions_dict[_channel_group] = versions
+        return versions_dict
+
+    def versions(self, channel_group, version_prefix=None, enabled=True):
+        """
+        Args:
+            channel_group (str): Channel group, e.g. "stable" or "candidate".
+            version_prefix (str, optional): Prefix of the versions. Defaults to None.
+            enabled (bool, optional): Only enabled versions, None for all. Defaults to True.
+
+        Returns:
+            list: Versions, newest first.
+        """
+        return self.snapshot.get().versions(channel_group=channel_group, version_prefix=version_prefix, enabled=enabled)
+
+    def latest(self, minor_version, channel_group="stable", enabled=True):
+        """
+        Args:
+            minor_version (str): Minor version, e.g. "4.15" for the latest 4.15 z-stream.
+            channel_group (str, optional): Channel group. Defaults to "stable".
+            enabled (bool, optional): Only enabled versions, None for all. Defaults to True.
+
+        Returns:
+            str or None: The newest version of the z-stream, None if there is none.
+        """
+        versions = self.snapshot.get().z_stream(
+            channel_group=channel_group, minor_version=minor_version, enabled=enabled
+        )
+        return versions[0] if versions else None
+
+    def refresh(self):
+        """
+        Downloads the catalog regardless of its age and updates `cache_file`.
+        """
+        self.snapshot.refresh()
+
+    def _load_index(self):
+        versions = self._read_cache_file() if self.cache_file and self.snapshot.age is None else None
+        if versions is None:
+            versions = self._download()
+            if self.cache_file:
+                self._write_cache_file(versions=versions)
+        return _VersionIndex(versions=versions)
+
+    def _download(self):
+        LOGGER.info("Download OCM versions catalog.")
+        return [
+            (version["raw_id"], version.get("channel_group"), bool(version.get("enabled")))
+            for version in iter_items(
+                list_func=self.client.api_clusters_mgmt_v1_versions_get,
+                page_size=self.page_size,
+                raw=True,
+            )
+        ]
+
+    def _read_cache_file(self):
+        try:
+            with open(self.cache_file) as fd:
+                cache = json.load(fd)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - cache.get("fetched_at", 0) > self.ttl:
+            return None
+        return [tuple(version) for version in cache.get("versions", [])]
+
+    def _write_cache_file(self, versions):
+        tmp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as fd:
+                json.dump({"fetched_at": time.time(), "versions": versions}, fd)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as ex:
+            LOGGER.warning(f"Failed to write versions catalog cache {self.cache_file}: {ex}")
+
+
+class _VersionIndex:
+    def __init__(self, versions):
+        """
+        Args:
+            versions (list): (raw_id, channel_group, enabled) tuples.
+        """
+        self.by_channel_group = defaultdict(list)
+        self.by_minor = defaultdict(list)
+        for raw_id, channel_group, enabled in sorted(
+            versions, key=lambda _version: semver_key(_version[0]), reverse=True
+        ):
+            self.by_channel_group[channel_group].append((raw_id, enabled))
+            if semver := parse_semver(raw_id=raw_id):
+                self.by_minor[(channel_group, f"{semver[0]}.{semver[1]}")].append((raw_id, enabled))
+
+    def versions(self, channel_group, version_prefix=None, enabled=True):
+        return [
+            raw_id
+            for raw_id, _enabled in self.by_channel_group.get(channel_group, [])
+            if (enabled is None or _enabled == enabled) and (not version_prefix or raw_id.startswith(version_prefix))
+        ]
+
+    def z_stream(self, channel_group, minor_version, enabled=True):
+        return [
+            raw_id
+            for raw_id, _enabled in self.by_minor.get((channel_group, minor_version), [])
+            if enabled is None or _enabled == enabled
+        ]
+
+
+def parse_semver(raw_id):
+    """
+    Args:
+        raw_id (str): Version, e.g. "4.15.3" or "4.16.0-rc.1".
+
+    Returns:
+        tuple or None: (major, minor, patch, pre-release), None if `raw_id` is not a semantic version.
+    """
+    if match := SEMVER_RE.match(raw_id):
+        major, minor, patch, pre_release = match.groups()
+        return int(major), int(minor), int(patch), pre_release
+    return None
+
+
+def semver_key(raw_id):
+    """
+    Returns:
+        tuple: Sort key ordering versions by semantic version, releases after their pre-releases.
+            Pre-release identifiers are compared as in semver: numeric ones as numbers ("rc.2" < "rc.10"),
+            before alphanumeric ones.
+    """
+    semver = parse_semver(raw_id=raw_id)
+    if semver is None:
+        return (-1, -1, -1, False, (), raw_id)
+
+    major, minor, patch, pre_release = semver
+    pre_release_key = tuple(
+        (0, int(identifier), "") if identifier.isdigit() else (1, 0, identifier)
+        for identifier in (pre_release or "").split(".")
+        if identifier
+    )
+    return major, minor, patch, pre_release is None, pre_release_key, raw_id
@@ -0,0 +1,30 @@
+import pytest
+
+from benchmarks.fake_ocm import FakeOCM
+from ocm_python_wrapper.ocm_client import OCMPythonClient
+
+FAST_STATE_DURATIONS = (("validating", 0.1), ("pending", 0.1), ("installing", 0.3))
+
+
+@pytest.fixture
+def fake_ocm():
+    with FakeOCM(clusters=250, versions=60, state_durations=FAST_STATE_DURATIONS, uninstall_duration=0.2) as _fake_ocm:
+        yield _fake_ocm
+
+
+@pytest.fixture
+def ocm_client(fake_ocm):
+    _ocm_client = OCMPythonClient(
+        token="offline-token",
+        endpoint=fake_ocm.sso_url,
+        api_host=fake_ocm.url,
+        discard_unknown_keys=True,
+        background_token_refresh=False,
+    )
+    yield _ocm_client
+    _ocm_client.close()
+
+
+@pytest.fixture
+def client(ocm_client):
+    return ocm_client.client
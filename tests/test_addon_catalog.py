@@ -0,0 +1,44 @@
+import gc
+import weakref
+
+from benchmarks.fake_ocm import DEFAULT_ADDON_ID
+from ocm_python_wrapper.addon_catalog import get_addon_catalog
+from ocm_python_wrapper.profiler import ocm_profile
+
+ADDON_ENDPOINT = "/api/clusters_mgmt/v1/addons/{addon_id}"
+
+
+class ApiClient:
+    pass
+
+
+class Client:
+    def __init__(self):
+        self.api_client = ApiClient()
+
+
+def test_catalog_shared_per_api_client():
+    client = Client()
+    other_client = Client()
+    other_client.api_client = client.api_client
+
+    assert get_addon_catalog(client=client) is get_addon_catalog(client=other_client)
+    assert get_addon_catalog(client=client) is not get_addon_catalog(client=Client())
+
+
+def test_catalog_released_with_client():
+    client = Client()
+    catalog = weakref.ref(get_addon_catalog(client=client))
+
+    del client
+    gc.collect()
+    assert catalog() is None
+
+
+def test_catalog_fetches_addon_once(ocm_client):
+    catalog = get_addon_catalog(client=ocm_client.client)
+
+    with ocm_profile(name="addon_catalog", client=ocm_client) as profile:
+        for _ in range(3):
+            assert catalog.get(addon_id=DEFAULT_ADDON_ID)["id"] == DEFAULT_ADDON_ID
+    assert profile.count(method="GET", endpoint=ADDON_ENDPOINT) == 1
@@ -0,0 +1,125 @@
+import asyncio
+import gc
+import weakref
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from ocm_python_wrapper.async_client import AsyncOCMPythonClient, AsyncTimeoutSampler, get_async_client
+from ocm_python_wrapper.cluster import Cluster
+from ocm_python_wrapper.ocm_client import OCMPythonClient
+from ocm_python_wrapper.polling import PollingStrategy
+
+FAST_POLLING = PollingStrategy(initial_sleep=0.02, max_sleep=0.1)
+
+
+class FlakyFunc:
+    def __init__(self, exceptions):
+        self.exceptions = list(exceptions)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.exceptions:
+            raise self.exceptions.pop(0)
+        return self.calls
+
+
+async def _first_sample(sampler):
+    async for sample in sampler:
+        return sample
+
+
+def test_sampler_ignores_exceptions_by_default():
+    func = FlakyFunc(exceptions=[ConnectionError("reset"), ValueError("boom")])
+    sample = asyncio.run(_first_sample(sampler=AsyncTimeoutSampler(wait_timeout=5, func=func, sleep=0.01)))
+    assert sample == 3
+
+
+def test_sampler_ignores_matching_exception_messages():
+    func = FlakyFunc(exceptions=[ConnectionError("connection reset")])
+    sampler = AsyncTimeoutSampler(wait_timeout=5, func=func, sleep=0.01, exceptions_dict={ConnectionError: ["reset"]})
+    assert asyncio.run(_first_sample(sampler=sampler)) == 2
+
+
+def test_sampler_raises_unmatched_exceptions():
+    error = ValueError("boom")
+    sampler = AsyncTimeoutSampler(
+        wait_timeout=5, func=FlakyFunc(exceptions=[error]), sleep=0.01, exceptions_dict={ConnectionError: []}
+    )
+    with pytest.raises(TimeoutExpiredError) as exc_info:
+        asyncio.run(_first_sample(sampler=sampler))
+    assert exc_info.value.last_exp is error
+
+
+def test_sampler_timeout_keeps_last_exception():
+    func = FlakyFunc(exceptions=[ConnectionError("reset")] * 100)
+    with pytest.raises(TimeoutExpiredError) as exc_info:
+        asyncio.run(_first_sample(sampler=AsyncTimeoutSampler(wait_timeout=0.1, func=func, sleep=0.02)))
+    assert isinstance(exc_info.value.last_exp, ConnectionError)
+
+
+def test_async_client_released_with_client():
+    class ApiClient:
+        pass
+
+    class Client:
+        def __init__(self):
+            self.api_client = ApiClient()
+
+    client = Client()
+    async_client = weakref.ref(get_async_client(client=client))
+    assert get_async_client(client=client) is async_client()
+
+    del client
+    gc.collect()
+    assert async_client() is None
+
+
+def test_async_client_shared_and_closed_with_ocm_client(fake_ocm):
+    ocm_client = OCMPythonClient(
+        token="offline-token",
+        endpoint=fake_ocm.sso_url,
+        api_host=fake_ocm.url,
+        discard_unknown_keys=True,
+        background_token_refresh=False,
+    )
+    # `OCMPythonClient.client` builds a new `DefaultApi` on every access
+    async_client = get_async_client(client=ocm_client.client)
+    assert get_async_client(client=ocm_client.client) is async_client
+
+    ocm_client.close()
+    with pytest.raises(RuntimeError):
+        async_client.executor.submit(print)
+
+
+def test_async_api_call(client):
+    async def _get_cluster():
+        async with AsyncOCMPythonClient(client=client, max_workers=4) as async_client:
+            return await async_client.api_clusters_mgmt_v1_clusters_get(search="name = 'fake-cluster-00001'")
+
+    assert asyncio.run(_get_cluster()).items[0].name == "fake-cluster-00001"
+
+
+def test_async_wait_for_cluster_ready(client, fake_ocm):
+    fake_ocm.add_cluster(name="async-ready")
+    cluster = Cluster(client=client, name="async-ready")
+
+    asyncio.run(
+        cluster.async_wait_for_cluster_ready(wait_timeout=30, wait_for_osd_job=False, polling_strategy=FAST_POLLING)
+    )
+    assert str(cluster.instance.state) == "ready"
+    assert list(cluster.timings.phase_durations()) == ["exists", "ready"]
+
+
+def test_async_provision_osd_records_exists_once(client):
+    cluster = Cluster(client=client, name="async-provision")
+
+    asyncio.run(
+        cluster.async_provision_osd(
+            cluster_dict={"name": "async-provision", "hypershift": {"enabled": True}},
+            wait_for_ready=True,
+            wait_timeout=30,
+        )
+    )
+    assert [phase.name for phase in cluster.timings.phases] == ["post", "exists", "ready"]
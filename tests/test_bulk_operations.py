@@ -0,0 +1,76 @@
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from ocm_python_wrapper.cluster import Cluster, Clusters
+from ocm_python_wrapper.exceptions import MissingResourceError
+from ocm_python_wrapper.fleet_poller import FleetPoller
+
+FAILING_CLUSTER = "fake-cluster-00002"
+
+
+@pytest.fixture
+def failing_delete(monkeypatch):
+    delete = Cluster.delete
+
+    def _delete(self, *args, **kwargs):
+        if self.name == FAILING_CLUSTER:
+            raise ConnectionError("connection reset")
+        return delete(self, *args, **kwargs)
+
+    monkeypatch.setattr(Cluster, "delete", _delete)
+
+
+@pytest.mark.usefixtures("failing_delete")
+def test_delete_many_reports_errors_per_cluster(client):
+    with FleetPoller(client=client, interval=0.05) as poller:
+        results = Clusters(client=client).delete_many(
+            names_or_ids=["fake-cluster-00000", "fake-cluster-00001", FAILING_CLUSTER, "missing-cluster"],
+            wait_timeout=30,
+            poller=poller,
+        )
+
+    for name in ("fake-cluster-00000", "fake-cluster-00001"):
+        assert results[name].succeeded
+        assert set(results[name].timings) == {"delete", "deletion"}
+    assert isinstance(results[FAILING_CLUSTER].error, ConnectionError)
+    assert "deletion" not in results[FAILING_CLUSTER].timings
+    assert isinstance(results["missing-cluster"].error, MissingResourceError)
+
+
+def test_delete_many_timeout_records_no_deletion(client):
+    results = Clusters(client=client).delete_many(names_or_ids=["fake-cluster-00000"], wait_timeout=0.05)
+
+    result = results["fake-cluster-00000"]
+    assert isinstance(result.error, TimeoutExpiredError)
+    assert "deletion" not in result.timings
+
+
+def _spec(name):
+    return {"name": name, "cluster_dict": {"name": name, "hypershift": {"enabled": True}}}
+
+
+def test_provision_many(client):
+    specs = [_spec(name=f"bulk-{idx}") for idx in range(4)] + [{"name": "bulk-invalid", "platform": "aws"}]
+    with FleetPoller(client=client, interval=0.05) as poller:
+        results = Clusters(client=client).provision_many(specs=specs, wait_timeout=30, max_workers=2, poller=poller)
+
+    for idx in range(4):
+        result = results[f"bulk-{idx}"]
+        assert result.succeeded, result.error
+        assert list(result.timings) == ["post", "exists", "ready"]
+        assert result.timings == result.cluster.timings.phase_durations()
+        assert "installing" in result.cluster.timings.state_durations()
+    assert isinstance(results["bulk-invalid"].error, ValueError)
+    assert list(results["bulk-invalid"].timings) == ["post"]
+
+
+def test_provision_many_ready_timeout(client):
+    with FleetPoller(client=client, interval=0.05) as poller:
+        results = Clusters(client=client).provision_many(
+            specs=[_spec(name="bulk-slow")], wait_timeout=0.3, poller=poller
+        )
+
+    result = results["bulk-slow"]
+    assert isinstance(result.error, TimeoutExpiredError)
+    assert result.cluster.timings.phases[-1].name == "ready"
+    assert result.cluster.timings.phases[-1].error is result.error
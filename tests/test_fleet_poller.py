@@ -0,0 +1,27 @@
+import types
+
+from urllib3.exceptions import MaxRetryError
+
+from ocm_python_wrapper.fleet_poller import FleetPoller
+
+CLUSTER_ID = "cluster-1"
+
+
+class FlakyClient:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def api_clusters_mgmt_v1_clusters_get(self, search, size):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise MaxRetryError(pool=None, url="/api/clusters_mgmt/v1/clusters", reason="connection reset")
+        return types.SimpleNamespace(items=[types.SimpleNamespace(id=CLUSTER_ID, state="ready")])
+
+
+def test_poller_survives_non_api_errors():
+    client = FlakyClient(failures=1)
+    with FleetPoller(client=client, interval=0.01) as poller:
+        future = poller.wait_for_state(cluster_id=CLUSTER_ID, states=["ready"])
+        assert future.result(timeout=5).state == "ready"
+    assert client.calls >= 2
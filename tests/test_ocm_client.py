@@ -0,0 +1,75 @@
+import threading
+from urllib.parse import urlparse
+
+import pytest
+
+from benchmarks.fake_ocm import FakeOCM
+from ocm_python_wrapper.ocm_client import OCMPythonClient
+
+CLUSTER_ROUTE = "GET /api/clusters_mgmt/v1/clusters/{cluster_id}"
+THREADS = 4
+
+
+@pytest.fixture
+def slow_fake_ocm():
+    with FakeOCM(clusters=1, versions=1, latency=0.2) as _fake_ocm:
+        yield _fake_ocm
+
+
+def _concurrent_cluster_gets(fake_ocm, **client_kwargs):
+    ocm_client = OCMPythonClient(
+        token="offline-token",
+        endpoint=fake_ocm.sso_url,
+        api_host=fake_ocm.url,
+        discard_unknown_keys=True,
+        background_token_refresh=False,
+        **client_kwargs,
+    )
+    cluster_id = next(iter(fake_ocm.clusters))
+    barrier = threading.Barrier(parties=THREADS)
+    results = [None] * THREADS
+
+    def _get(idx):
+        barrier.wait()
+        results[idx] = ocm_client.client.api_clusters_mgmt_v1_clusters_cluster_id_get(cluster_id=cluster_id)
+
+    fake_ocm.reset_counts()
+    try:
+        threads = [threading.Thread(target=_get, args=(idx,)) for idx in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        ocm_client.close()
+    return results
+
+
+def test_concurrent_gets_not_shared_by_default(slow_fake_ocm):
+    results = _concurrent_cluster_gets(fake_ocm=slow_fake_ocm)
+
+    assert len({id(result) for result in results}) == THREADS
+    results[0].name = "modified"
+    assert all(result.name != "modified" for result in results[1:])
+    assert slow_fake_ocm.request_counts[CLUSTER_ROUTE] == THREADS
+
+
+def test_concurrent_gets_coalesced(slow_fake_ocm):
+    results = _concurrent_cluster_gets(fake_ocm=slow_fake_ocm, coalesce_gets=True)
+
+    assert all(result is results[0] for result in results)
+    assert slow_fake_ocm.request_counts[CLUSTER_ROUTE] == 1
+
+
+def test_token_refreshes_counted(ocm_client, fake_ocm):
+    token_endpoint = f"POST {urlparse(fake_ocm.sso_url).path}"
+    assert ocm_client.metrics.snapshot()[token_endpoint]["token_refreshes"] == 1
+
+    # Refresh ahead of expiry, as the background refresh does
+    ocm_client.token_manager.refresh()
+    assert ocm_client.metrics.snapshot()[token_endpoint]["token_refreshes"] == 2
+
+
+def test_request_endpoint_reset_after_call(ocm_client, fake_ocm):
+    ocm_client.client.api_clusters_mgmt_v1_clusters_cluster_id_get(cluster_id=next(iter(fake_ocm.clusters)))
+    assert getattr(ocm_client._request_context, "endpoint", None) is None
@@ -0,0 +1,61 @@
+import ocp_utilities.infra
+import pytest
+
+from ocm_python_wrapper.exceptions import MissingResourceError
+from ocm_python_wrapper.ocp_client_cache import OCPClientCache
+
+
+class FakeCluster:
+    def __init__(self, cluster_id, token="token-1"):
+        self.name = f"cluster-{cluster_id}"
+        self.cluster_id = cluster_id
+        self.token = token
+
+    @property
+    def kubeconfig(self):
+        return {"users": [{"name": "admin", "user": {"token": self.token}}]}
+
+
+@pytest.fixture
+def built_clients(monkeypatch):
+    built_clients = []
+
+    def _get_client(config_dict):
+        built_clients.append(config_dict)
+        return object()
+
+    monkeypatch.setattr(ocp_utilities.infra, "get_client", _get_client)
+    return built_clients
+
+
+def test_client_reused_for_same_credentials(built_clients):
+    cache = OCPClientCache()
+    cluster = FakeCluster(cluster_id="id-1")
+    assert cache.get(cluster=cluster) is cache.get(cluster=FakeCluster(cluster_id="id-1"))
+    assert len(built_clients) == 1
+
+
+def test_client_rebuilt_for_rotated_credentials(built_clients):
+    cache = OCPClientCache()
+    cluster = FakeCluster(cluster_id="id-1")
+    ocp_client = cache.get(cluster=cluster)
+
+    cluster.token = "token-2"
+    assert cache.get(cluster=cluster) is not ocp_client
+    assert cache.kubeconfig(cluster=cluster)["users"][0]["user"]["token"] == "token-2"
+    assert len(built_clients) == 2
+
+
+def test_refresh_rebuilds_client(built_clients):
+    cache = OCPClientCache()
+    cluster = FakeCluster(cluster_id="id-1")
+    ocp_client = cache.get(cluster=cluster)
+    assert cache.refresh(cluster=cluster) is not ocp_client
+    assert len(built_clients) == 2
+
+
+def test_cluster_without_id_not_cached(built_clients):
+    cache = OCPClientCache()
+    with pytest.raises(MissingResourceError):
+        cache.get(cluster=FakeCluster(cluster_id=None))
+    assert not built_clients
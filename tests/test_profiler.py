@@ -0,0 +1,52 @@
+from ocm_python_wrapper.cluster import Cluster, Clusters
+from ocm_python_wrapper.polling import PollingStrategy
+from ocm_python_wrapper.profiler import ocm_profile
+
+CLUSTERS_ENDPOINT = "/api/clusters_mgmt/v1/clusters"
+CLUSTER_ENDPOINT = "/api/clusters_mgmt/v1/clusters/{cluster_id}"
+FAST_POLLING = PollingStrategy(initial_sleep=0.02, max_sleep=0.1)
+
+
+def test_clusters_get_requests(ocm_client):
+    with ocm_profile(name="clusters_get", client=ocm_client) as profile:
+        clusters = list(Clusters(client=ocm_client.client).get(page_size=100))
+
+    assert len(clusters) == 250
+    # 250 clusters in pages of 100
+    assert profile.count(method="GET", endpoint=CLUSTERS_ENDPOINT, operation="Clusters.get") == 3
+    assert profile.request_count == 3
+    assert not profile.duplicates()
+
+
+def test_wait_for_cluster_ready_requests(ocm_client, fake_ocm):
+    cluster_id = fake_ocm.add_cluster(name="profiled-ready")["id"]
+    cluster = Cluster(client=ocm_client.client, name="profiled-ready", cluster_id=cluster_id)
+
+    with ocm_profile(name="wait_for_cluster_ready", client=ocm_client) as profile:
+        cluster.wait_for_cluster_ready(wait_timeout=30, wait_for_osd_job=False, polling_strategy=FAST_POLLING)
+
+    operation = "Cluster.wait_for_cluster_ready"
+    assert profile.count(endpoint=CLUSTER_ENDPOINT, operation="Cluster.wait_exists") == 1
+    # At least one sample per state: validating, pending, installing and ready
+    assert profile.count(method="GET", endpoint=CLUSTER_ENDPOINT, operation=operation) >= 4
+    assert profile.count(endpoint=CLUSTERS_ENDPOINT) == 0
+    assert profile.request_count == profile.count(operation=operation)
+
+
+def test_provision_osd_requests(ocm_client):
+    cluster = Cluster(client=ocm_client.client, name="profiled-provision")
+
+    with ocm_profile(name="provision_osd", client=ocm_client) as profile:
+        cluster.provision_osd(
+            cluster_dict={"name": "profiled-provision", "hypershift": {"enabled": True}},
+            wait_for_ready=True,
+            wait_timeout=30,
+        )
+
+    operation = "Cluster.provision_osd"
+    assert profile.count(method="POST", endpoint=CLUSTERS_ENDPOINT, operation="Cluster.post") == 1
+    assert profile.count(method="GET", endpoint=CLUSTER_ENDPOINT, operation="Cluster.wait_exists") == 1
+    assert profile.count(method="GET", endpoint=CLUSTER_ENDPOINT, operation="Cluster.wait_for_cluster_ready") >= 1
+    assert profile.count(endpoint=CLUSTERS_ENDPOINT, method="GET") == 0
+    assert profile.request_count == profile.count(operation=operation)
+    assert [phase.name for phase in cluster.timings.phases] == ["post", "exists", "ready"]
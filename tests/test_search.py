@@ -0,0 +1,20 @@
+import pytest
+
+from ocm_python_wrapper.search import SearchQuery
+
+
+def test_any_of():
+    query = (
+        SearchQuery()
+        .where(field="state", value="ready")
+        .any_of(SearchQuery().where(field="name", value="a"), SearchQuery(), SearchQuery().where(field="id", value="a"))
+    )
+    assert query.search == "state = 'ready' and ((name = 'a') or (id = 'a'))"
+
+
+@pytest.mark.parametrize("queries", [(), (SearchQuery(), SearchQuery())], ids=["no-queries", "empty-queries"])
+def test_any_of_without_conditions(queries):
+    query = SearchQuery().where(field="state", value="ready")
+    with pytest.raises(ValueError):
+        query.any_of(*queries)
+    assert query.search == "state = 'ready'"
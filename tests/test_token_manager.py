@@ -0,0 +1,58 @@
+import gc
+import threading
+import time
+import types
+import weakref
+
+import pytest
+
+from ocm_python_wrapper.exceptions import EndpointAccessError
+from ocm_python_wrapper.ocm_client import OCMPythonClient
+from ocm_python_wrapper.token_manager import _background_refresh
+
+REFRESH_THREAD_NAME = "ocm-token-refresh"
+
+
+def _new_client(fake_ocm):
+    return OCMPythonClient(
+        token="offline-token", endpoint=fake_ocm.sso_url, api_host=fake_ocm.url, discard_unknown_keys=True
+    )
+
+
+def _refresh_threads():
+    return [thread for thread in threading.enumerate() if thread.name == REFRESH_THREAD_NAME]
+
+
+def test_dropped_clients_stop_refreshing(fake_ocm):
+    refresh_threads = len(_refresh_threads())
+    clients = [weakref.ref(_new_client(fake_ocm=fake_ocm).client.api_client) for _ in range(5)]
+
+    gc.collect()
+    assert all(client() is None for client in clients)
+
+    deadline = time.monotonic() + 5
+    while len(_refresh_threads()) > refresh_threads and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(_refresh_threads()) == refresh_threads
+
+
+def test_close_stops_refreshing(fake_ocm):
+    ocm_client = _new_client(fake_ocm=fake_ocm)
+    timer = ocm_client.token_manager._timer
+    ocm_client.close()
+    timer.join(timeout=5)
+    assert not timer.is_alive()
+
+
+def test_unexpected_sso_error(fake_ocm, monkeypatch):
+    ocm_client = _new_client(fake_ocm=fake_ocm)
+    response = types.SimpleNamespace(status_code=400, json=lambda: {"error_description": "Invalid refresh token"})
+    monkeypatch.setattr(ocm_client.sso_session, "post", lambda *args, **kwargs: response)
+    try:
+        with pytest.raises(EndpointAccessError):
+            ocm_client.token_manager.refresh()
+
+        # Logged, the background refresh thread does not die with a traceback
+        _background_refresh(manager_ref=weakref.ref(ocm_client.token_manager), stale_token=None)
+    finally:
+        ocm_client.close()
@@ -0,0 +1,46 @@
+import random
+
+from ocm_python_wrapper.versions import VersionCatalog, Versions, _VersionIndex, semver_key
+
+ORDERED_VERSIONS = [
+    "4.9.0",
+    "4.15.0-ec.1",
+    "4.15.0-rc.1",
+    "4.15.0-rc.2",
+    "4.15.0-rc.10",
+    "4.15.0-rc.10.1",
+    "4.15.0-rc.alpha",
+    "4.15.0",
+    "4.15.2",
+    "4.15.10",
+]
+
+
+def test_semver_key_order():
+    versions = ORDERED_VERSIONS.copy()
+    random.Random(0).shuffle(versions)
+    assert sorted(versions, key=semver_key) == ORDERED_VERSIONS
+
+
+def test_semver_key_invalid_versions_first():
+    assert sorted(["4.15.0", "nightly"], key=semver_key) == ["nightly", "4.15.0"]
+
+
+def test_version_index_newest_first():
+    index = _VersionIndex(versions=[(raw_id, "candidate", True) for raw_id in ORDERED_VERSIONS])
+    assert index.versions(channel_group="candidate", version_prefix="4.15.0-rc") == [
+        "4.15.0-rc.alpha",
+        "4.15.0-rc.10.1",
+        "4.15.0-rc.10",
+        "4.15.0-rc.2",
+        "4.15.0-rc.1",
+    ]
+    assert index.z_stream(channel_group="candidate", minor_version="4.15")[0] == "4.15.10"
+
+
+def test_catalog_matches_versions_get(client):
+    versions = Versions(client=client).get()
+    catalog_versions = VersionCatalog(client=client).get()
+    assert {
+        channel_group: sorted(raw_ids, key=semver_key, reverse=True) for channel_group, raw_ids in versions.items()
+    } == dict(catalog_versions)